@@ -0,0 +1,33 @@
+# editor/src/config.py
+import os
+
+class EditorConfig:
+    # Raiz do jogo (main.py e o pacote src do jogo)
+    GAME_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    
+    # Preview ao vivo: FPS com a janela ativa, com o editor em segundo plano
+    # e fonte de áudio usada pelo jogo no preview
+    PREVIEW_FPS = 60
+    PREVIEW_BACKGROUND_FPS = 15
+    PREVIEW_AUDIO_SOURCE = "synthetic"
+    PREVIEW_SLOTS = 3
+    
+    # Intervalo do envio das alterações de tuning ao jogo (um lote por frame)
+    CONFIG_PUSH_INTERVAL_MS = 16
+    # Jogo fora do ar: espera entre tentativas de conexão (o connect bloqueia a UI)
+    CONFIG_RECONNECT_INTERVAL_MS = 1000
+    
+    # Monitor de áudio: repaint por segundo e blocos guardados no histórico
+    AUDIO_MONITOR_FPS = 30
+    AUDIO_MONITOR_HISTORY = 430  # ~20 s com blocos de 2048 a 44,1 kHz
+    
+    # Área de simulação do designer de partículas
+    PARTICLE_PREVIEW_SIZE = (480, 360)
+    
+    # Designer de padrões: frames desenhados do caminho (padrões que não saem da tela)
+    PATTERN_PREVIEW_FRAMES = 1200
+    
+    # Exportação do projeto: bundle gerado (relativo à raiz do jogo) e
+    # arquivos extras incluídos além dos do Config do jogo
+    BUNDLE_OUTPUT = os.path.join("dist", "game.bundle")
+    BUNDLE_INCLUDE = [os.path.join("assets", "sfx", "*.wav")]
\ No newline at end of file
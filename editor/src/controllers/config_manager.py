@@ -0,0 +1,216 @@
+# editor/src/controllers/config_manager.py
+import copy
+import json
+import os
+import socket
+import time
+from src.config import EditorConfig
+from src.controllers.preview_controller import load_game_module
+
+class Edit:
+    """Uma alteração no histórico: caminho, valor anterior e novo"""
+    
+    def __init__(self, path, old, new, continuous=False):
+        self.path = path
+        self.old = old
+        self.new = new
+        # Ainda sendo arrastada (slider): novos valores do mesmo caminho se fundem aqui
+        self.open = continuous
+
+class ConfigManager:
+    """Tuning do jogo editado como diffs incrementais, com desfazer/refazer.
+    
+    Cada set() vira uma entrada no histórico e um valor em `outgoing`
+    (caminho -> último valor). flush(), chamado uma vez por frame do
+    editor, manda tudo o que mudou numa única mensagem para o jogo em
+    execução (TuningServer em src/systems/tuning.py); um slider arrastado
+    gera no máximo uma alteração por frame e uma entrada de desfazer.
+    """
+    
+    def __init__(self):
+        game_config = load_game_module(os.path.join("src", "config.py"), "game_config").Config
+        self.path = os.path.join(EditorConfig.GAME_ROOT, game_config.TUNING_FILE)
+        self.port = game_config.TUNING_PORT
+        self.data = {}
+        self.saved = {}
+        self.undo_stack = []
+        self.redo_stack = []
+        self.outgoing = {}
+        # Tudo o que mudou na sessão: reenviado se o jogo (re)conectar depois
+        self.session = {}
+        
+        self.sock = None
+        self.incoming = b""
+        # Próxima tentativa de conexão permitida (time.monotonic)
+        self.retry_at = 0.0
+        self.seq = 0
+        self.sent = 0
+        self.last_error = None
+        self.listeners = []
+    
+    # Dados
+    
+    def load(self):
+        try:
+            with open(self.path, 'r') as f:
+                self.data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Error loading tuning: {e}")
+            self.data = {}
+        self.saved = copy.deepcopy(self.data)
+        self.undo_stack.clear()
+        self.redo_stack.clear()
+        self.outgoing.clear()
+        self.session.clear()
+        self._notify(None)
+    
+    def save(self):
+        try:
+            with open(self.path, 'w') as f:
+                json.dump(self.data, f, indent=4)
+        except OSError as e:
+            print(f"Error saving tuning: {e}")
+            return False
+        self.saved = copy.deepcopy(self.data)
+        return True
+    
+    @property
+    def dirty(self):
+        return self.data != self.saved
+    
+    def get(self, path):
+        node = self.data
+        for key in path.split('.'):
+            node = node[key]
+        return node
+    
+    def _write(self, path, value):
+        keys = path.split('.')
+        node = self.data
+        for key in keys[:-1]:
+            node = node.setdefault(key, {})
+        node[keys[-1]] = value
+        self.outgoing[path] = value
+        self.session[path] = value
+        self._notify(path)
+    
+    def _notify(self, path):
+        for listener in self.listeners:
+            listener(path)
+    
+    # Histórico
+    
+    def set(self, path, value, continuous=False):
+        """Altera um valor; continuous=True enquanto um slider é arrastado"""
+        try:
+            old = self.get(path)
+        except (KeyError, TypeError):
+            old = None
+        if old == value:
+            return
+        last = self.undo_stack[-1] if self.undo_stack else None
+        if last is not None and last.open and last.path == path:
+            last.new = value
+        else:
+            if last is not None:
+                last.open = False
+            self.undo_stack.append(Edit(path, old, value, continuous))
+        self.redo_stack.clear()
+        self._write(path, value)
+    
+    def finish(self):
+        """Fim do arraste: o próximo set() do mesmo caminho vira outra entrada"""
+        if self.undo_stack:
+            self.undo_stack[-1].open = False
+    
+    def undo(self):
+        if not self.undo_stack:
+            return False
+        edit = self.undo_stack.pop()
+        edit.open = False
+        self.redo_stack.append(edit)
+        self._write(edit.path, edit.old)
+        return True
+    
+    def redo(self):
+        if not self.redo_stack:
+            return False
+        edit = self.redo_stack.pop()
+        self.undo_stack.append(edit)
+        self._write(edit.path, edit.new)
+        return True
+    
+    # Conexão com o jogo
+    
+    def _connect(self):
+        # Sem jogo rodando cada tentativa trava a UI até o timeout: no máximo
+        # uma por CONFIG_RECONNECT_INTERVAL_MS, as alterações esperam em `outgoing`
+        now = time.monotonic()
+        if now < self.retry_at:
+            return False
+        try:
+            self.sock = socket.create_connection(("127.0.0.1", self.port), timeout=0.05)
+        except OSError:
+            self.sock = None
+            self.retry_at = now + EditorConfig.CONFIG_RECONNECT_INTERVAL_MS / 1000
+            return False
+        self.sock.setblocking(False)
+        self.incoming = b""
+        # Jogo novo (ou reiniciado): recebe tudo o que já mudou nesta sessão
+        self.outgoing = {**self.session, **self.outgoing}
+        return True
+    
+    def _disconnect(self):
+        if self.sock is not None:
+            self.sock.close()
+            self.sock = None
+    
+    @property
+    def connected(self):
+        return self.sock is not None
+    
+    def flush(self):
+        """Manda o lote de alterações do frame (chamar num timer do editor)"""
+        if not self.port:
+            return
+        self._read_replies()
+        if not self.outgoing:
+            return
+        if self.sock is None and not self._connect():
+            return
+        self.seq += 1
+        message = json.dumps({"seq": self.seq, "set": self.outgoing}).encode() + b"\n"
+        try:
+            self.sock.sendall(message)
+        except (BlockingIOError, OSError):
+            # Mantém o lote para a próxima tentativa
+            self._disconnect()
+            return
+        self.sent += len(self.outgoing)
+        self.outgoing = {}
+    
+    def _read_replies(self):
+        if self.sock is None:
+            return
+        try:
+            data = self.sock.recv(65536)
+        except BlockingIOError:
+            return
+        except OSError:
+            data = b""
+        if not data:
+            self._disconnect()
+            return
+        lines = (self.incoming + data).split(b"\n")
+        self.incoming = lines.pop()
+        for line in lines:
+            try:
+                reply = json.loads(line)
+            except ValueError:
+                continue
+            if "error" in reply:
+                self.last_error = reply["error"]
+                print(f"Error applying tuning in game: {reply['error']}")
+    
+    def close(self):
+        self._disconnect()
\ No newline at end of file
@@ -0,0 +1,117 @@
+# editor/src/controllers/preview_controller.py
+import importlib.util
+import os
+import subprocess
+import sys
+from src.config import EditorConfig
+
+def load_game_module(relative_path, name):
+    """Carrega um módulo do jogo pelo caminho, registrado como `name`.
+    
+    O pacote `src` do jogo e o do editor têm o mesmo nome e não convivem em
+    sys.modules, então o editor não importa o jogo normalmente. O módulo
+    pedido é executado com o `src` do jogo no lugar do do editor: os
+    `from src...` dele (e dos módulos que ele importar) resolvem no jogo.
+    Depois o `src` do editor volta e os módulos do jogo importados no meio
+    do caminho ficam só referenciados por quem os importou. Módulos
+    carregados assim só podem importar do jogo o que funciona fora dele
+    (Config, utilitários, tabelas de dados), nunca cenas ou sistemas.
+    """
+    module = sys.modules.get(name)
+    if module is None:
+        path = os.path.join(EditorConfig.GAME_ROOT, relative_path)
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        editor_modules = _take_src_modules()
+        sys.path.insert(0, EditorConfig.GAME_ROOT)
+        try:
+            spec.loader.exec_module(module)
+        finally:
+            sys.path.remove(EditorConfig.GAME_ROOT)
+            _take_src_modules()
+            sys.modules.update(editor_modules)
+        sys.modules[name] = module
+    return module
+
+def _take_src_modules():
+    """Remove e retorna os módulos do pacote `src` hoje em sys.modules"""
+    return {key: sys.modules.pop(key) for key in list(sys.modules)
+            if key == "src" or key.startswith("src.")}
+
+class PreviewController:
+    """Processo do jogo em modo preview e os frames que ele publica.
+    
+    O jogo roda a simulação real num processo separado (main.py --preview)
+    desenhando direto em slots de memória compartilhada criados aqui; o
+    editor só lê o slot visível mais recente.
+    """
+    
+    def __init__(self):
+        self.frames = None
+        self.process = None
+        self.last_frame = 0
+        self.fps = 0
+    
+    @property
+    def running(self):
+        return self.process is not None and self.process.poll() is None
+    
+    def start(self):
+        if self.running:
+            return True
+        game_config = load_game_module(os.path.join("src", "config.py"), "game_config").Config
+        frame_share = load_game_module(os.path.join("src", "utils", "frame_share.py"), "game_frame_share")
+        try:
+            self.frames = frame_share.SharedFrames(
+                size=(game_config.SCREEN_WIDTH, game_config.SCREEN_HEIGHT),
+                slots=EditorConfig.PREVIEW_SLOTS, create=True, fps=self.fps)
+            self.process = subprocess.Popen(
+                [sys.executable, "main.py", "--preview", self.frames.name,
+                 "--audio-source", EditorConfig.PREVIEW_AUDIO_SOURCE],
+                cwd=EditorConfig.GAME_ROOT)
+        except OSError as e:
+            print(f"Error starting game preview: {e}")
+            self.stop()
+            return False
+        self.last_frame = 0
+        return True
+    
+    def set_fps(self, fps):
+        """FPS pedido ao jogo (0 pausa a simulação)"""
+        self.fps = fps
+        if self.frames:
+            self.frames.request_fps(fps)
+    
+    def poll(self):
+        """Slot do frame novo desde a última chamada (memoryview) ou None"""
+        if not self.frames:
+            return None
+        frame, slot = self.frames.latest()
+        if frame == self.last_frame:
+            return None
+        self.last_frame = frame
+        return self.frames.slot(slot)
+    
+    @property
+    def frame_size(self):
+        return self.frames.size
+    
+    @property
+    def pitch(self):
+        return self.frames.pitch
+    
+    def stop(self, timeout=3.0):
+        """Pede ao jogo para encerrar e libera a memória compartilhada
+        (chamar depois de soltar os QImage/memoryview de poll())"""
+        if self.process is not None:
+            if self.frames:
+                self.frames.request_stop()
+            try:
+                self.process.wait(timeout)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+            self.process = None
+        if self.frames:
+            self.frames.close()
+            self.frames = None
\ No newline at end of file
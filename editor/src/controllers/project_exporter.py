@@ -0,0 +1,60 @@
+# editor/src/controllers/project_exporter.py
+import glob
+import os
+import subprocess
+import sys
+import time
+from src.config import EditorConfig
+from src.controllers.preview_controller import load_game_module
+
+class ProjectExporter:
+    """Exporta os dados do projeto do jogo num bundle único (src/utils/bundle.py).
+    
+    Entram os arquivos que o jogo lê pelo Config (tuning, presets de
+    partículas, padrões, atlas) e os de EditorConfig.BUNDLE_INCLUDE; o
+    jogo carrega o bundle de Config.BUNDLE_FILE no lugar dos arquivos soltos.
+    """
+    
+    def __init__(self):
+        self.bundle = load_game_module(os.path.join("src", "utils", "bundle.py"), "game_bundle")
+        self.game_config = load_game_module(os.path.join("src", "config.py"), "game_config").Config
+        self.root = EditorConfig.GAME_ROOT
+        self.output = os.path.join(self.root, EditorConfig.BUNDLE_OUTPUT)
+    
+    def project_files(self):
+        """Caminhos relativos (nomes das entradas) dos arquivos existentes"""
+        config = self.game_config
+        names = [config.TUNING_FILE, config.PARTICLE_PRESETS_FILE, config.PATTERNS_FILE,
+                 config.ATLAS_MANIFEST, config.ATLAS_IMAGE]
+        for pattern in EditorConfig.BUNDLE_INCLUDE:
+            matches = glob.glob(os.path.join(self.root, pattern))
+            names.extend(sorted(os.path.relpath(path, self.root) for path in matches))
+        return [name for name in dict.fromkeys(names)
+                if os.path.isfile(os.path.join(self.root, name))]
+    
+    def bake_atlas(self):
+        """Regera o atlas de sprites (main.py --bake) antes de exportar"""
+        try:
+            result = subprocess.run([sys.executable, "main.py", "--bake"], cwd=self.root,
+                                    capture_output=True, text=True, timeout=120)
+        except (OSError, subprocess.TimeoutExpired) as e:
+            print(f"Error baking sprite atlas: {e}")
+            return False
+        if result.returncode != 0:
+            print(f"Error baking sprite atlas: {result.stderr.strip()}")
+            return False
+        return True
+    
+    def export(self, path=None):
+        """Grava o bundle; retorna (entradas, bytes originais, bytes do arquivo, segundos)"""
+        path = path or self.output
+        start = time.perf_counter()
+        
+        def entries():
+            for name in self.project_files():
+                with open(os.path.join(self.root, name), 'rb') as f:
+                    yield name, f.read()
+        
+        summary = self.bundle.write(path, entries())
+        size = os.path.getsize(path)
+        return summary, sum(raw for _, raw, _ in summary), size, time.perf_counter() - start
\ No newline at end of file
@@ -0,0 +1,195 @@
+# editor/src/previews/particle_preview.py
+import json
+import os
+import pygame
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QComboBox, QPushButton,
+                             QPlainTextEdit, QLabel, QSpinBox, QSplitter)
+from PyQt6.QtCore import Qt, QTimer, QRectF
+from PyQt6.QtGui import QImage, QPainter, QColor, QFont
+from src.config import EditorConfig
+from src.controllers.preview_controller import load_game_module
+
+class ParticleCanvas(QWidget):
+    """Mostra a surface do pygame onde o efeito é simulado (QImage sobre o mesmo buffer)"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setMinimumSize(320, 240)
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
+        self.image = None
+    
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), QColor(0, 0, 0))
+        if self.image is not None:
+            scale = min(self.width() / self.image.width(), self.height() / self.image.height())
+            width = self.image.width() * scale
+            height = self.image.height() * scale
+            painter.drawImage(QRectF((self.width() - width) / 2, (self.height() - height) / 2,
+                                     width, height), self.image)
+        painter.end()
+
+class ParticleDesigner(QWidget):
+    """Designer de presets de partículas com simulação ao vivo.
+    
+    Usa o mesmo módulo de partículas do jogo (carregado pelo caminho), então
+    o efeito e o custo mostrados são os do jogo. O preset selecionado é
+    editado como JSON e recompilado a cada alteração; o rodapé mostra
+    partículas vivas e o custo de update/draw por frame.
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.particles = load_game_module(os.path.join("src", "graphics", "particles.py"),
+                                          "game_particles")
+        self.path = os.path.join(EditorConfig.GAME_ROOT, "config", "particles.json")
+        self.data = self.load_presets()
+        self.particles.install(self.data)
+        self.system = self.particles.ParticleSystem()
+        
+        # Surface do pygame sobre um bytearray que o QImage também usa (sem cópia)
+        self.size = EditorConfig.PARTICLE_PREVIEW_SIZE
+        self.pixels = bytearray(self.size[0] * self.size[1] * 4)
+        self.surface = pygame.image.frombuffer(self.pixels, self.size, 'RGBX')
+        self.frame = 0
+        
+        self.setup_ui()
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.timer.timeout.connect(self.step)
+    
+    def load_presets(self):
+        """Presets do arquivo do jogo completados com os padrões (todos os campos visíveis)"""
+        data = {}
+        try:
+            data = self.particles.registry.read(self.path)
+        except (OSError, ValueError) as e:
+            print(f"Error loading particle presets: {e}")
+        return self.particles.registry.merge(data)
+    
+    def setup_ui(self):
+        layout = QHBoxLayout(self)
+        splitter = QSplitter(Qt.Orientation.Horizontal)
+        layout.addWidget(splitter)
+        
+        # Esquerda: preset e campos
+        editor = QWidget()
+        editor_layout = QVBoxLayout(editor)
+        self.preset_box = QComboBox()
+        self.preset_box.addItems(sorted(self.data))
+        self.preset_box.currentTextChanged.connect(self.select_preset)
+        editor_layout.addWidget(self.preset_box)
+        
+        self.fields = QPlainTextEdit()
+        self.fields.setFont(QFont("monospace"))
+        self.fields.textChanged.connect(self.fields_changed)
+        editor_layout.addWidget(self.fields)
+        self.error_label = QLabel()
+        self.error_label.setStyleSheet("color: #ff7850;")
+        editor_layout.addWidget(self.error_label)
+        
+        # Emissão: a cada N frames (1 = contínuo, como o fogo do motor)
+        emit_layout = QHBoxLayout()
+        emit_layout.addWidget(QLabel("Emit every"))
+        self.interval_box = QSpinBox()
+        self.interval_box.setRange(1, 600)
+        self.interval_box.setValue(30)
+        self.interval_box.setSuffix(" frames")
+        emit_layout.addWidget(self.interval_box)
+        self.emitters_box = QSpinBox()
+        self.emitters_box.setRange(1, 100)
+        self.emitters_box.setPrefix("x")
+        self.emitters_box.setToolTip("Emissores simultâneos (efeito repetido na tela)")
+        emit_layout.addWidget(self.emitters_box)
+        editor_layout.addLayout(emit_layout)
+        
+        buttons = QHBoxLayout()
+        clear_button = QPushButton("Clear")
+        clear_button.clicked.connect(self.clear_particles)
+        buttons.addWidget(clear_button)
+        save_button = QPushButton("Save")
+        save_button.clicked.connect(self.save_presets)
+        buttons.addWidget(save_button)
+        editor_layout.addLayout(buttons)
+        splitter.addWidget(editor)
+        
+        # Direita: simulação e custo
+        preview = QWidget()
+        preview_layout = QVBoxLayout(preview)
+        self.canvas = ParticleCanvas()
+        preview_layout.addWidget(self.canvas, 1)
+        self.stats_label = QLabel()
+        self.stats_label.setFont(QFont("monospace"))
+        preview_layout.addWidget(self.stats_label)
+        splitter.addWidget(preview)
+        splitter.setStretchFactor(1, 1)
+        
+        self.select_preset(self.preset_box.currentText())
+    
+    def select_preset(self, name):
+        self.fields.blockSignals(True)
+        self.fields.setPlainText(json.dumps(self.data[name], indent=4))
+        self.fields.blockSignals(False)
+        self.error_label.clear()
+    
+    def fields_changed(self):
+        """Recompila os presets com o JSON editado (erros não interrompem a simulação)"""
+        name = self.preset_box.currentText()
+        try:
+            preset = json.loads(self.fields.toPlainText())
+            data = {**self.data, name: preset}
+            self.particles.install(data)
+        except (ValueError, KeyError, TypeError) as e:
+            self.error_label.setText(str(e))
+            return
+        self.data = data
+        self.error_label.clear()
+    
+    def clear_particles(self):
+        # update() troca a lista a cada frame; limpa a atual
+        self.system.particles = []
+    
+    def save_presets(self):
+        try:
+            with open(self.path, 'w') as f:
+                json.dump(self.data, f, indent=4)
+        except OSError as e:
+            self.error_label.setText(f"Error saving presets: {e}")
+    
+    def step(self):
+        name = self.preset_box.currentText()
+        width, height = self.size
+        if self.frame % self.interval_box.value() == 0:
+            count = self.emitters_box.value()
+            for i in range(count):
+                x = width * (i + 1) / (count + 1)
+                self.system.emit(name, x, height / 2)
+        self.frame += 1
+        
+        self.system.update()
+        self.surface.fill((0, 0, 0))
+        self.system.draw(self.surface)
+        self.canvas.image = QImage(self.pixels, width, height, width * 4,
+                                   QImage.Format.Format_RGBX8888)
+        self.canvas.update()
+        self.show_stats()
+    
+    def show_stats(self):
+        stats = self.system.get_stats()
+        cost = stats['update_avg_ms'] + stats['draw_avg_ms']
+        budget = 1000 / EditorConfig.PREVIEW_FPS
+        self.stats_label.setText(
+            f"alive {stats['alive']:>5}  peak {stats['peak']:>5}  "
+            f"update {stats['update_avg_ms']:.2f} ms  draw {stats['draw_avg_ms']:.2f} ms  "
+            f"({cost / budget * 100:.0f}% of frame)")
+        # Mesmo limite do overlay do jogo: mais de 1/4 do frame só em partículas
+        warn = cost > budget / 4
+        self.stats_label.setStyleSheet("color: #ff7850;" if warn else "color: #b4ffb4;")
+    
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.timer.start(1000 // EditorConfig.PREVIEW_FPS)
+    
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.timer.stop()
\ No newline at end of file
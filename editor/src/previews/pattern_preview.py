@@ -0,0 +1,248 @@
+# editor/src/previews/pattern_preview.py
+import json
+import os
+import time
+import numpy as np
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QComboBox, QPushButton,
+                             QPlainTextEdit, QLabel, QSpinBox, QDoubleSpinBox, QSplitter)
+from PyQt6.QtCore import Qt, QTimer, QRectF, QPointF
+from PyQt6.QtGui import QPainter, QColor, QFont, QPen, QPolygonF
+from src.config import EditorConfig
+from src.controllers.preview_controller import load_game_module
+
+class Marker:
+    """Inimigo simulado (só o slot no MotionBank)"""
+    slot = None
+
+class PatternCanvas(QWidget):
+    """Área do jogo com o caminho do padrão e os inimigos simulados"""
+    
+    def __init__(self, screen_size, parent=None):
+        super().__init__(parent)
+        self.setMinimumSize(400, 300)
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
+        self.screen_size = screen_size
+        self.paths = []
+        self.positions = (np.zeros(0), np.zeros(0))
+    
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), QColor(10, 10, 20))
+        width, height = self.screen_size
+        scale = min(self.width() / width, self.height() / height)
+        painter.translate((self.width() - width * scale) / 2, (self.height() - height * scale) / 2)
+        painter.scale(scale, scale)
+        painter.setPen(QPen(QColor(60, 60, 80), 0))
+        painter.drawRect(QRectF(0, 0, width, height))
+        
+        # Caminho de cada posição da formação
+        painter.setPen(QPen(QColor(80, 150, 220), 0))
+        for xs, ys in self.paths:
+            painter.drawPolyline(QPolygonF([QPointF(x, y) for x, y in zip(xs, ys)]))
+        
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor(230, 90, 60))
+        for x, y in zip(*(values.tolist() for values in self.positions)):
+            painter.drawRect(QRectF(x, y, 30, 30))
+        painter.end()
+
+class PatternDesigner(QWidget):
+    """Editor de padrões de movimento dos inimigos com simulação ao vivo.
+    
+    Usa o mesmo módulo de padrões do jogo (carregado pelo caminho): o JSON
+    do padrão selecionado é recompilado a cada alteração, o caminho
+    completo é desenhado e ondas são soltas no topo como no jogo, avançadas
+    em lote pelo mesmo MotionBank; o rodapé mostra o custo do passo.
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.patterns = load_game_module(os.path.join("src", "entities", "patterns.py"),
+                                         "game_patterns")
+        game_config = load_game_module(os.path.join("src", "config.py"), "game_config").Config
+        self.path = os.path.join(EditorConfig.GAME_ROOT, game_config.PATTERNS_FILE)
+        self.screen_size = (game_config.SCREEN_WIDTH, game_config.SCREEN_HEIGHT)
+        self.data = self.load_patterns()
+        self.patterns.install(self.data)
+        self.motion = self.patterns.MotionBank()
+        # Bandos perseguem a posição inicial do jogador (centro da base)
+        self.motion.target = (self.screen_size[0] / 2, self.screen_size[1] - 60)
+        self.frame = 0
+        
+        self.setup_ui()
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.timer.timeout.connect(self.step)
+    
+    def load_patterns(self):
+        """Padrões do arquivo do jogo completados com os embutidos"""
+        data = {}
+        try:
+            data = self.patterns.registry.read(self.path)
+        except (OSError, ValueError) as e:
+            print(f"Error loading enemy patterns: {e}")
+        return self.patterns.registry.merge(data)
+    
+    def setup_ui(self):
+        layout = QHBoxLayout(self)
+        splitter = QSplitter(Qt.Orientation.Horizontal)
+        layout.addWidget(splitter)
+        
+        # Esquerda: padrão e campos
+        editor = QWidget()
+        editor_layout = QVBoxLayout(editor)
+        self.pattern_box = QComboBox()
+        self.pattern_box.addItems(sorted(self.data))
+        self.pattern_box.currentTextChanged.connect(self.select_pattern)
+        editor_layout.addWidget(self.pattern_box)
+        
+        self.fields = QPlainTextEdit()
+        self.fields.setFont(QFont("monospace"))
+        self.fields.textChanged.connect(self.fields_changed)
+        editor_layout.addWidget(self.fields)
+        self.error_label = QLabel()
+        self.error_label.setStyleSheet("color: #ff7850;")
+        editor_layout.addWidget(self.error_label)
+        
+        # Simulação: velocidade do estado de áudio e intervalo entre ondas
+        sim_layout = QHBoxLayout()
+        sim_layout.addWidget(QLabel("Speed"))
+        self.speed_box = QDoubleSpinBox()
+        self.speed_box.setRange(0, 20)
+        self.speed_box.setValue(2)
+        self.speed_box.valueChanged.connect(self.update_paths)
+        sim_layout.addWidget(self.speed_box)
+        sim_layout.addWidget(QLabel("Wave every"))
+        self.interval_box = QSpinBox()
+        self.interval_box.setRange(1, 600)
+        self.interval_box.setValue(60)
+        self.interval_box.setSuffix(" frames")
+        sim_layout.addWidget(self.interval_box)
+        editor_layout.addLayout(sim_layout)
+        
+        buttons = QHBoxLayout()
+        new_button = QPushButton("Duplicate")
+        new_button.clicked.connect(self.duplicate_pattern)
+        buttons.addWidget(new_button)
+        clear_button = QPushButton("Clear")
+        clear_button.clicked.connect(self.motion.clear)
+        buttons.addWidget(clear_button)
+        save_button = QPushButton("Save")
+        save_button.clicked.connect(self.save_patterns)
+        buttons.addWidget(save_button)
+        editor_layout.addLayout(buttons)
+        splitter.addWidget(editor)
+        
+        # Direita: simulação e custo
+        preview = QWidget()
+        preview_layout = QVBoxLayout(preview)
+        self.canvas = PatternCanvas(self.screen_size)
+        preview_layout.addWidget(self.canvas, 1)
+        self.stats_label = QLabel()
+        self.stats_label.setFont(QFont("monospace"))
+        preview_layout.addWidget(self.stats_label)
+        splitter.addWidget(preview)
+        splitter.setStretchFactor(1, 1)
+        
+        self.select_pattern(self.pattern_box.currentText())
+    
+    def select_pattern(self, name):
+        if not name:
+            return
+        self.fields.blockSignals(True)
+        self.fields.setPlainText(json.dumps(self.data[name], indent=4))
+        self.fields.blockSignals(False)
+        self.error_label.clear()
+        self.motion.clear()
+        self.update_paths()
+    
+    def fields_changed(self):
+        """Recompila os padrões com o JSON editado (erros não interrompem a simulação)"""
+        name = self.pattern_box.currentText()
+        try:
+            pattern = json.loads(self.fields.toPlainText())
+            data = {**self.data, name: pattern}
+            self.patterns.install(data)
+        except (ValueError, KeyError, TypeError, IndexError) as e:
+            self.error_label.setText(str(e))
+            return
+        self.data = data
+        self.error_label.clear()
+        self.update_paths()
+    
+    def duplicate_pattern(self):
+        name = self.pattern_box.currentText()
+        copy_name = f"{name}_copy"
+        index = 2
+        while copy_name in self.data:
+            copy_name = f"{name}_copy{index}"
+            index += 1
+        self.data[copy_name] = json.loads(json.dumps(self.data[name]))
+        self.patterns.install(self.data)
+        self.pattern_box.addItem(copy_name)
+        self.pattern_box.setCurrentText(copy_name)
+    
+    def save_patterns(self):
+        try:
+            with open(self.path, 'w') as f:
+                json.dump(self.data, f, indent=4)
+        except OSError as e:
+            self.error_label.setText(f"Error saving patterns: {e}")
+    
+    def spawn_origin(self):
+        # Centro do topo, como um spawn do jogo (y = -50)
+        return self.screen_size[0] / 2, -50
+    
+    def update_paths(self):
+        """Caminho completo de cada posição da formação até sair da tela"""
+        pattern = self.patterns.get(self.pattern_box.currentText())
+        if pattern.steers:
+            # Bandos não têm caminho fixo: só a simulação mostra o movimento
+            self.canvas.paths = []
+            self.canvas.update()
+            return
+        speed = self.speed_box.value()
+        x, y = self.spawn_origin()
+        # Limite para padrões que não descem (descent 0 / velocidade 0)
+        ages = np.arange(1, EditorConfig.PATTERN_PREVIEW_FRAMES + 1)
+        dx, dy = pattern.offsets(ages)
+        xs = x + dx + np.zeros(len(ages))
+        ys = y + ages * speed * pattern.descent + dy
+        visible = np.flatnonzero(ys > self.screen_size[1])
+        end = visible[0] + 1 if len(visible) else len(ages)
+        self.canvas.paths = [(xs[:end] + fx, ys[:end] + fy) for fx, fy in pattern.formation]
+        self.canvas.update()
+    
+    def step(self):
+        name = self.pattern_box.currentText()
+        if self.frame % self.interval_box.value() == 0:
+            x, y = self.spawn_origin()
+            for dx, dy in self.patterns.get(name).formation:
+                marker = Marker()
+                marker.slot = self.motion.add(marker, name, x + dx, y + dy)
+        self.frame += 1
+        
+        start = time.perf_counter()
+        xs, ys = self.motion.step(self.speed_box.value())
+        gone = ys > self.screen_size[1]
+        # Remove do fim para o começo: a troca pelo último slot não afeta os restantes
+        for slot in reversed(np.flatnonzero(gone).tolist()):
+            self.motion.remove(slot)
+        elapsed = (time.perf_counter() - start) * 1000
+        self.canvas.positions = (xs[~gone], ys[~gone])
+        self.canvas.update()
+        self.show_stats(elapsed)
+    
+    def show_stats(self, elapsed):
+        stats = self.motion.get_stats()
+        self.stats_label.setText(
+            f"alive {stats['alive']:>5}  peak {stats['peak']:>5}  "
+            f"step {stats['step_avg_ms'] * 1000:.0f} us  (with removal {elapsed * 1000:.0f} us)")
+    
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.timer.start(1000 // EditorConfig.PREVIEW_FPS)
+    
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.timer.stop()
\ No newline at end of file
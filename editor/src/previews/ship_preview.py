@@ -0,0 +1,109 @@
+# editor/src/previews/ship_preview.py
+import time
+from PyQt6.QtWidgets import QWidget
+from PyQt6.QtCore import Qt, QTimer, QRectF
+from PyQt6.QtGui import QImage, QPainter, QColor
+from src.config import EditorConfig
+from src.controllers.preview_controller import PreviewController
+
+class GamePreviewWidget(QWidget):
+    """Jogo rodando de verdade dentro do editor.
+    
+    Cada frame novo vira um QImage que embrulha o slot de memória
+    compartilhada onde o jogo desenhou (sem cópia nem PNG). Escondido, o
+    jogo pausa; com o editor em segundo plano, roda a PREVIEW_BACKGROUND_FPS.
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setMinimumSize(400, 300)
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
+        self.controller = PreviewController()
+        self.image = None
+        self.view = None
+        
+        self.frames_shown = 0
+        self.fps = 0.0
+        self.fps_time = time.perf_counter()
+        
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.timer.timeout.connect(self.next_frame)
+    
+    def target_fps(self):
+        if not self.isVisible() or self.window().isMinimized():
+            return 0
+        if not self.window().isActiveWindow():
+            return EditorConfig.PREVIEW_BACKGROUND_FPS
+        return EditorConfig.PREVIEW_FPS
+    
+    def update_rate(self):
+        """Ajusta o FPS pedido ao jogo e o intervalo do timer à visibilidade"""
+        fps = self.target_fps()
+        if fps == self.controller.fps:
+            return
+        self.controller.set_fps(fps)
+        if fps:
+            # Timer no dobro do FPS: o frame novo é mostrado no máximo meio frame depois
+            self.timer.start(max(1, 500 // fps))
+        else:
+            self.timer.stop()
+    
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self.controller.running and not self.controller.start():
+            return
+        self.update_rate()
+    
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.update_rate()
+    
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == event.Type.ActivationChange:
+            self.update_rate()
+    
+    def next_frame(self):
+        self.update_rate()
+        view = self.controller.poll()
+        if view is None:
+            if not self.controller.running:
+                self.timer.stop()
+            return
+        # O QImage aponta para o slot compartilhado; a view fica viva junto
+        width, height = self.controller.frame_size
+        self.view = view
+        self.image = QImage(view, width, height, self.controller.pitch,
+                            QImage.Format.Format_RGBX8888)
+        self.update()
+        
+        self.frames_shown += 1
+        now = time.perf_counter()
+        if now - self.fps_time >= 1.0:
+            self.fps = self.frames_shown / (now - self.fps_time)
+            self.frames_shown = 0
+            self.fps_time = now
+    
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), QColor(0, 0, 0))
+        if self.image is not None:
+            # Escala mantendo a proporção do jogo, centralizado
+            scale = min(self.width() / self.image.width(), self.height() / self.image.height())
+            width = self.image.width() * scale
+            height = self.image.height() * scale
+            target = QRectF((self.width() - width) / 2, (self.height() - height) / 2, width, height)
+            painter.drawImage(target, self.image)
+            painter.setPen(QColor(180, 255, 180))
+            painter.drawText(10, 20, f"{self.fps:.0f} FPS")
+        painter.end()
+    
+    def shutdown(self):
+        """Encerra o jogo do preview (fechamento do editor)"""
+        self.timer.stop()
+        self.image = None
+        if self.view is not None:
+            self.view.release()
+            self.view = None
+        self.controller.stop()
\ No newline at end of file
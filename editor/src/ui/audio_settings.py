@@ -0,0 +1,202 @@
+# editor/src/ui/audio_settings.py
+import collections
+import os
+import time
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel
+from PyQt6.QtCore import Qt, QTimer, QRectF, QPointF
+from PyQt6.QtGui import QPainter, QColor, QPen, QPolygonF
+from src.config import EditorConfig
+from src.controllers.preview_controller import load_game_module
+
+STATE_COLORS = {
+    'void': QColor(90, 90, 160),
+    'ambient': QColor(80, 180, 120),
+    'intense': QColor(230, 90, 60),
+}
+
+class LevelMonitor(QWidget):
+    """Nível, bandas, espectro e histórico do volume com os limiares do jogo.
+    
+    Só desenha o que já chegou reduzido pelo analisador (um registro por
+    bloco de áudio); o histórico é dizimado para no máximo um ponto por pixel.
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setMinimumSize(480, 320)
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
+        self.history = collections.deque(maxlen=EditorConfig.AUDIO_MONITOR_HISTORY)
+        self.latest = None
+        self.beat_time = 0.0
+    
+    def add_records(self, records):
+        for record in records:
+            self.history.append(record)
+            if record['beat']:
+                self.beat_time = time.perf_counter()
+        if records:
+            self.latest = records[-1]
+    
+    def scale(self):
+        """Escala vertical: o limiar intense fica a 2/3 da altura"""
+        if self.latest is None:
+            return 1.0
+        return max(self.latest['intense_threshold'] * 1.5, 1e-6)
+    
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), QColor(20, 20, 20))
+        if self.latest is None:
+            painter.setPen(QColor(160, 160, 160))
+            painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, "Waiting for the game's audio...")
+            painter.end()
+            return
+        
+        width = self.width()
+        height = self.height()
+        top = height * 0.45  # metade de cima: histórico; de baixo: barras
+        self.draw_history(painter, QRectF(0, 0, width, top))
+        self.draw_bars(painter, QRectF(0, top + 10, width, height - top - 10))
+        painter.end()
+    
+    def draw_history(self, painter, area):
+        scale = self.scale()
+        latest = self.latest
+        def y_of(value):
+            return area.bottom() - min(value / scale, 1.0) * area.height()
+        
+        # Limiares atuais do jogo
+        for value, color in ((latest['void_threshold'], STATE_COLORS['void']),
+                             (latest['intense_threshold'], STATE_COLORS['intense'])):
+            painter.setPen(QPen(color, 1, Qt.PenStyle.DashLine))
+            painter.drawLine(QPointF(area.left(), y_of(value)), QPointF(area.right(), y_of(value)))
+        
+        records = list(self.history)
+        if len(records) < 2:
+            return
+        # Dizimação por máximo: no máximo um ponto por pixel, picos preservados
+        step = max(1, len(records) // max(int(area.width()), 1))
+        points = QPolygonF()
+        count = (len(records) + step - 1) // step
+        for i in range(count):
+            chunk = records[i * step:(i + 1) * step]
+            value = max(record['volume'] for record in chunk)
+            x = area.left() + area.width() * i / max(count - 1, 1)
+            points.append(QPointF(x, y_of(value)))
+            if any(record['beat'] for record in chunk):
+                painter.fillRect(QRectF(x - 1, area.top(), 2, 6), STATE_COLORS['intense'])
+        painter.setPen(QPen(QColor(220, 220, 220), 1.5))
+        painter.drawPolyline(points)
+    
+    def draw_bars(self, painter, area):
+        latest = self.latest
+        scale = self.scale()
+        
+        # Volume e nível à esquerda, com a cor do estado detectado
+        meter_width = 40
+        for i, (key, color) in enumerate((('volume', STATE_COLORS[latest['state']]),
+                                          ('level', QColor(160, 160, 160)))):
+            x = area.left() + 10 + i * (meter_width + 6)
+            value = min(latest[key] / scale, 1.0)
+            painter.fillRect(QRectF(x, area.top(), meter_width, area.height()), QColor(40, 40, 40))
+            painter.fillRect(QRectF(x, area.bottom() - value * area.height(), meter_width,
+                                    value * area.height()), color)
+        for value, color in ((latest['void_threshold'], STATE_COLORS['void']),
+                             (latest['intense_threshold'], STATE_COLORS['intense'])):
+            y = area.bottom() - min(value / scale, 1.0) * area.height()
+            painter.setPen(QPen(color, 2))
+            painter.drawLine(QPointF(area.left() + 6, y), QPointF(area.left() + 14 + 2 * meter_width + 6, y))
+        
+        # Indicador de beat (acende por 150 ms)
+        beat_on = time.perf_counter() - self.beat_time < 0.15
+        painter.setBrush(STATE_COLORS['intense'] if beat_on else QColor(50, 50, 50))
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.drawEllipse(QRectF(area.right() - 22, area.top(), 12, 12))
+        
+        # Bandas e espectro: escala própria (pico recente) para caber na área
+        left = area.left() + 20 + 2 * (meter_width + 6)
+        right = area.right() - 30
+        bands = latest['bands']
+        spectrum = latest['spectrum']
+        columns = [(value, QColor(200, 170, 60)) for value in bands]
+        columns += [(value, QColor(80, 150, 220)) for value in spectrum]
+        if not columns:
+            return
+        peak = max(max(value for value, _ in columns), 1e-6)
+        bar_width = (right - left) / (len(columns) + 1)
+        for i, (value, color) in enumerate(columns):
+            # Espaço entre as bandas e o espectro
+            x = left + (i + (1 if i >= len(bands) else 0)) * bar_width
+            h = value / peak * area.height()
+            painter.fillRect(QRectF(x, area.bottom() - h, bar_width * 0.8, h), color)
+
+class AudioSettings(QWidget):
+    """Tab de áudio: monitor ao vivo do analisador do jogo em execução"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.monitor_module = load_game_module(os.path.join("src", "audio", "monitor.py"),
+                                               "game_audio_monitor")
+        game_config = load_game_module(os.path.join("src", "config.py"), "game_config").Config
+        self.monitor_name = game_config.AUDIO_MONITOR
+        self.ring = None
+        self.last_record = 0.0
+        self.last_attach = 0.0
+        
+        layout = QVBoxLayout(self)
+        self.meter = LevelMonitor()
+        layout.addWidget(self.meter, 1)
+        self.status = QLabel()
+        layout.addWidget(self.status)
+        
+        # Repaint limitado: o analisador publica ~20 blocos/s, a tela não precisa de mais
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.poll)
+    
+    def attach(self):
+        self.last_attach = time.perf_counter()
+        self.detach()
+        try:
+            self.ring = self.monitor_module.AudioMonitor(self.monitor_name)
+        except (OSError, ValueError):
+            self.ring = None
+            self.status.setText("Game not running (or audio monitor disabled)")
+            return
+        self.last_record = time.perf_counter()
+        self.status.setText("Connected to the game's audio analyzer")
+    
+    def detach(self):
+        if self.ring is not None:
+            self.ring.close()
+            self.ring = None
+    
+    def poll(self):
+        now = time.perf_counter()
+        if self.ring is None:
+            if self.monitor_name and now - self.last_attach > 1.0:
+                self.attach()
+            return
+        records = self.ring.read_new(limit=EditorConfig.AUDIO_MONITOR_HISTORY)
+        if records:
+            self.last_record = now
+            self.meter.add_records(records)
+            latest = records[-1]
+            self.status.setText(
+                f"{latest['state']}  volume {latest['volume']:.4f}  "
+                f"void < {latest['void_threshold']:.3f}  intense >= {latest['intense_threshold']:.3f}")
+            self.meter.update()
+        elif now - self.last_record > 1.0 and now - self.last_attach > 1.0:
+            # Jogo reiniciado recria a memória: sem dados novos, reconecta
+            self.attach()
+    
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.timer.start(1000 // EditorConfig.AUDIO_MONITOR_FPS)
+    
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.timer.stop()
+    
+    def shutdown(self):
+        self.timer.stop()
+        self.detach()
\ No newline at end of file
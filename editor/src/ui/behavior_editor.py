@@ -0,0 +1,106 @@
+# editor/src/ui/behavior_editor.py
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QFormLayout, QScrollArea,
+                             QSlider, QLabel)
+from PyQt6.QtCore import Qt
+
+SLIDER_STEPS = 1000
+
+def numeric_leaves(data, prefix=""):
+    """Caminhos ("enemies.speed.void") de todos os valores numéricos do tuning"""
+    for key, value in data.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict):
+            yield from numeric_leaves(value, path + ".")
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            yield path, value
+
+def slider_range(path, value):
+    """Faixa do slider: de 0 ao dobro do valor inicial (valores 0 vão até 1),
+    sem sair do que o jogo aceita (pesos, chances e intervalos)"""
+    keys = path.split('.')
+    minimum = 0
+    maximum = abs(value) * 2 or 1
+    if "weights" in keys:
+        # Um peso nunca zera: os de um estado não podem somar zero
+        minimum = 1
+    elif any(key.endswith("_delay") for key in keys):
+        minimum = 1
+    elif any(key.endswith("chance") for key in keys):
+        maximum = 1
+    return minimum, max(maximum, minimum + 1)
+
+class TuningSlider(QWidget):
+    """Slider de um valor do tuning; arrastar gera uma única entrada de desfazer"""
+    
+    def __init__(self, manager, path, value, parent=None):
+        super().__init__(parent)
+        self.manager = manager
+        self.path = path
+        self.integer = isinstance(value, int)
+        self.minimum, self.maximum = slider_range(path, value)
+        
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.slider = QSlider(Qt.Orientation.Horizontal)
+        self.slider.setRange(0, SLIDER_STEPS)
+        self.label = QLabel()
+        self.label.setMinimumWidth(60)
+        layout.addWidget(self.slider, 1)
+        layout.addWidget(self.label)
+        
+        self.show_value(value)
+        self.slider.valueChanged.connect(self.slider_changed)
+        self.slider.sliderReleased.connect(manager.finish)
+    
+    def to_value(self, position):
+        value = self.minimum + position / SLIDER_STEPS * (self.maximum - self.minimum)
+        return int(round(value)) if self.integer else round(value, 4)
+    
+    def show_value(self, value):
+        self.slider.blockSignals(True)
+        span = self.maximum - self.minimum
+        self.slider.setValue(int(min(max((value - self.minimum) / span, 0), 1) * SLIDER_STEPS))
+        self.slider.blockSignals(False)
+        self.label.setText(str(value))
+    
+    def slider_changed(self, position):
+        value = self.to_value(position)
+        self.label.setText(str(value))
+        self.manager.set(self.path, value, continuous=self.slider.isSliderDown())
+
+class BehaviorEditor(QWidget):
+    """Valores numéricos do tuning do jogo, aplicados ao vivo no jogo em execução"""
+    
+    def __init__(self, manager, parent=None):
+        super().__init__(parent)
+        self.manager = manager
+        self.controls = {}
+        
+        layout = QVBoxLayout(self)
+        scroll = QScrollArea()
+        scroll.setWidgetResizable(True)
+        layout.addWidget(scroll)
+        self.form_widget = QWidget()
+        self.form = QFormLayout(self.form_widget)
+        scroll.setWidget(self.form_widget)
+        
+        manager.listeners.append(self.config_changed)
+        self.rebuild()
+    
+    def rebuild(self):
+        while self.form.rowCount():
+            self.form.removeRow(0)
+        self.controls = {}
+        for path, value in numeric_leaves(self.manager.data):
+            control = TuningSlider(self.manager, path, value)
+            self.controls[path] = control
+            self.form.addRow(path, control)
+    
+    def config_changed(self, path):
+        """Atualiza o controle após desfazer/refazer (path None = arquivo recarregado)"""
+        if path is None:
+            self.rebuild()
+            return
+        control = self.controls.get(path)
+        if control is not None and not control.slider.isSliderDown():
+            control.show_value(self.manager.get(path))
\ No newline at end of file
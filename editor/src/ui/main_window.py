@@ -2,8 +2,16 @@
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                            QTabWidget, QPushButton, QLabel, QSpacerItem, 
                            QSizePolicy, QMenuBar, QStatusBar, QDockWidget)
-from PyQt6.QtCore import Qt, QSize
+from PyQt6.QtCore import Qt, QSize, QTimer
 from PyQt6.QtGui import QAction, QIcon, QPalette, QColor
+from src.previews.ship_preview import GamePreviewWidget
+from src.previews.particle_preview import ParticleDesigner
+from src.previews.pattern_preview import PatternDesigner
+from src.ui.behavior_editor import BehaviorEditor
+from src.ui.audio_settings import AudioSettings
+from src.ui.project_settings import ProjectSettings
+from src.controllers.config_manager import ConfigManager
+from src.config import EditorConfig
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -103,6 +111,8 @@ class MainWindow(QMainWindow):
         
         # Adiciona as tabs principais
         self.setup_visual_tab()
+        self.setup_particles_tab()
+        self.setup_patterns_tab()
         self.setup_behavior_tab()
         self.setup_audio_tab()
         self.setup_project_tab()
@@ -127,11 +137,22 @@ class MainWindow(QMainWindow):
         
         save_action = QAction("&Save", self)
         save_action.setShortcut("Ctrl+S")
+        save_action.triggered.connect(self.save_settings)
         file_menu.addAction(save_action)
         
         # Menu Edit
         edit_menu = menubar.addMenu("&Edit")
         
+        undo_action = QAction("&Undo", self)
+        undo_action.setShortcut("Ctrl+Z")
+        undo_action.triggered.connect(self.config_manager.undo)
+        edit_menu.addAction(undo_action)
+        
+        redo_action = QAction("&Redo", self)
+        redo_action.setShortcut("Ctrl+Shift+Z")
+        redo_action.triggered.connect(self.config_manager.redo)
+        edit_menu.addAction(redo_action)
+        
         # Menu View
         view_menu = menubar.addMenu("&View")
         
@@ -153,25 +174,40 @@ class MainWindow(QMainWindow):
         """Configura a tab de edição visual"""
         visual_widget = QWidget()
         self.tabs.addTab(visual_widget, "Visual Editor")
-        # TODO: Implementar conteúdo da tab visual
+        
+        # Preview ao vivo do jogo (pausa sozinho quando a tab não está visível)
+        layout = QVBoxLayout(visual_widget)
+        self.game_preview = GamePreviewWidget()
+        layout.addWidget(self.game_preview)
+    
+    def setup_particles_tab(self):
+        """Configura a tab do designer de partículas"""
+        self.particle_designer = ParticleDesigner()
+        self.tabs.addTab(self.particle_designer, "Particles")
+    
+    def setup_patterns_tab(self):
+        """Configura a tab dos padrões de movimento dos inimigos"""
+        self.pattern_designer = PatternDesigner()
+        self.tabs.addTab(self.pattern_designer, "Patterns")
     
     def setup_behavior_tab(self):
         """Configura a tab de comportamento"""
-        behavior_widget = QWidget()
-        self.tabs.addTab(behavior_widget, "Behavior")
-        # TODO: Implementar conteúdo da tab de comportamento
+        # Tuning editado como diffs e enviado ao vivo para o jogo em execução
+        self.config_manager = ConfigManager()
+        self.behavior_editor = BehaviorEditor(self.config_manager)
+        self.tabs.addTab(self.behavior_editor, "Behavior")
     
     def setup_audio_tab(self):
         """Configura a tab de áudio"""
-        audio_widget = QWidget()
-        self.tabs.addTab(audio_widget, "Audio")
-        # TODO: Implementar conteúdo da tab de áudio
+        # Monitor ao vivo do analisador do jogo (calibração dos limiares)
+        self.audio_settings = AudioSettings()
+        self.tabs.addTab(self.audio_settings, "Audio")
     
     def setup_project_tab(self):
         """Configura a tab de configurações do projeto"""
-        project_widget = QWidget()
-        self.tabs.addTab(project_widget, "Project")
-        # TODO: Implementar conteúdo da tab de projeto
+        # Arquivos do projeto e exportação do bundle para deploy
+        self.project_settings = ProjectSettings()
+        self.tabs.addTab(self.project_settings, "Project")
     
     def setup_dock_widgets(self):
         """Configura widgets de dock para ferramentas"""
@@ -185,12 +221,22 @@ class MainWindow(QMainWindow):
         properties_dock.setAllowedAreas(Qt.DockWidgetArea.RightDockWidgetArea)
         self.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, properties_dock)
     
+    def closeEvent(self, event):
+        self.game_preview.shutdown()
+        self.config_manager.close()
+        self.audio_settings.shutdown()
+        super().closeEvent(event)
+    
     def load_settings(self):
         """Carrega configurações salvas"""
-        # TODO: Implementar carregamento de configurações
-        pass
+        self.config_manager.load()
+        
+        # Um lote de alterações por frame para o jogo (sliders não inundam a conexão)
+        self.push_timer = QTimer(self)
+        self.push_timer.timeout.connect(self.config_manager.flush)
+        self.push_timer.start(EditorConfig.CONFIG_PUSH_INTERVAL_MS)
     
     def save_settings(self):
         """Salva configurações atuais"""
-        # TODO: Implementar salvamento de configurações
-        pass
\ No newline at end of file
+        if self.config_manager.save():
+            self.statusbar.showMessage("Tuning saved", 3000)
\ No newline at end of file
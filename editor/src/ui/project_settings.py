@@ -0,0 +1,72 @@
+# editor/src/ui/project_settings.py
+import os
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
+                             QHeaderView, QPushButton, QCheckBox, QLabel)
+from src.controllers.project_exporter import ProjectExporter
+
+def format_size(size):
+    if size >= 1024 * 1024:
+        return f"{size / (1024 * 1024):.1f} MB"
+    if size >= 1024:
+        return f"{size / 1024:.1f} KB"
+    return f"{size} B"
+
+class ProjectSettings(QWidget):
+    """Tab de projeto: arquivos do jogo e exportação do bundle para deploy"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.exporter = ProjectExporter()
+        
+        layout = QVBoxLayout(self)
+        layout.addWidget(QLabel("Files exported to the bundle"))
+        self.table = QTableWidget(0, 3)
+        self.table.setHorizontalHeaderLabels(["Entry", "Size", "In bundle"])
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        layout.addWidget(self.table, 1)
+        
+        options = QHBoxLayout()
+        self.bake_box = QCheckBox("Bake sprite atlas before export")
+        self.bake_box.setChecked(True)
+        options.addWidget(self.bake_box)
+        options.addStretch(1)
+        refresh_button = QPushButton("Refresh")
+        refresh_button.clicked.connect(self.refresh)
+        options.addWidget(refresh_button)
+        export_button = QPushButton("Export Bundle")
+        export_button.clicked.connect(self.export_bundle)
+        options.addWidget(export_button)
+        layout.addLayout(options)
+        
+        self.status = QLabel(f"Output: {self.exporter.output}")
+        layout.addWidget(self.status)
+        self.refresh()
+    
+    def refresh(self, summary=None):
+        """Lista os arquivos (e o tamanho gravado de cada um após exportar)"""
+        stored = {name: size for name, _, size in summary or []}
+        names = self.exporter.project_files()
+        self.table.setRowCount(len(names))
+        for row, name in enumerate(names):
+            size = os.path.getsize(os.path.join(self.exporter.root, name))
+            entry = self.exporter.bundle.entry_name(name)
+            self.table.setItem(row, 0, QTableWidgetItem(entry))
+            self.table.setItem(row, 1, QTableWidgetItem(format_size(size)))
+            self.table.setItem(row, 2, QTableWidgetItem(
+                format_size(stored[entry]) if entry in stored else ""))
+    
+    def export_bundle(self):
+        if self.bake_box.isChecked() and not self.exporter.bake_atlas():
+            self.status.setText("Error baking sprite atlas (see console); bundle not exported")
+            return
+        try:
+            summary, raw, size, elapsed = self.exporter.export()
+        except OSError as e:
+            self.status.setText(f"Error exporting bundle: {e}")
+            return
+        self.refresh(summary)
+        self.status.setText(
+            f"Exported {len(summary)} entries to {self.exporter.output}: "
+            f"{format_size(raw)} -> {format_size(size)} in {elapsed * 1000:.0f} ms")
\ No newline at end of file
@@ -1,58 +1,255 @@
 # main.py
+import time
+STARTUP_T0 = time.perf_counter()
+
+import argparse
+import os
 import pygame
 import random
+import threading
 from src.config import Config
-from src.audio.analyzer import AudioAnalyzer
-from src.entities.player import Player
-from src.entities.enemies import EnemySpawner
-from src.graphics.background import Background
-from src.graphics.particles import ParticleSystem
 from src.graphics.hud import HUD
-from src.states.game_state import GameState
-from src.systems.powerup_spawner import PowerUpSpawner
+from src.graphics.sprites import POWERUP_COLORS
+from src.systems import tuning
+from src.systems.replay import SPAWN, KILL, DAMAGE, POWERUP, DROP
+from src.utils.startup import StartupProfiler
+
+# Os demais subsistemas (NumPy, áudio, sprites) são importados durante a
+# fase de carregamento, com a janela já aberta; ver Game._loading_steps
 
 class Game:
-    def __init__(self):
-        pygame.init()
-        self.screen = pygame.display.set_mode((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT))
-        pygame.display.set_caption("Space Shooter Audio-Reativo")
+    def __init__(self, audio_source=None, audio_process=None, metrics_path=None,
+                 staged=False, startup=None, resume_path=None, start_state="play",
+                 record_path=None, preview_name=None):
+        self.startup = startup or StartupProfiler()
+        
+        # Buffer pequeno no mixer para reduzir a latência dos efeitos
+        pygame.mixer.pre_init(44100, -16, 2, Config.SFX_BUFFER)
+        with self.startup.phase("pygame.init + janela"):
+            pygame.init()
+            self.screen = pygame.display.set_mode((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT))
+            pygame.display.set_caption("Space Shooter Audio-Reativo")
+            self.hud = HUD()
         
         self.clock = pygame.time.Clock()
         self.running = True
         
-        # Sistema de estado do jogo
-        self.game_state = GameState()
+        # Fonte de áudio: objeto AudioSource ou nome ("synthetic", "file", ...)
+        self.audio_source = audio_source
+        if audio_process is None:
+            audio_process = Config.AUDIO_PROCESS
+        self.audio_process = audio_process
+        self.metrics_path = metrics_path
+        self.resume_path = resume_path
+        self.start_state = start_state
+        self.record_path = record_path
+        self.recorder = None
+        
+        # Preview do editor: frames desenhados direto na memória compartilhada
+        self.preview_name = preview_name
+        self.preview = None
+        self.preview_surfaces = []
+        self.editor_pid = os.getppid()
+        
+        # Carregamento em etapas: run() desenha a tela de loading entre elas;
+        # sem staged, tudo é construído aqui mesmo (uso em scripts e testes)
+        self.loading = self._loading_steps()
+        self.loading_progress = 0.0
+        self.loading_label = ""
+        self.loaded = False
+        if not staged:
+            for _ in self.loading:
+                pass
+    
+    def _loading_steps(self):
+        """Gerador das etapas de inicialização; cada yield devolve o progresso"""
+        startup = self.startup
+        steps = 10
+        
+        # Áudio (NumPy + backend) sobe numa thread enquanto o resto carrega
+        self.audio = None
+        audio_thread = threading.Thread(target=self._load_audio, daemon=True)
+        audio_thread.start()
+        yield 1 / steps, "audio"
+        
+        # Dados do projeto: bundle único mapeado em memória, se houver
+        with startup.phase("bundle"):
+            bundle = startup.timed_import('src.utils.bundle')
+            try:
+                bundle.init(Config.BUNDLE_FILE)
+            except (OSError, bundle.BundleError) as e:
+                # Bundle ilegível: segue com os arquivos soltos
+                print(f"Error opening bundle: {e}")
         
-        # Sistema de áudio
-        self.audio = AudioAnalyzer()
+        # Sprites: uma leitura do atlas pré-gerado (ou geração procedural)
+        with startup.phase("sprites"):
+            startup.timed_import('src.graphics.atlas').init()
+        yield 2 / steps, "sprites"
         
-        # Grupos de sprites
-        self.projectiles = pygame.sprite.Group()
-        self.player = Player(self.projectiles)
-        self.all_sprites = pygame.sprite.Group(self.player)
+        with startup.phase("tuning"):
+            tuning.init()
+            self.tuning_watcher = tuning.TuningWatcher() if Config.TUNING_HOT_RELOAD else None
+            self.tuning_server = None
+            if Config.TUNING_PORT:
+                try:
+                    self.tuning_server = tuning.TuningServer()
+                except OSError as e:
+                    # Outra instância (ou o preview do editor) já usa a porta
+                    print(f"Error starting tuning server: {e}")
+        yield 3 / steps, "tuning"
         
-        # Sistema de inimigos
-        self.enemy_spawner = EnemySpawner()
+        # Efeitos sonoros pré-decodificados
+        with startup.phase("sfx"):
+            effects = startup.timed_import('src.audio.effects')
+            self.sfx = effects.SFXMixer()
+        yield 4 / steps, "sfx"
+        
+        with startup.phase("entities"):
+            Player = startup.timed_import('src.entities.player').Player
+            EnemySpawner = startup.timed_import('src.entities.enemies').EnemySpawner
+            BulletEngine = startup.timed_import('src.entities.bullets').BulletEngine
+            patterns = startup.timed_import('src.entities.patterns')
+            try:
+                patterns.install(bundle.load_json(Config.PATTERNS_FILE, {}))
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                print(f"Error loading enemy patterns: {e}")
+            PowerUpSpawner = startup.timed_import('src.systems.powerup_spawner').PowerUpSpawner
+            
+            # Colisões rect + máscara de pixels (Config.PRECISE_COLLISIONS)
+            self.collision = startup.timed_import('src.systems.collision')
+            
+            # Entrada com timestamp, aplicada em ordem a cada passo
+            self.input = startup.timed_import('src.systems.input').InputBuffer()
+            
+            # Linha do tempo do jogo: spawns e fim dos power-ups como eventos agendados
+            self.timeline = startup.timed_import('src.systems.scheduler').Scheduler()
+            
+            # Grupos de sprites
+            self.projectiles = pygame.sprite.Group()
+            self.player = Player(self.projectiles, self.timeline, self.sfx, self.input)
+            self.all_sprites = pygame.sprite.Group(self.player)
+            
+            # Sistema de inimigos; elites e chefes atiram pelo motor de balas em lote
+            self.bullets = BulletEngine(self.timeline, self.player)
+            self.enemy_spawner = EnemySpawner(self.timeline, self.bullets)
+            
+            # Sistema de power-ups
+            self.powerup_spawner = PowerUpSpawner(self.timeline)
+        yield 5 / steps, "entities"
         
-        # Sistema de power-ups
-        self.powerup_spawner = PowerUpSpawner()
+        with startup.phase("background"):
+            self.background = startup.timed_import('src.graphics.background').Background()
+        yield 6 / steps, "background"
         
-        # Sistemas gráficos
-        self.background = Background()
-        self.particle_system = ParticleSystem()
-        self.hud = HUD()
+        with startup.phase("effects"):
+            # Efeitos de partículas definidos por presets (também usados pelo editor)
+            particles = startup.timed_import('src.graphics.particles')
+            try:
+                particles.install(bundle.load_json(Config.PARTICLE_PRESETS_FILE, {}))
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                print(f"Error loading particle presets: {e}")
+            self.particle_system = particles.ParticleSystem()
+            
+            # Métricas de frame, overlay de profiling e dump opcional em arquivo
+            self.frame_times = {'fps': 0.0, 'frame_ms': 0.0, 'update_ms': 0.0, 'draw_ms': 0.0}
+            self.profiler = startup.timed_import('src.graphics.profiler').ProfilerOverlay()
+            MetricsDump = startup.timed_import('src.utils.helpers').MetricsDump
+            self.metrics_dump = MetricsDump(self.metrics_path) if self.metrics_path else None
+        yield 7 / steps, "effects"
+        
+        with startup.phase("audio (wait)"):
+            audio_thread.join()
+        yield 8 / steps, "audio"
+        
+        # Sistema de estado do jogo, com histórico de partidas por trilha
+        with startup.phase("game state"):
+            GameState = startup.timed_import('src.states.game_state').GameState
+            RunHistory = startup.timed_import('src.states.run_history').RunHistory
+            # Partidas de teste do preview do editor não entram no histórico nem no recorde
+            persist = not self.preview_name
+            history = RunHistory(Config.RUN_HISTORY_DB) if Config.RUN_HISTORY_DB and persist else None
+            self.game_state = GameState(history=history, track=self.audio_track(), persist=persist)
+            
+            # Últimos segundos de jogo em memória fixa (kill-cam e dump de crash)
+            self.replay = startup.timed_import('src.systems.replay').ReplayBuffer()
+            
+            # Pilha de cenas; a primeira já começa a ser preparada em segundo plano
+            StateStack = startup.timed_import('src.states.menu_state').StateStack
+            self.states = StateStack(self)
+            self.states.prepare(self.start_state)
+        yield 9 / steps, "game state"
+        
+        with startup.phase("first state"):
+            self.states.push(self.start_state)
+        
+        self.loaded = True
+        yield 1.0, "ready"
+    
+    def _load_audio(self):
+        """Importa e inicia o sistema de áudio (roda numa thread de carregamento)"""
+        with self.startup.phase("audio (background)"):
+            analyzer = self.startup.timed_import('src.audio.analyzer')
+            source = self.audio_source
+            try:
+                if source is None or isinstance(source, str):
+                    source = analyzer.source_from_config(source)
+                if self.audio_process:
+                    worker = self.startup.timed_import('src.audio.worker')
+                    self.audio = worker.AudioProcessAnalyzer(source)
+                else:
+                    self.audio = analyzer.AudioAnalyzer(source)
+            except Exception as e:
+                # Fonte inválida (arquivo ausente, backend quebrado): o jogo segue
+                # em silêncio, como na falha do microfone
+                print(f"Error starting audio: {e}")
+                self.audio = analyzer.AudioAnalyzer(analyzer.NullSource(
+                    sample_rate=Config.AUDIO_SAMPLE_RATE, block_size=Config.AUDIO_BLOCK_SIZE))
+    
+    def _run_loading(self):
+        """Executa as etapas de carregamento com a tela de loading atualizada"""
+        budget = 1.0 / Config.FPS
+        while self.running and not self.loaded:
+            frame_start = time.perf_counter()
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    self.running = False
+            
+            self.screen.fill(Config.BLACK)
+            self.hud.draw_loading(self.screen, self.loading_progress, self.loading_label)
+            pygame.display.flip()
+            if 'window visible' not in self.startup.marks:
+                self.startup.mark('window visible')
+            
+            # Várias etapas por frame enquanto couberem no orçamento
+            while not self.loaded and time.perf_counter() - frame_start < budget:
+                self.loading_progress, self.loading_label = next(self.loading)
+            self.clock.tick(Config.FPS)
+    
+    def audio_track(self):
+        """Nome da trilha usada nos leaderboards (arquivo tocado ou tipo de fonte)"""
+        path = getattr(self.audio.source, 'path', None)
+        return os.path.basename(path) if path else self.audio.source.name
     
     def handle_events(self):
-        for event in pygame.event.get():
+        # Inclui os eventos recebidos no polling entre frames, na ordem de chegada
+        for event in self.input.poll():
             if event.type == pygame.QUIT:
                 self.running = False
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_SPACE and self.game_state.game_over:
-                    self.reset_game()
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                self.profiler.toggle()
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F5:
+                self.save_snapshot(Config.SNAPSHOT_FILE)
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F9:
+                self.load_snapshot(Config.SNAPSHOT_FILE)
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F10:
+                self.toggle_recording()
+            else:
+                # Demais teclas vão para a cena do topo (menu, jogo, pausa, game over)
+                self.states.handle_event(event)
     
     def check_collisions(self):
         # Colisões entre projéteis e inimigos
-        hits = pygame.sprite.groupcollide(
+        hits = self.collision.groupcollide(
             self.projectiles, 
             self.enemy_spawner.enemies, 
             True,  # Remove projétil
@@ -62,17 +259,16 @@ class Game:
         # Processa hits e adiciona pontos
         for proj, enemies in hits.items():
             for enemy in enemies:
-                # Adiciona pontos baseado no tipo de inimigo
-                points = 10  # Pontos base
-                if enemy.enemy_type == "elite":
-                    points = 20
-                elif enemy.enemy_type == "boss":
-                    points = 50
+                self.game_state.record_kill(enemy.enemy_type)
                 
                 # Adiciona pontos com multiplicador
-                self.game_state.add_score(points, self.audio.get_state())
+                points = tuning.current.enemy_points[enemy.enemy_type]
+                gained = self.game_state.add_score(points, self.audio.get_state())
+                self.replay.event(KILL, enemy.enemy_type, *enemy.rect.center, gained)
                 
-                # Efeitos visuais
+                # Efeitos visuais e sonoros (impacto do projétil e explosão)
+                self.sfx.trigger('hit')
+                self.sfx.trigger('explosion')
                 self.particle_system.create_explosion(
                     enemy.rect.centerx,
                     enemy.rect.centery,
@@ -84,38 +280,80 @@ class Game:
                 )
                 
                 # Chance de dropar power-up ao destruir inimigo
-                if random.random() < 0.1:  # 10% de chance
+                if random.random() < tuning.current.drop_chance:
+                    drop_type = random.choice(tuning.current.drop_types)
                     self.powerup_spawner.spawn_specific(
-                        random.choice(['double_shot', 'triple_shot', 'shield', 'speed']),
+                        drop_type,
                         enemy.rect.centerx,
                         enemy.rect.centery
                     )
+                    self.replay.event(DROP, drop_type, *enemy.rect.center)
         
         # Colisões entre jogador e power-ups
         powerup_type = self.powerup_spawner.check_collisions(self.player)
         if powerup_type:
+            self.sfx.trigger('powerup')
+            self.game_state.record_powerup(powerup_type)
+            self.replay.event(POWERUP, powerup_type, *self.player.rect.center)
+            
             # Efeito visual ao pegar power-up
             self.particle_system.create_powerup_effect(
                 self.player.rect.centerx,
                 self.player.rect.centery,
-                powerup_type
+                POWERUP_COLORS.get(powerup_type)
             )
         
+        # Balas inimigas: o escudo absorve; sem ele, cada bala que toca a nave tira vida
+        if self.player.shield_active:
+            shield_rect = self.player.shield_surface.get_rect(center=self.player.rect.center)
+            self.bullets.collide(shield_rect, 'shield')
+        else:
+            bullet_hits = self.bullets.collide(self.player.rect, 'ship')
+            if bullet_hits:
+                damage = bullet_hits * tuning.current.bullet_damage
+                self.game_state.take_damage(damage)
+                self.sfx.trigger('damage')
+                self.replay.event(DAMAGE, 'bullet', *self.player.rect.center, damage)
+        
         # Colisões entre jogador e inimigos (se não tiver escudo)
         if not self.player.shield_active:
-            hits = pygame.sprite.spritecollide(self.player, self.enemy_spawner.enemies, True)
+            hits = self.collision.spritecollide(self.player, self.enemy_spawner.enemies, True)
             if hits:
                 self.game_state.take_damage(25)  # 25 de dano por colisão
+                self.sfx.trigger('damage')
+                self.replay.event(DAMAGE, hits[0].enemy_type, *self.player.rect.center, 25)
     
     def update(self):
+        # Troca as tabelas de tuning se um reload terminou em segundo plano
+        tuning.apply_pending()
+        # Estado das ações neste passo (inclusive toques menores que um frame)
+        self.input.step()
+        self.states.update()
+    
+    def update_world(self):
+        """Um passo da partida (chamado pela cena de jogo)"""
         if not self.game_state.game_over:
+            volume = self.audio.read_volume()
             game_state = self.audio.get_state()
             
+            # Tempo de jogo anda só aqui (pausa, game over e menu congelam os
+            # timers) e dispara os eventos vencidos: spawns liberados, power-ups no fim.
+            # Um frame travado (janela arrastada, GC) anda no máximo três frames
+            elapsed = min(self.clock.get_time(), 3 * 1000 // Config.FPS)
+            self.game_state.tick(game_state, elapsed)
+            self.timeline.advance(elapsed)
+            
             # Atualiza todos os elementos
             self.all_sprites.update(game_state)
             self.projectiles.update()
-            self.enemy_spawner.update(game_state, self.audio.volume)
-            self.powerup_spawner.update(game_state, self.audio.get_state(), self.audio.volume)
+            spawned_enemies = self.enemy_spawner.update(game_state, volume,
+                                                        self.player.rect.center)
+            spawned_powerup = self.powerup_spawner.update(game_state, game_state, volume)
+            self.bullets.update(game_state, volume)
+            for enemy in spawned_enemies:
+                self.replay.event(SPAWN, enemy.enemy_type, *enemy.rect.center)
+            if spawned_powerup:
+                self.replay.event(SPAWN, spawned_powerup.type, *spawned_powerup.rect.center)
             self.background.update(game_state)
             self.particle_system.update()
             
@@ -132,51 +370,295 @@ class Game:
             
             # Verifica colisões
             self.check_collisions()
+            
+            # Toca os efeitos disparados neste frame
+            self.sfx.flush()
+            
+            self.replay.record_tick(self, game_state)
     
     def draw(self):
         self.screen.fill(Config.BLACK)
+        self.states.draw(self.screen)
         
+        # Captura antes do overlay de profiling (o vídeo sai sem o painel)
+        if self.recorder:
+            self.recorder.capture(self.screen)
+        if self.profiler.visible:
+            self.profiler.draw(self.screen, self.collect_metrics())
+        
+        pygame.display.flip()
+        self.input.presented()
+        if self.preview:
+            # Publica o slot desenhado e passa a desenhar no próximo
+            self.preview.publish()
+            self.screen = self.preview_surfaces[self.preview.back_slot()]
+    
+    def draw_world(self, surface):
         # Desenha elementos do jogo
-        self.background.draw(self.screen)
-        self.projectiles.draw(self.screen)
-        self.enemy_spawner.enemies.draw(self.screen)
-        self.powerup_spawner.powerups.draw(self.screen)
+        self.background.draw(surface)
+        self.projectiles.draw(surface)
+        self.enemy_spawner.enemies.draw(surface)
+        self.powerup_spawner.powerups.draw(surface)
         
         # Desenha jogador por último para ficar sobre os outros elementos
-        self.player.draw(self.screen)
+        self.player.draw(surface)
+        # Balas inimigas por cima da nave (precisam ficar visíveis ao desviar)
+        self.bullets.draw(surface)
         
         # Desenha partículas por cima de tudo
-        self.particle_system.draw(self.screen)
+        self.particle_system.draw(surface)
         
         # Desenha HUD
-        self.hud.draw(self.screen, self.game_state)
-        
-        pygame.display.flip()
+        self.hud.draw(surface, self.game_state)
     
     def reset_game(self):
-        """Reinicia o jogo após game over"""
+        """Reinicia o jogo após game over, reaproveitando os objetos existentes"""
         self.game_state.reset()
         
-        # Limpa todos os sprites
-        self.projectiles.empty()
-        self.enemy_spawner.enemies.empty()
+        # Sprites voltam para os pools em vez de serem descartados
+        self.player.projectile_pool.recycle(self.projectiles)
+        self.enemy_spawner.pool.recycle(self.enemy_spawner.enemies)
         self.powerup_spawner.clear()
+        self.bullets.clear()
+        self.particle_system.particles.clear()
+        self.input.clear()
         
-        # Reposiciona o jogador
-        self.player.rect.centerx = Config.SCREEN_WIDTH // 2
-        self.player.rect.bottom = Config.SCREEN_HEIGHT - 20
+        # Reposiciona o jogador e encerra os power-ups ativos
+        self.player.reset()
+    
+    def save_snapshot(self, path, include_effects=True):
+        """Grava o mundo atual num snapshot binário (src/states/snapshot.py)"""
+        from src.states import snapshot
+        try:
+            snapshot.save(path, snapshot.capture(self, include_effects))
+            return True
+        except Exception as e:
+            print(f"Error saving snapshot: {e}")
+            return False
+    
+    def load_snapshot(self, path):
+        from src.states import snapshot
+        try:
+            snapshot.restore(self, snapshot.load(path))
+        except (OSError, snapshot.SnapshotError) as e:
+            print(f"Error loading snapshot: {e}")
+            return False
+        # O snapshot é sempre de uma partida: sai do menu/pausa/game over
+        if self.states.top is None or self.states.top.name != 'play':
+            self.states.reset('play')
+        return True
+    
+    def dump_replay(self, path):
+        """Grava os últimos segundos de jogo (ReplayBuffer.load lê de volta)"""
+        try:
+            self.replay.dump(path)
+            print(f"Replay of the last {Config.REPLAY_SECONDS} s saved to {path}")
+        except Exception as e:
+            print(f"Error saving replay: {e}")
     
-    def run(self):
+    def toggle_recording(self, path=None):
+        """Liga/desliga a gravação de vídeo em segundo plano (src/graphics/recorder.py)"""
+        if self.recorder:
+            self.recorder.close()
+            stats = self.recorder.get_stats()
+            print(f"Recording saved to {self.recorder.path}: {stats['written']} frames, "
+                  f"{stats['dropped']} dropped, capture {stats['capture_avg_ms']:.2f} ms/frame")
+            self.recorder = None
+            return
+        from src.graphics.recorder import FrameRecorder
+        path = path or self.record_path or Config.RECORD_FILE
         try:
+            self.recorder = FrameRecorder(path, self.screen.get_size())
+            print(f"Recording to {path}")
+        except (OSError, ValueError) as e:
+            print(f"Error starting recording: {e}")
+    
+    def report_input_latency(self):
+        latency = self.input.get_stats()['latency']
+        for action, stats in latency.items():
+            print(f"Input latency '{action}': {stats['avg_ms']:.1f} ms avg, "
+                  f"{stats['p95_ms']:.1f} ms p95, {stats['max_ms']:.1f} ms max "
+                  f"({stats['count']} presses)")
+    
+    def attach_preview(self, name):
+        """Desenha nos slots de frame criados pelo editor (src/utils/frame_share.py)"""
+        from src.utils.frame_share import SharedFrames
+        try:
+            self.preview = SharedFrames(name)
+        except (OSError, ValueError) as e:
+            print(f"Error attaching preview: {e}")
+            self.running = False
+            return
+        size = self.preview.size
+        # Surfaces sobre o buffer compartilhado: o editor lê os pixels sem cópia
+        self.preview_surfaces = [pygame.image.frombuffer(self.preview.slot(i), size, 'RGBX')
+                                 for i in range(self.preview.slots)]
+        self.screen = self.preview_surfaces[self.preview.back_slot()]
+    
+    def preview_frame_rate(self):
+        """FPS pedido pelo editor; com a aba escondida (0) espera sem simular"""
+        while self.running:
+            if self.preview.stop_requested or os.getppid() != self.editor_pid:
+                self.running = False
+                break
+            fps = self.preview.requested_fps
+            if fps:
+                return min(fps, Config.FPS)
+            for event in self.input.poll():
+                if event.type == pygame.QUIT:
+                    self.running = False
+            time.sleep(0.05)
+        return Config.FPS
+    
+    def close_preview(self):
+        # As surfaces seguram o buffer compartilhado; soltas antes de fechar
+        self.screen = None
+        self.preview_surfaces = []
+        self.preview.close()
+        self.preview = None
+    
+    def collect_metrics(self):
+        """Métricas de frame, áudio e efeitos (overlay e dump em arquivo)"""
+        metrics = {
+            'frame': dict(self.frame_times),
+            'audio': self.audio.get_metrics(),
+            'sfx': self.sfx.get_stats(),
+            'input': self.input.get_stats(),
+            'particles': self.particle_system.get_stats(),
+            'enemies': self.enemy_spawner.motion.get_stats(),
+            'bullets': self.bullets.get_stats(),
+            'timeline': self.timeline.get_stats(),
+        }
+        if self.recorder:
+            metrics['recorder'] = self.recorder.get_stats()
+        return metrics
+    
+    def run(self, max_frames=None):
+        frames = 0
+        try:
+            self._run_loading()
+            if self.loaded:
+                if self.resume_path:
+                    self.load_snapshot(self.resume_path)
+                if self.record_path:
+                    self.toggle_recording(self.record_path)
+                if self.preview_name:
+                    self.attach_preview(self.preview_name)
+                self.startup.mark('first frame')
+            frame_rate = Config.FPS
             while self.running:
+                if self.preview:
+                    frame_rate = self.preview_frame_rate()
+                    if not self.running:
+                        break
+                    # Retomada após pausa: o tempo parado não vira um passo enorme
+                    if self.input.last_step < time.perf_counter() - 0.25:
+                        self.input.clear()
+                frame_start = time.perf_counter()
                 self.handle_events()
                 self.update()
+                update_end = time.perf_counter()
                 self.draw()
-                self.clock.tick(Config.FPS)
+                draw_end = time.perf_counter()
+                
+                self.frame_times['update_ms'] = (update_end - frame_start) * 1000
+                self.frame_times['draw_ms'] = (draw_end - update_end) * 1000
+                if self.metrics_dump:
+                    self.metrics_dump.update(self.collect_metrics)
+                
+                # Espera o próximo frame lendo a entrada (timestamps com precisão de ~1 ms)
+                self.input.wait(frame_start + 1.0 / frame_rate)
+                self.clock.tick(frame_rate)
+                self.frame_times['frame_ms'] = self.clock.get_time()
+                self.frame_times['fps'] = self.clock.get_fps()
+                
+                frames += 1
+                if max_frames and frames >= max_frames:
+                    self.running = False
+        except Exception:
+            # Guarda o mundo para investigar ou continuar com --resume
+            if self.loaded and self.save_snapshot(Config.CRASH_SNAPSHOT_FILE):
+                print(f"Crash snapshot saved to {Config.CRASH_SNAPSHOT_FILE}")
+            if self.loaded:
+                self.dump_replay(Config.REPLAY_DUMP_FILE)
+            raise
         finally:
+            self.shutdown()
+    
+    def shutdown(self):
+        """Encerra os subsistemas (inclusive os já criados se o loading foi interrompido)"""
+        if not self.loaded:
+            # Termina as etapas pendentes para não deixar threads pela metade
+            for _ in self.loading:
+                pass
+        # Um erro no loading deixa subsistemas sem criar: só encerra os existentes
+        if getattr(self, 'tuning_watcher', None):
+            self.tuning_watcher.stop()
+        if getattr(self, 'tuning_server', None):
+            self.tuning_server.stop()
+        if getattr(self, 'audio', None):
             self.audio.stop()
-            pygame.quit()
+        if getattr(self, 'game_state', None):
+            self.game_state.close()
+        if getattr(self, 'states', None):
+            self.states.close()
+        if getattr(self, 'input', None):
+            self.report_input_latency()
+        if self.recorder:
+            self.toggle_recording()
+        if getattr(self, 'metrics_dump', None):
+            self.metrics_dump.close()
+        if self.preview:
+            self.close_preview()
+        pygame.quit()
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Space Shooter Audio-Reativo")
+    parser.add_argument("--audio-source", choices=["microphone", "file", "synthetic", "null"],
+                        default=Config.AUDIO_SOURCE, help="fonte de áudio analisada")
+    parser.add_argument("--audio-file", help="arquivo WAV usado com --audio-source file")
+    parser.add_argument("--audio-process", action="store_true", default=Config.AUDIO_PROCESS,
+                        help="analisa o áudio num processo separado")
+    parser.add_argument("--metrics-dump", metavar="PATH",
+                        help="grava métricas de frame e áudio em JSON Lines")
+    parser.add_argument("--headless", action="store_true",
+                        help="roda sem janela nem saída de som (CI/benchmarks)")
+    parser.add_argument("--frames", type=int, help="encerra após N frames")
+    parser.add_argument("--resume", nargs="?", const=Config.SNAPSHOT_FILE, metavar="SNAPSHOT",
+                        help="continua a partir de um snapshot (padrão: o quicksave)")
+    parser.add_argument("--record", metavar="PATH",
+                        help="grava vídeo desde o início (.y4m ou diretório de PNGs); F10 liga/desliga")
+    parser.add_argument("--preview", metavar="SHM_NAME",
+                        help="roda sem janela desenhando nos frames compartilhados do editor")
+    parser.add_argument("--bundle", default=Config.BUNDLE_FILE, metavar="PATH",
+                        help="bundle do projeto exportado pelo editor (usado se existir)")
+    parser.add_argument("--bake", action="store_true",
+                        help="gera o atlas de sprites (Config.ATLAS_IMAGE/ATLAS_MANIFEST) e sai")
+    parser.add_argument("--startup-report", action="store_true",
+                        help="mostra o tempo de importação e inicialização até o primeiro frame")
+    return parser.parse_args()
 
 if __name__ == "__main__":
-    game = Game()
-    game.run()
\ No newline at end of file
+    args = parse_args()
+    if args.headless or args.preview:
+        os.environ['SDL_VIDEODRIVER'] = 'dummy'
+        os.environ['SDL_AUDIODRIVER'] = 'dummy'
+    if args.bake:
+        from src.graphics import atlas
+        manifest = atlas.bake()
+        print(f"Baked {len(manifest['sprites'])} sprites into {Config.ATLAS_IMAGE} "
+              f"({manifest['size'][0]}x{manifest['size'][1]})")
+        raise SystemExit(0)
+    if args.audio_file:
+        Config.AUDIO_FILE = args.audio_file
+    Config.BUNDLE_FILE = args.bundle
+    startup = StartupProfiler(STARTUP_T0)
+    # A fonte vai como nome: o módulo de áudio (e o NumPy) só carrega com a janela aberta
+    # Sem janela (CI/benchmarks, preview do editor) ou continuando um snapshot, vai direto para o jogo
+    start_state = "play" if args.headless or args.resume or args.preview else "menu"
+    game = Game(args.audio_source, args.audio_process, args.metrics_dump,
+                staged=True, startup=startup, resume_path=args.resume, start_state=start_state,
+                record_path=args.record, preview_name=args.preview)
+    game.run(args.frames)
+    if args.startup_report:
+        print(startup.report())
\ No newline at end of file
@@ -1,21 +1,68 @@
 # src/audio/analyzer.py
-import numpy as np
-import sounddevice as sd
 import threading
 import queue
+from time import perf_counter
 from src.config import Config
+from src.audio.dsp import DSPPipeline
+from src.audio.metrics import AudioMetrics
+from src.audio.monitor import AudioMonitor
+from src.audio.sources import NullSource, create_source
+
+def source_from_config(kind=None):
+    """Cria a fonte de áudio descrita em Config (ou a indicada em kind)"""
+    kind = kind or Config.AUDIO_SOURCE
+    options = {
+        'sample_rate': Config.AUDIO_SAMPLE_RATE,
+        'block_size': Config.AUDIO_BLOCK_SIZE,
+    }
+    if kind == "file":
+        options['path'] = Config.AUDIO_FILE
+    elif kind == "synthetic":
+        options['seed'] = Config.AUDIO_SEED
+    return create_source(kind, **options)
+
+def volume_state(volume):
+    """Classifica o volume nos estados de áudio do jogo"""
+    if volume < Config.VOID_THRESHOLD:
+        return "void"
+    elif volume < Config.INTENSE_THRESHOLD:
+        return "ambient"
+    else:
+        return "intense"
 
 class AudioAnalyzer:
-    def __init__(self):
-        self.audio_queue = queue.Queue()
+    def __init__(self, source=None):
+        # Fila limitada: se a análise atrasar, blocos novos são descartados
+        self.audio_queue = queue.Queue(maxsize=Config.AUDIO_QUEUE_SIZE)
         self.volume = 0
+        self.volume_time = 0  # Instante de captura do bloco que gerou o volume
         self.is_beat = False
         self.running = True
         
+        # Fonte de áudio (microfone por padrão, ver Config.AUDIO_SOURCE)
+        self.source = source if source is not None else source_from_config()
+        
         # Configurações
-        self.sample_rate = 44100
-        self.block_size = 2048
-        self.channels = 1
+        self.sample_rate = self.source.sample_rate
+        self.block_size = self.source.block_size
+        self.channels = self.source.channels
+        
+        # Pipeline de DSP configurado por dados (Config.AUDIO_PIPELINE)
+        self.pipeline = DSPPipeline.from_config(Config.AUDIO_PIPELINE,
+                                                self.sample_rate, self.block_size)
+        self.features = self.pipeline.features
+        
+        # Métricas de latência e saúde do pipeline
+        self.metrics = AudioMetrics(self.sample_rate, self.block_size)
+        
+        # Features de cada bloco para o monitor do editor (memória compartilhada)
+        self.monitor = None
+        if Config.AUDIO_MONITOR:
+            try:
+                self.monitor = AudioMonitor(Config.AUDIO_MONITOR, Config.AUDIO_MONITOR_CAPACITY,
+                                            create=True)
+            except (OSError, ValueError) as e:
+                print(f"Error creating audio monitor: {e}")
         
         self._start_audio_thread()
     
@@ -25,35 +72,76 @@ class AudioAnalyzer:
         self.audio_thread.start()
     
     def _audio_callback(self, indata, frames, time, status):
-        self.audio_queue.put(indata.copy())
+        self.metrics.record_status(status)
+        try:
+            self.audio_queue.put_nowait((perf_counter(), indata.copy()))
+        except queue.Full:
+            self.metrics.record_drop()
     
     def _audio_capture(self):
-        with sd.InputStream(
-            channels=self.channels,
-            samplerate=self.sample_rate,
-            blocksize=self.block_size,
-            callback=self._audio_callback
-        ):
-            while self.running:
-                try:
-                    audio_data = self.audio_queue.get(timeout=1.0)
-                    self.analyze_audio(audio_data)
-                except queue.Empty:
-                    continue
+        try:
+            self.source.start(self._audio_callback)
+        except Exception as e:
+            # Sem dispositivo de entrada o jogo segue em silêncio
+            print(f"Error starting audio source '{self.source.name}': {e}")
+            self.source = NullSource(sample_rate=self.sample_rate, block_size=self.block_size)
+        
+        while self.running:
+            try:
+                captured_at, audio_data = self.audio_queue.get(timeout=0.1)
+            except queue.Empty:
+                self.on_idle()
+                continue
+            
+            started = perf_counter()
+            self.analyze_audio(audio_data)
+            self.volume_time = captured_at
+            self.metrics.record_block(captured_at, self.audio_queue.qsize(),
+                                      perf_counter() - started)
+            if self.monitor:
+                self._publish_monitor(captured_at)
+            self.on_analysis()
     
     def analyze_audio(self, audio_data):
-        self.volume = float(np.sqrt(np.mean(audio_data**2)))
+        features = self.pipeline.process(audio_data)
+        self.volume = float(features.get(Config.AUDIO_VOLUME_FEATURE, 0.0))
         self.is_beat = self.volume > Config.INTENSE_THRESHOLD
     
+    def _publish_monitor(self, captured_at):
+        features = self.features
+        self.monitor.write(captured_at, float(features.get('level', 0.0)), self.volume,
+                           Config.VOID_THRESHOLD, Config.INTENSE_THRESHOLD, self.is_beat,
+                           volume_state(self.volume), features.get('bands', ()),
+                           features.get('spectrum', ()))
+    
+    def on_analysis(self):
+        """Chamado após cada bloco analisado (ponto de extensão)"""
+        pass
+    
+    def on_idle(self):
+        """Chamado quando nenhum bloco chegou em 0,1 s (ponto de extensão)"""
+        pass
+    
+    def read_volume(self):
+        """Lê o volume registrando há quanto tempo ele foi capturado"""
+        self.metrics.record_volume_read(self.volume_time)
+        return self.volume
+    
     def get_state(self):
-        if self.volume < Config.VOID_THRESHOLD:
-            return "void"
-        elif self.volume < Config.INTENSE_THRESHOLD:
-            return "ambient"
-        else:
-            return "intense"
-    
-    def stop(self):
+        return volume_state(self.volume)
+    
+    def get_metrics(self):
+        metrics = self.metrics.snapshot()
+        metrics['dsp_overruns'] = self.pipeline.overruns
+        metrics['stages'] = self.pipeline.get_timings()
+        return metrics
+    
+    def stop(self, timeout=1.0):
+        """Encerra a captura; nunca espera mais que timeout por etapa"""
         self.running = False
+        self.source.stop(timeout)
         if hasattr(self, 'audio_thread'):
-            self.audio_thread.join()
\ No newline at end of file
+            self.audio_thread.join(timeout)
+        if self.monitor:
+            self.monitor.close()
+            self.monitor = None
\ No newline at end of file
@@ -0,0 +1,256 @@
+# src/audio/dsp.py
+import time
+import numpy as np
+
+class Stage:
+    """Etapa do pipeline de DSP, executada uma vez por bloco.
+    
+    setup() aloca os buffers uma única vez; process() trabalha in-place no
+    bloco mono (float32) e publica resultados no dict features.
+    """
+    name = "stage"
+    
+    def __init__(self, label=None, **params):
+        self.label = label or self.name
+        self.params = params
+        self.time_ms = 0.0
+        self.time_avg_ms = 0.0
+    
+    def setup(self, sample_rate, block_size):
+        self.sample_rate = sample_rate
+        self.block_size = block_size
+        self.block_time = block_size / sample_rate
+    
+    def smoothing(self, seconds):
+        """Coeficiente de suavização por bloco para uma constante de tempo"""
+        if seconds <= 0:
+            return 1.0
+        return 1.0 - np.exp(-self.block_time / seconds)
+    
+    def process(self, block, features):
+        raise NotImplementedError
+
+class DCRemoval(Stage):
+    """Remove o offset DC estimado pela média móvel dos blocos"""
+    name = "dc_removal"
+    
+    def setup(self, sample_rate, block_size):
+        super().setup(sample_rate, block_size)
+        self.alpha = self.smoothing(self.params.get('time', 0.5))
+        self.offset = 0.0
+    
+    def process(self, block, features):
+        self.offset += self.alpha * (float(block.mean()) - self.offset)
+        np.subtract(block, self.offset, out=block)
+
+class AutoGain(Stage):
+    """Controle automático de ganho: leva o RMS médio ao nível alvo.
+    
+    O ganho sobe devagar (release) e desce rápido (attack) para não estourar
+    em picos; abaixo do gate o ganho é congelado para não amplificar silêncio.
+    """
+    name = "agc"
+    
+    def setup(self, sample_rate, block_size):
+        super().setup(sample_rate, block_size)
+        self.target = self.params.get('target', 0.06)
+        self.gate = self.params.get('gate', 0.002)
+        self.min_gain = self.params.get('min_gain', 0.1)
+        self.max_gain = self.params.get('max_gain', 20.0)
+        self.attack = self.smoothing(self.params.get('attack', 0.5))
+        self.release = self.smoothing(self.params.get('release', 5.0))
+        self.gain = 1.0
+        self.scratch = np.zeros(block_size, dtype=np.float32)
+    
+    def process(self, block, features):
+        np.square(block, out=self.scratch)
+        rms = float(np.sqrt(self.scratch.mean()))
+        if rms > self.gate:
+            desired = min(self.max_gain, max(self.min_gain, self.target / rms))
+            coeff = self.attack if desired < self.gain else self.release
+            self.gain += coeff * (desired - self.gain)
+        np.multiply(block, self.gain, out=block)
+        features['agc_gain'] = self.gain
+
+class Level(Stage):
+    """Nível RMS do bloco"""
+    name = "level"
+    
+    def setup(self, sample_rate, block_size):
+        super().setup(sample_rate, block_size)
+        self.output = self.params.get('output', 'level')
+        self.scratch = np.zeros(block_size, dtype=np.float32)
+    
+    def process(self, block, features):
+        np.square(block, out=self.scratch)
+        features[self.output] = float(np.sqrt(self.scratch.mean()))
+
+class EnvelopeFollower(Stage):
+    """Seguidor de envoltória (attack/release) sobre uma feature"""
+    name = "envelope"
+    
+    def setup(self, sample_rate, block_size):
+        super().setup(sample_rate, block_size)
+        self.input = self.params.get('input', 'level')
+        self.output = self.params.get('output', 'envelope')
+        self.attack = self.smoothing(self.params.get('attack', 0.01))
+        self.release = self.smoothing(self.params.get('release', 0.3))
+        self.value = 0.0
+    
+    def process(self, block, features):
+        target = features.get(self.input, 0.0)
+        coeff = self.attack if target > self.value else self.release
+        self.value += coeff * (target - self.value)
+        features[self.output] = self.value
+
+class BandEnergy(Stage):
+    """Energia RMS por banda de frequência, via FFT janelada do bloco"""
+    name = "bands"
+    
+    DEFAULT_BANDS = [[20, 250], [250, 2000], [2000, 8000]]
+    
+    def setup(self, sample_rate, block_size):
+        super().setup(sample_rate, block_size)
+        self.output = self.params.get('output', 'bands')
+        bands = self.params.get('bands', self.DEFAULT_BANDS)
+        self.window = np.hanning(block_size).astype(np.float32)
+        self.windowed = np.zeros(block_size, dtype=np.float32)
+        
+        # Índices de bin pré-calculados: cada banda é uma fatia do espectro
+        freqs = np.fft.rfftfreq(block_size, 1 / sample_rate)
+        self.slices = []
+        for low, high in bands:
+            start = int(np.searchsorted(freqs, low))
+            end = max(int(np.searchsorted(freqs, high)), start + 1)
+            self.slices.append((start, end))
+        self.norm = 2.0 / self.window.sum()
+        self.energies = np.zeros(len(bands), dtype=np.float64)
+    
+    def process(self, block, features):
+        np.multiply(block, self.window, out=self.windowed)
+        spectrum = np.abs(np.fft.rfft(self.windowed))
+        for i, (start, end) in enumerate(self.slices):
+            self.energies[i] = np.sqrt(np.mean(np.square(spectrum[start:end]))) * self.norm
+        features[self.output] = self.energies
+
+class Spectrum(Stage):
+    """Espectro reduzido a poucas faixas logarítmicas (monitor do editor)"""
+    name = "spectrum"
+    
+    def setup(self, sample_rate, block_size):
+        super().setup(sample_rate, block_size)
+        self.output = self.params.get('output', 'spectrum')
+        bins = self.params.get('bins', 32)
+        low = self.params.get('low', 30)
+        high = min(self.params.get('high', 16000), sample_rate / 2)
+        self.window = np.hanning(block_size).astype(np.float32)
+        self.windowed = np.zeros(block_size, dtype=np.float32)
+        
+        # Bordas log-espaçadas viram índices de bin; reduceat soma cada faixa
+        freqs = np.fft.rfftfreq(block_size, 1 / sample_rate)
+        edges = np.searchsorted(freqs, np.geomspace(low, high, bins + 1))
+        edges = np.maximum(edges, np.arange(len(edges)) + edges[0])
+        self.starts = edges[:-1]
+        self.end = edges[-1]
+        self.counts = np.maximum(np.diff(edges), 1)
+        self.norm = 2.0 / self.window.sum()
+        self.values = np.zeros(bins, dtype=np.float64)
+    
+    def process(self, block, features):
+        np.multiply(block, self.window, out=self.windowed)
+        power = np.square(np.abs(np.fft.rfft(self.windowed)))
+        sums = np.add.reduceat(power[:self.end], self.starts)
+        np.sqrt(sums / self.counts, out=self.values)
+        self.values *= self.norm
+        features[self.output] = self.values
+
+class Smoother(Stage):
+    """Média móvel exponencial de features (escalares ou arrays)"""
+    name = "smoother"
+    
+    def setup(self, sample_rate, block_size):
+        super().setup(sample_rate, block_size)
+        self.inputs = self.params.get('inputs', ['level'])
+        self.suffix = self.params.get('suffix', '_smooth')
+        self.alpha = self.smoothing(self.params.get('time', 0.1))
+        self.values = {}
+    
+    def process(self, block, features):
+        for name in self.inputs:
+            if name not in features:
+                continue
+            value = features[name]
+            current = self.values.get(name)
+            if current is None:
+                current = np.array(value, dtype=np.float64)
+                self.values[name] = current
+            current += self.alpha * (value - current)
+            features[name + self.suffix] = current if current.ndim else float(current)
+
+STAGES = {
+    stage.name: stage
+    for stage in (DCRemoval, AutoGain, Level, EnvelopeFollower, BandEnergy, Spectrum, Smoother)
+}
+
+class DSPPipeline:
+    """Sequência de etapas configurada por dados, ex.:
+        
+        [{"stage": "dc_removal"}, {"stage": "agc", "target": 0.06},
+         {"stage": "level"}, {"stage": "envelope", "release": 0.3}]
+    
+    Cada etapa registra seu tempo (use "label" para distinguir etapas
+    repetidas); overruns conta blocos que passaram do prazo (a duração do
+    próprio bloco).
+    """
+    
+    def __init__(self, stages, sample_rate, block_size):
+        self.stages = stages
+        self.sample_rate = sample_rate
+        self.features = {}
+        self.overruns = 0
+        self.blocks = 0
+        self._setup(block_size)
+    
+    @classmethod
+    def from_config(cls, config, sample_rate, block_size):
+        stages = []
+        for entry in config:
+            params = dict(entry)
+            kind = params.pop('stage')
+            if kind not in STAGES:
+                raise ValueError(f"Unknown DSP stage: {kind}")
+            stages.append(STAGES[kind](**params))
+        return cls(stages, sample_rate, block_size)
+    
+    def _setup(self, block_size):
+        self.block_size = block_size
+        self.deadline_ms = block_size / self.sample_rate * 1000
+        self.mono = np.zeros(block_size, dtype=np.float32)
+        for stage in self.stages:
+            stage.setup(self.sample_rate, block_size)
+    
+    def process(self, block):
+        """Processa um bloco (frames, channels) e retorna o dict de features"""
+        if len(block) != self.block_size:
+            self._setup(len(block))
+        
+        start = time.perf_counter()
+        if block.ndim > 1:
+            np.mean(block, axis=1, out=self.mono)
+        else:
+            self.mono[:] = block
+        
+        for stage in self.stages:
+            stage_start = time.perf_counter()
+            stage.process(self.mono, self.features)
+            stage.time_ms = (time.perf_counter() - stage_start) * 1000
+            stage.time_avg_ms += 0.05 * (stage.time_ms - stage.time_avg_ms)
+        
+        self.blocks += 1
+        if (time.perf_counter() - start) * 1000 > self.deadline_ms:
+            self.overruns += 1
+        return self.features
+    
+    def get_timings(self):
+        """Tempo médio (ms) por etapa"""
+        return {stage.label: stage.time_avg_ms for stage in self.stages}
\ No newline at end of file
@@ -0,0 +1,218 @@
+# src/audio/effects.py
+import math
+import os
+import time
+import zlib
+import numpy as np
+import pygame
+from src.config import Config
+from src.utils import bundle
+
+# Efeitos sonoros: prioridade (maior rouba vozes de menor) e volume base
+SFX_DEFINITIONS = {
+    'laser':     {'priority': 0, 'volume': 0.35},
+    'hit':       {'priority': 1, 'volume': 0.5},
+    'explosion': {'priority': 2, 'volume': 0.7},
+    'powerup':   {'priority': 3, 'volume': 0.8},
+    'damage':    {'priority': 4, 'volume': 0.9},
+}
+
+# Formato do mixer (bits com sinal) -> dtype do NumPy
+MIXER_DTYPES = {
+    -8: np.int8,
+    8: np.uint8,
+    -16: np.int16,
+    16: np.uint16,
+    32: np.float32,
+}
+
+class SoundBank:
+    """Decodifica todos os efeitos sonoros uma única vez, no carregamento.
+    
+    Usa assets/sfx/<nome>.wav quando existir; caso contrário gera o som
+    proceduralmente, assim como os sprites do jogo.
+    """
+    
+    def __init__(self, sfx_dir=os.path.join('assets', 'sfx')):
+        self.sfx_dir = sfx_dir
+        self.sounds = {}
+    
+    def load(self, names):
+        freq, size, channels = pygame.mixer.get_init()
+        for name in names:
+            path = os.path.join(self.sfx_dir, f"{name}.wav")
+            if bundle.exists(path):
+                self.sounds[name] = pygame.mixer.Sound(bundle.stream(path))
+            else:
+                samples = self._synthesize(name, freq)
+                self.sounds[name] = self._make_sound(samples, size, channels)
+        return self
+    
+    def get(self, name):
+        return self.sounds.get(name)
+    
+    def _make_sound(self, samples, size, channels):
+        dtype = MIXER_DTYPES.get(size, np.int16)
+        if dtype == np.float32:
+            data = samples.astype(np.float32)
+        else:
+            info = np.iinfo(dtype)
+            # Converte [-1, 1] para a faixa inteira do mixer
+            scaled = samples * (info.max - info.min) / 2 + (info.max + info.min + 1) / 2
+            data = np.clip(scaled, info.min, info.max).astype(dtype)
+        if channels > 1:
+            data = np.repeat(data[:, None], channels, axis=1)
+        return pygame.sndarray.make_sound(np.ascontiguousarray(data))
+    
+    def _synthesize(self, name, freq):
+        rng = np.random.default_rng(zlib.crc32(name.encode()))
+        
+        def timeline(duration):
+            return np.arange(int(freq * duration)) / freq
+        
+        if name == 'laser':
+            # Varredura descendente com onda quadrada
+            t = timeline(0.12)
+            pitch = 1400 - 900 * t / t[-1]
+            wave = np.sign(np.sin(2 * np.pi * np.cumsum(pitch) / freq))
+            return 0.4 * wave * np.exp(-t * 18)
+        
+        elif name == 'hit':
+            t = timeline(0.05)
+            return rng.uniform(-1, 1, len(t)) * np.exp(-t * 80)
+        
+        elif name == 'explosion':
+            # Ruído filtrado (média móvel) com decaimento longo
+            t = timeline(0.6)
+            noise = np.convolve(rng.uniform(-1, 1, len(t)), np.ones(12) / 12, mode='same')
+            return 2.5 * noise * np.exp(-t * 6)
+        
+        elif name == 'powerup':
+            # Arpejo ascendente
+            t = timeline(0.3)
+            steps = np.array([523.25, 659.25, 783.99, 1046.5])
+            pitch = steps[np.minimum((t / 0.075).astype(int), len(steps) - 1)]
+            return 0.5 * np.sin(2 * np.pi * np.cumsum(pitch) / freq) * np.exp(-t * 4)
+        
+        else:  # damage
+            t = timeline(0.25)
+            pitch = 160 - 100 * t / t[-1]
+            return 0.8 * np.sin(2 * np.pi * np.cumsum(pitch) / freq) * np.exp(-t * 10)
+
+class SFXMixer:
+    """Toca efeitos com um pool fixo de canais e roubo de voz por prioridade.
+    
+    trigger() só agenda o efeito; flush(), chamado uma vez por frame, junta
+    disparos repetidos do mesmo efeito numa única voz com volume reforçado
+    (20 explosões num frame viram uma voz mais forte, não 20 vozes).
+    """
+    
+    def __init__(self, num_channels=None):
+        self.enabled = False
+        self.num_channels = num_channels or Config.SFX_CHANNELS
+        self.bank = SoundBank()
+        self.voices = []
+        self.pending = {}
+        
+        # Métricas de latência (ms) e de uso do pool
+        self.latency_last = 0.0
+        self.latency_avg = 0.0
+        self.latency_max = 0.0
+        self.output_latency = 0.0
+        self.played = 0
+        self.collapsed = 0
+        self.stolen = 0
+        self.dropped = 0
+        
+        try:
+            if not pygame.mixer.get_init():
+                pygame.mixer.init()
+            pygame.mixer.set_num_channels(self.num_channels)
+            pygame.mixer.set_reserved(self.num_channels)
+            self.bank.load(SFX_DEFINITIONS.keys())
+        except pygame.error as e:
+            print(f"Error initializing sound effects: {e}")
+            return
+        
+        self.voices = [
+            {'channel': pygame.mixer.Channel(i), 'priority': -1, 'started': 0.0}
+            for i in range(self.num_channels)
+        ]
+        freq = pygame.mixer.get_init()[0]
+        self.output_latency = Config.SFX_BUFFER / freq * 1000
+        self.enabled = True
+    
+    def trigger(self, name, volume=1.0):
+        """Agenda um efeito para o próximo flush()"""
+        if not self.enabled:
+            return
+        pending = self.pending.get(name)
+        if pending is None:
+            self.pending[name] = [1, volume, time.perf_counter()]
+        else:
+            pending[0] += 1
+            pending[1] = max(pending[1], volume)
+            self.collapsed += 1
+    
+    def flush(self):
+        """Toca os efeitos agendados neste frame"""
+        if not self.pending:
+            return
+        now = time.perf_counter()
+        
+        # Mais prioritários primeiro, para que não sejam roubados no mesmo frame
+        for name, (count, volume, triggered) in sorted(
+                self.pending.items(),
+                key=lambda item: -SFX_DEFINITIONS[item[0]]['priority']):
+            definition = SFX_DEFINITIONS[name]
+            voice = self._acquire_voice(definition['priority'])
+            if voice is None:
+                self.dropped += 1
+                continue
+            
+            # Disparos agrupados somam de forma logarítmica
+            layered = definition['volume'] * volume * (1 + 0.25 * math.log2(count))
+            voice['channel'].play(self.bank.get(name))
+            voice['channel'].set_volume(min(1.0, layered))
+            voice['priority'] = definition['priority']
+            voice['started'] = now
+            self._record_latency(now - triggered)
+        
+        self.pending.clear()
+    
+    def _acquire_voice(self, priority):
+        victim = None
+        for voice in self.voices:
+            if not voice['channel'].get_busy():
+                return voice
+            # Candidata ao roubo: menor prioridade, depois a mais antiga
+            if victim is None or (voice['priority'], voice['started']) < (victim['priority'], victim['started']):
+                victim = voice
+        
+        if victim is not None and victim['priority'] <= priority:
+            victim['channel'].stop()
+            self.stolen += 1
+            return victim
+        return None
+    
+    def _record_latency(self, seconds):
+        latency = seconds * 1000 + self.output_latency
+        self.played += 1
+        self.latency_last = latency
+        self.latency_max = max(self.latency_max, latency)
+        self.latency_avg += (latency - self.latency_avg) / self.played
+    
+    def get_stats(self):
+        """Métricas de latência (ms) e do pool de vozes"""
+        return {
+            'enabled': self.enabled,
+            'voices_busy': sum(1 for v in self.voices if v['channel'].get_busy()),
+            'voices_total': len(self.voices),
+            'latency_last_ms': self.latency_last,
+            'latency_avg_ms': self.latency_avg,
+            'latency_max_ms': self.latency_max,
+            'played': self.played,
+            'collapsed': self.collapsed,
+            'stolen': self.stolen,
+            'dropped': self.dropped,
+        }
\ No newline at end of file
@@ -0,0 +1,81 @@
+# src/audio/metrics.py
+import time
+from collections import deque
+
+class AudioMetrics:
+    """Métricas de saúde do pipeline de áudio, atualizadas ao vivo.
+    
+    Tempos em milissegundos. A captura (callback) e a análise rodam em
+    threads diferentes do jogo; cada campo tem um único escritor, então a
+    leitura via snapshot() não precisa de lock.
+    """
+    
+    # Campos numéricos de snapshot(), na ordem publicada pelo AudioProcessAnalyzer
+    FIELDS = (
+        'blocks', 'dropped', 'overflows', 'status_errors',
+        'queue_depth', 'queue_depth_max',
+        'latency_ms', 'latency_avg_ms', 'latency_max_ms',
+        'analysis_ms', 'analysis_avg_ms', 'analysis_max_ms',
+        'deadline_ms', 'volume_age_ms',
+    )
+    
+    def __init__(self, sample_rate, block_size, window=120):
+        self.deadline_ms = block_size / sample_rate * 1000
+        self.window = window
+        self.reset()
+    
+    def reset(self):
+        self.blocks = 0
+        self.dropped = 0
+        self.overflows = 0
+        self.status_errors = 0
+        self.queue_depth = 0
+        self.queue_depth_max = 0
+        self.latencies = deque(maxlen=self.window)
+        self.analysis_times = deque(maxlen=self.window)
+        self.volume_age_ms = 0.0
+    
+    def record_status(self, status):
+        """Conta problemas reportados pelo callback do dispositivo"""
+        if not status:
+            return
+        self.status_errors += 1
+        if getattr(status, 'input_overflow', False):
+            self.overflows += 1
+    
+    def record_drop(self):
+        self.dropped += 1
+    
+    def record_block(self, captured_at, queue_depth, analysis_seconds):
+        """Registra um bloco consumido: latência captura->consumo e custo da análise"""
+        now = time.perf_counter()
+        self.blocks += 1
+        self.queue_depth = queue_depth
+        self.queue_depth_max = max(self.queue_depth_max, queue_depth)
+        self.latencies.append((now - captured_at) * 1000)
+        self.analysis_times.append(analysis_seconds * 1000)
+    
+    def record_volume_read(self, captured_at):
+        """Idade do volume lido pelo jogo, desde a captura do bloco que o gerou"""
+        if captured_at:
+            self.volume_age_ms = (time.perf_counter() - captured_at) * 1000
+    
+    def snapshot(self):
+        latencies = list(self.latencies)
+        analysis = list(self.analysis_times)
+        return {
+            'blocks': self.blocks,
+            'dropped': self.dropped,
+            'overflows': self.overflows,
+            'status_errors': self.status_errors,
+            'queue_depth': self.queue_depth,
+            'queue_depth_max': self.queue_depth_max,
+            'latency_ms': latencies[-1] if latencies else 0.0,
+            'latency_avg_ms': sum(latencies) / len(latencies) if latencies else 0.0,
+            'latency_max_ms': max(latencies) if latencies else 0.0,
+            'analysis_ms': analysis[-1] if analysis else 0.0,
+            'analysis_avg_ms': sum(analysis) / len(analysis) if analysis else 0.0,
+            'analysis_max_ms': max(analysis) if analysis else 0.0,
+            'deadline_ms': self.deadline_ms,
+            'volume_age_ms': self.volume_age_ms,
+        }
\ No newline at end of file
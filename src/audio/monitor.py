@@ -0,0 +1,102 @@
+# src/audio/monitor.py
+import struct
+from multiprocessing import resource_tracker, shared_memory
+from src.config import Config
+
+# Ring buffer em memória compartilhada com as features de cada bloco
+# analisado, para o monitor de áudio do editor.
+#
+# Só a thread de análise escreve: grava o registro no slot e depois avança o
+# índice de escrita, sem locks (o custo por bloco é um pack_into). O leitor
+# pega os registros entre o último índice lido e o atual; nunca toca nas
+# amostras cruas, só nas features já reduzidas (nível, bandas, espectro).
+
+MAGIC = b'SAMN'
+VERSION = 1
+MAX_BANDS = 8
+MAX_SPECTRUM = 64
+STATES = Config.AUDIO_STATES
+
+# magic, versão, capacidade, tamanho do registro
+HEADER = struct.Struct('<4sHHI')
+INDEX = struct.Struct('<Q')
+INDEX_OFFSET = 16
+DATA_OFFSET = 32
+# instante de captura, nível, volume, limiares void/intense, beat, estado,
+# nº de bandas, nº de faixas do espectro, bandas, espectro
+RECORD = struct.Struct(f'<d4f4B{MAX_BANDS}f{MAX_SPECTRUM}f')
+PADDING = (0.0,) * (MAX_BANDS + MAX_SPECTRUM)
+
+class AudioMonitor:
+    def __init__(self, name, capacity=512, create=False):
+        if create:
+            size = DATA_OFFSET + capacity * RECORD.size
+            try:
+                self.shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+            except FileExistsError:
+                # Sobra de uma execução que não fechou: substitui
+                stale = shared_memory.SharedMemory(name=name)
+                stale.close()
+                stale.unlink()
+                self.shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+            HEADER.pack_into(self.shm.buf, 0, MAGIC, VERSION, capacity, RECORD.size)
+            INDEX.pack_into(self.shm.buf, INDEX_OFFSET, 0)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+            # Só o jogo apaga a memória; o leitor não registra no resource_tracker
+            resource_tracker.unregister(self.shm._name, "shared_memory")
+            magic, version, capacity, record_size = HEADER.unpack_from(self.shm.buf, 0)
+            if magic != MAGIC or version != VERSION or record_size != RECORD.size:
+                self.shm.close()
+                raise ValueError(f"Not an audio monitor buffer: {name}")
+        self.owner = create
+        self.capacity = capacity
+        self.index = 0
+        self.read_index = INDEX.unpack_from(self.shm.buf, INDEX_OFFSET)[0]
+    
+    def write(self, timestamp, level, volume, void_threshold, intense_threshold,
+              beat, state, bands=(), spectrum=()):
+        """Publica as features de um bloco (thread de análise)"""
+        bands = list(bands[:MAX_BANDS])
+        spectrum = list(spectrum[:MAX_SPECTRUM])
+        values = bands + [0.0] * (MAX_BANDS - len(bands)) + spectrum
+        values += PADDING[:MAX_SPECTRUM - len(spectrum)]
+        offset = DATA_OFFSET + (self.index % self.capacity) * RECORD.size
+        RECORD.pack_into(self.shm.buf, offset, timestamp, level, volume, void_threshold,
+                         intense_threshold, beat, STATES.index(state), len(bands),
+                         len(spectrum), *values)
+        self.index += 1
+        INDEX.pack_into(self.shm.buf, INDEX_OFFSET, self.index)
+    
+    def read_new(self, limit=None):
+        """Registros publicados desde a última leitura (os mais antigos que a
+        capacidade do ring já foram sobrescritos e são pulados)"""
+        index = INDEX.unpack_from(self.shm.buf, INDEX_OFFSET)[0]
+        start = max(self.read_index, index - self.capacity + 1)
+        if limit:
+            start = max(start, index - limit)
+        records = []
+        for i in range(start, index):
+            values = RECORD.unpack_from(self.shm.buf, DATA_OFFSET + (i % self.capacity) * RECORD.size)
+            n_bands, n_spectrum = values[7], values[8]
+            records.append({
+                'timestamp': values[0],
+                'level': values[1],
+                'volume': values[2],
+                'void_threshold': values[3],
+                'intense_threshold': values[4],
+                'beat': bool(values[5]),
+                'state': STATES[values[6]],
+                'bands': values[9:9 + n_bands],
+                'spectrum': values[9 + MAX_BANDS:9 + MAX_BANDS + n_spectrum],
+            })
+        self.read_index = index
+        return records
+    
+    def close(self):
+        self.shm.close()
+        if self.owner:
+            try:
+                self.shm.unlink()
+            except FileNotFoundError:
+                pass
\ No newline at end of file
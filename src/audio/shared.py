@@ -0,0 +1,73 @@
+# src/audio/shared.py
+from multiprocessing import shared_memory
+import numpy as np
+
+class SeqlockSnapshot:
+    """Snapshot de campos float64 em memória compartilhada, protegido por seqlock.
+    
+    Um único escritor incrementa o contador de sequência antes e depois de
+    gravar (ímpar = escrita em andamento). Leitores nunca bloqueiam: copiam
+    os campos e só aceitam a cópia se a sequência não mudou no meio.
+    """
+    
+    def __init__(self, fields, name=None, create=False):
+        self.fields = tuple(fields)
+        self.index = {field: i for i, field in enumerate(self.fields)}
+        size = 8 * (len(self.fields) + 1)
+        
+        if create:
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+        self.owner = create
+        
+        self.seq = np.ndarray((1,), dtype=np.uint64, buffer=self.shm.buf, offset=0)
+        self.values = np.ndarray((len(self.fields),), dtype=np.float64,
+                                 buffer=self.shm.buf, offset=8)
+        if create:
+            self.seq[0] = 0
+            self.values[:] = 0
+        
+        self._last = np.zeros(len(self.fields), dtype=np.float64)
+    
+    @property
+    def name(self):
+        return self.shm.name
+    
+    def write(self, values):
+        """Publica um dict campo -> valor (campos ausentes mantêm o valor anterior)"""
+        self.seq[0] += 1
+        for field, value in values.items():
+            self.values[self.index[field]] = value
+        self.seq[0] += 1
+    
+    def recover(self):
+        """Fecha uma escrita interrompida (escritor morto entre os dois
+        incrementos): leva a sequência ao próximo valor par"""
+        if self.seq is not None:
+            self.seq[0] += int(self.seq[0]) & 1
+    
+    def read(self, retries=100):
+        """Retorna uma cópia consistente dos campos (ou a última obtida)"""
+        if self.values is None:
+            return self._last
+        for _ in range(retries):
+            before = int(self.seq[0])
+            if before & 1:
+                continue
+            snapshot = self.values.copy()
+            if int(self.seq[0]) == before:
+                self._last = snapshot
+                return snapshot
+        return self._last
+    
+    def read_dict(self):
+        return dict(zip(self.fields, self.read().tolist()))
+    
+    def close(self):
+        # Solta as views antes de fechar o mapeamento
+        self.seq = None
+        self.values = None
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
\ No newline at end of file
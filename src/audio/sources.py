@@ -0,0 +1,270 @@
+# src/audio/sources.py
+import threading
+import time
+import wave
+import numpy as np
+
+class AudioSource:
+    """Interface base das fontes de áudio usadas pelo AudioAnalyzer.
+    
+    Uma fonte entrega blocos float32 com shape (frames, channels) chamando
+    callback(indata, frames, time_info, status), a mesma assinatura usada
+    pelo sounddevice. start() não bloqueia e stop() sempre retorna dentro
+    do timeout informado.
+    """
+    name = "base"
+    runtime_attrs = ()
+    
+    def __init__(self, sample_rate=44100, block_size=2048, channels=1):
+        self.sample_rate = sample_rate
+        self.block_size = block_size
+        self.channels = channels
+        self.running = False
+    
+    def __getstate__(self):
+        # Só a configuração atravessa processos; locks, threads e streams
+        # são recriados do outro lado por _init_runtime()
+        state = self.__dict__.copy()
+        for key in self.runtime_attrs:
+            state.pop(key, None)
+        state['running'] = False
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._init_runtime()
+    
+    def _init_runtime(self):
+        pass
+    
+    def start(self, callback):
+        raise NotImplementedError
+    
+    def stop(self, timeout=1.0):
+        self.running = False
+
+class NullSource(AudioSource):
+    """Fonte vazia: nunca entrega blocos (volume permanece em zero)"""
+    name = "null"
+    
+    def start(self, callback):
+        self.running = True
+
+class MicrophoneSource(AudioSource):
+    """Captura do dispositivo de entrada via sounddevice"""
+    name = "microphone"
+    runtime_attrs = ('stream', '_lock')
+    
+    def __init__(self, device=None, **kwargs):
+        super().__init__(**kwargs)
+        self.device = device
+        self._init_runtime()
+    
+    def _init_runtime(self):
+        self.stream = None
+        self._lock = threading.Lock()
+    
+    def start(self, callback):
+        # Importado aqui para que as outras fontes funcionem sem PortAudio
+        import sounddevice as sd
+        
+        stream = sd.InputStream(
+            device=self.device,
+            channels=self.channels,
+            samplerate=self.sample_rate,
+            blocksize=self.block_size,
+            callback=callback
+        )
+        with self._lock:
+            self.stream = stream
+            self.running = True
+        stream.start()
+    
+    def stop(self, timeout=1.0):
+        with self._lock:
+            stream = self.stream
+            self.stream = None
+            self.running = False
+        if stream is None:
+            return
+        
+        # abort/close podem travar com o dispositivo bloqueado, então rodam
+        # numa thread auxiliar e o tempo de espera é limitado
+        def close():
+            try:
+                stream.abort()
+                stream.close()
+            except Exception as e:
+                print(f"Error closing audio stream: {e}")
+        
+        closer = threading.Thread(target=close, daemon=True)
+        closer.start()
+        closer.join(timeout)
+
+class GeneratedSource(AudioSource):
+    """Base das fontes que geram blocos numa thread própria, em tempo real"""
+    runtime_attrs = ('_stop_event', '_thread')
+    
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.position = 0  # Índice da próxima amostra
+        self._init_runtime()
+    
+    def _init_runtime(self):
+        self._stop_event = threading.Event()
+        self._thread = None
+    
+    def start(self, callback):
+        self._stop_event.clear()
+        self.running = True
+        self._thread = threading.Thread(target=self._run, args=(callback,), daemon=True)
+        self._thread.start()
+    
+    def _run(self, callback):
+        block_time = self.block_size / self.sample_rate
+        next_time = time.perf_counter()
+        while not self._stop_event.is_set():
+            block = self.generate(self.block_size)
+            self.position += self.block_size
+            callback(block, self.block_size, None, None)
+            
+            # Mantém o ritmo de um dispositivo real
+            next_time += block_time
+            delay = next_time - time.perf_counter()
+            if delay > 0:
+                self._stop_event.wait(delay)
+            else:
+                next_time = time.perf_counter()
+    
+    def generate(self, frames):
+        raise NotImplementedError
+    
+    def stop(self, timeout=1.0):
+        self.running = False
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+class FileSource(GeneratedSource):
+    """Reproduz um arquivo WAV PCM como se fosse a entrada de áudio"""
+    name = "file"
+    
+    def __init__(self, path, loop=True, **kwargs):
+        super().__init__(**kwargs)
+        self.path = path
+        self.loop = loop
+        self.samples = self._load(path)
+    
+    def _load(self, path):
+        with wave.open(path, 'rb') as wav:
+            width = wav.getsampwidth()
+            channels = wav.getnchannels()
+            rate = wav.getframerate()
+            raw = wav.readframes(wav.getnframes())
+        
+        if width == 1:
+            data = (np.frombuffer(raw, dtype=np.uint8).astype(np.float32) - 128) / 128
+        elif width == 2:
+            data = np.frombuffer(raw, dtype='<i2').astype(np.float32) / 32768
+        elif width == 4:
+            data = np.frombuffer(raw, dtype='<i4').astype(np.float32) / 2147483648
+        else:
+            raise ValueError(f"Unsupported WAV sample width: {width}")
+        
+        # Mixa para mono e replica nos canais pedidos
+        data = data.reshape(-1, channels).mean(axis=1)
+        if rate != self.sample_rate:
+            # Reamostragem linear simples, suficiente para análise de volume
+            duration = len(data) / rate
+            target = np.arange(int(duration * self.sample_rate)) / self.sample_rate
+            data = np.interp(target, np.arange(len(data)) / rate, data).astype(np.float32)
+        return np.repeat(data[:, None], self.channels, axis=1)
+    
+    def generate(self, frames):
+        total = len(self.samples)
+        if total == 0 or (not self.loop and self.position >= total):
+            return np.zeros((frames, self.channels), dtype=np.float32)
+        
+        indices = np.arange(self.position, self.position + frames)
+        if self.loop:
+            indices %= total
+            return self.samples[indices]
+        
+        block = np.zeros((frames, self.channels), dtype=np.float32)
+        valid = indices[indices < total]
+        block[:len(valid)] = self.samples[valid]
+        return block
+
+class SyntheticSource(GeneratedSource):
+    """Gerador determinístico de sinais de teste.
+    
+    signals é uma lista de dicts com "type" e parâmetros:
+      - tone: freq, amplitude
+      - noise: amplitude
+      - noise_burst: bpm, duration (s), amplitude
+      - click: bpm, amplitude, freq
+    A mesma seed sempre produz exatamente os mesmos blocos.
+    """
+    name = "synthetic"
+    
+    DEFAULT_SIGNALS = [
+        {"type": "tone", "freq": 220.0, "amplitude": 0.05},
+        {"type": "click", "bpm": 120, "amplitude": 0.5, "freq": 1000.0},
+    ]
+    
+    def __init__(self, signals=None, seed=0, **kwargs):
+        super().__init__(**kwargs)
+        self.signals = signals if signals is not None else self.DEFAULT_SIGNALS
+        self.seed = seed
+        self.rng = np.random.default_rng(seed)
+    
+    def generate(self, frames):
+        n = np.arange(self.position, self.position + frames)
+        out = np.zeros(frames, dtype=np.float64)
+        
+        for signal in self.signals:
+            kind = signal["type"]
+            amplitude = signal.get("amplitude", 0.1)
+            
+            if kind == "tone":
+                out += amplitude * np.sin(2 * np.pi * signal.get("freq", 440.0) * n / self.sample_rate)
+            
+            elif kind == "noise":
+                out += amplitude * self.rng.uniform(-1, 1, frames)
+            
+            elif kind == "noise_burst":
+                period = int(self.sample_rate * 60 / signal.get("bpm", 120))
+                length = int(self.sample_rate * signal.get("duration", 0.1))
+                mask = (n % period) < length
+                out[mask] += amplitude * self.rng.uniform(-1, 1, int(mask.sum()))
+            
+            elif kind == "click":
+                # Blip curto com decaimento exponencial a cada batida
+                period = int(self.sample_rate * 60 / signal.get("bpm", 120))
+                phase = n % period
+                mask = phase < int(self.sample_rate * 0.02)
+                t = phase[mask] / self.sample_rate
+                out[mask] += (amplitude * np.exp(-t * 250) *
+                              np.sin(2 * np.pi * signal.get("freq", 1000.0) * t))
+            
+            else:
+                raise ValueError(f"Unknown synthetic signal type: {kind}")
+        
+        block = np.clip(out, -1, 1).astype(np.float32)
+        return np.repeat(block[:, None], self.channels, axis=1)
+
+SOURCES = {
+    "null": NullSource,
+    "microphone": MicrophoneSource,
+    "file": FileSource,
+    "synthetic": SyntheticSource,
+}
+
+def create_source(kind, **options):
+    """Cria uma fonte de áudio pelo nome registrado em SOURCES"""
+    try:
+        source_class = SOURCES[kind]
+    except KeyError:
+        raise ValueError(f"Unknown audio source: {kind}")
+    return source_class(**options)
\ No newline at end of file
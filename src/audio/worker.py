@@ -0,0 +1,170 @@
+# src/audio/worker.py
+import multiprocessing
+import time
+from src.audio.analyzer import AudioAnalyzer, source_from_config, volume_state
+from src.audio.metrics import AudioMetrics
+from src.audio.shared import SeqlockSnapshot
+
+# Campos publicados pelo processo de análise (timestamp = captura do bloco)
+SNAPSHOT_FIELDS = ('volume', 'is_beat', 'timestamp', 'heartbeat') + AudioMetrics.FIELDS
+
+class _PublishingAnalyzer(AudioAnalyzer):
+    """AudioAnalyzer que publica cada análise no snapshot compartilhado"""
+    
+    def __init__(self, source, snapshot):
+        self.snapshot = snapshot
+        super().__init__(source)
+    
+    def on_analysis(self):
+        values = self.metrics.snapshot()
+        values['volume'] = self.volume
+        values['is_beat'] = float(self.is_beat)
+        values['timestamp'] = self.volume_time
+        # Único escritor do snapshot: o heartbeat sai junto com cada análise
+        values['heartbeat'] = time.perf_counter()
+        self.snapshot.write(values)
+    
+    def on_idle(self):
+        # Fonte sem blocos (null, dispositivo parado): a thread segue viva
+        self.snapshot.write({'heartbeat': time.perf_counter()})
+
+def _worker_main(shm_name, source, stop_event):
+    """Ponto de entrada do processo de captura e análise"""
+    snapshot = SeqlockSnapshot(SNAPSHOT_FIELDS, name=shm_name)
+    analyzer = _PublishingAnalyzer(source, snapshot)
+    parent = multiprocessing.parent_process()
+    try:
+        # Sai sozinho se o jogo morrer sem chamar stop()
+        while not stop_event.wait(0.25):
+            if parent is not None and not parent.is_alive():
+                break
+    finally:
+        analyzer.stop()
+        # A thread de análise ainda pode escrever se o join estourou o tempo:
+        # o mapeamento fica aberto e o SO o libera quando o processo sair
+        thread = getattr(analyzer, 'audio_thread', None)
+        if thread is None or not thread.is_alive():
+            snapshot.close()
+
+class AudioProcessAnalyzer:
+    """Mesma interface do AudioAnalyzer, com captura e análise em outro processo.
+    
+    O processo filho publica volume e is_beat num SeqlockSnapshot; o jogo lê
+    sem locks e sem disputar o GIL com o processamento NumPy. Se o filho
+    morrer, ou a thread de análise dele ficar `heartbeat_timeout` segundos
+    sem publicar (travada), ele é reiniciado, até max_restarts vezes.
+    """
+    
+    def __init__(self, source=None, max_restarts=5, heartbeat_timeout=2.0):
+        self.source = source if source is not None else source_from_config()
+        self.sample_rate = self.source.sample_rate
+        self.block_size = self.source.block_size
+        self.channels = self.source.channels
+        self.running = True
+        
+        # Recuperação de falhas
+        self.max_restarts = max_restarts
+        self.restarts = 0
+        self.check_interval = 0.5
+        self.last_check = 0
+        self.heartbeat_timeout = heartbeat_timeout
+        self.started_at = 0.0
+        
+        # "spawn" evita herdar o estado do SDL/threads do processo do jogo
+        self.context = multiprocessing.get_context("spawn")
+        self.volume_age_ms = 0.0
+        self.snapshot = SeqlockSnapshot(SNAPSHOT_FIELDS, create=True)
+        self.process = None
+        self._start_worker()
+    
+    def _start_worker(self):
+        self.stop_event = self.context.Event()
+        self.process = self.context.Process(
+            target=_worker_main,
+            args=(self.snapshot.name, self.source, self.stop_event),
+            daemon=True
+        )
+        self.started_at = time.perf_counter()
+        self.process.start()
+    
+    def _end_worker(self, timeout=1.0):
+        """Pede a parada do filho e força se ele não sair a tempo"""
+        self.stop_event.set()
+        self.process.join(timeout)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join(timeout)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join(timeout)
+    
+    def _check_worker(self):
+        now = time.perf_counter()
+        if now - self.last_check < self.check_interval:
+            return
+        self.last_check = now
+        
+        if not self.running or self.process is None:
+            return
+        if self.process.is_alive():
+            # Vivo mas sem heartbeat (a contar do início, enquanto sobe): travado
+            heartbeat = self.snapshot.read()[self.snapshot.index['heartbeat']]
+            silent = now - max(heartbeat, self.started_at)
+            if silent < self.heartbeat_timeout:
+                return
+            print(f"Audio worker stopped responding for {silent:.1f} s, restarting")
+            # Sem esperar o desligamento normal: o frame do jogo para enquanto isso
+            self._end_worker(timeout=0.1)
+        else:
+            print(f"Audio worker exited with code {self.process.exitcode}")
+        # O filho pode ter morrido no meio de uma escrita (sequência ímpar)
+        self.snapshot.recover()
+        self.snapshot.write({'volume': 0.0, 'is_beat': 0.0})
+        if self.restarts < self.max_restarts:
+            self.restarts += 1
+            self._start_worker()
+        else:
+            self.process = None
+    
+    def _read(self):
+        self._check_worker()
+        return self.snapshot.read()
+    
+    @property
+    def volume(self):
+        return float(self._read()[self.snapshot.index['volume']])
+    
+    @property
+    def is_beat(self):
+        return bool(self._read()[self.snapshot.index['is_beat']])
+    
+    def read_volume(self):
+        """Lê o volume registrando há quanto tempo ele foi capturado"""
+        values = self._read()
+        volume = float(values[self.snapshot.index['volume']])
+        captured_at = values[self.snapshot.index['timestamp']]
+        if captured_at:
+            self.volume_age_ms = (time.perf_counter() - captured_at) * 1000
+        return volume
+    
+    def get_state(self):
+        return volume_state(self.volume)
+    
+    def get_metrics(self):
+        values = self.snapshot.read_dict()
+        metrics = {field: values[field] for field in AudioMetrics.FIELDS}
+        metrics['volume_age_ms'] = self.volume_age_ms
+        metrics['worker_restarts'] = self.restarts
+        return metrics
+    
+    def stop(self, timeout=1.0):
+        """Encerra o processo filho e libera a memória compartilhada"""
+        if not self.running:
+            return
+        self.running = False
+        
+        if self.process is not None:
+            self._end_worker(timeout)
+            self.process = None
+        
+        self.snapshot.close()
\ No newline at end of file
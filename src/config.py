@@ -10,6 +10,107 @@ class Config:
     WHITE = (255, 255, 255)
     BLUE = (0, 0, 255)
     
-    # Estados de áudio
+    # Estados de áudio, do mais calmo ao mais intenso; o monitor e o replay
+    # gravam o índice nesta tupla, então a ordem faz parte dos formatos
+    AUDIO_STATES = ("void", "ambient", "intense")
     VOID_THRESHOLD = 0.02
-    INTENSE_THRESHOLD = 0.10
\ No newline at end of file
+    INTENSE_THRESHOLD = 0.10
+    
+    # Fonte de áudio: "microphone", "file", "synthetic" ou "null"
+    AUDIO_SOURCE = "microphone"
+    AUDIO_FILE = None
+    AUDIO_SAMPLE_RATE = 44100
+    AUDIO_BLOCK_SIZE = 2048
+    AUDIO_SEED = 0
+    AUDIO_QUEUE_SIZE = 8
+    
+    # Pipeline de DSP aplicado a cada bloco (ver src/audio/dsp.py) e a
+    # feature usada como volume do jogo
+    AUDIO_PIPELINE = [
+        {"stage": "dc_removal"},
+        {"stage": "agc", "target": 0.06, "gate": 0.002, "attack": 0.5, "release": 5.0},
+        {"stage": "level"},
+        {"stage": "envelope", "input": "level", "attack": 0.01, "release": 0.3},
+        {"stage": "bands"},
+        {"stage": "spectrum", "bins": 32},
+        {"stage": "smoother", "inputs": ["bands"], "time": 0.1},
+    ]
+    AUDIO_VOLUME_FEATURE = "envelope"
+    
+    # Ring buffer compartilhado com as features de cada bloco, lido pelo
+    # monitor de áudio do editor (nome da memória; None desativa)
+    AUDIO_MONITOR = "space_shooter_audio"
+    AUDIO_MONITOR_CAPACITY = 512
+    
+    # Roda captura e análise num processo separado (memória compartilhada)
+    AUDIO_PROCESS = False
+    
+    # Tuning de gameplay (dados) e recarga ao vivo quando o arquivo muda
+    TUNING_FILE = "config/tuning.json"
+    TUNING_HOT_RELOAD = True
+    # Porta local (127.0.0.1) para as alterações ao vivo do editor; None desativa
+    TUNING_PORT = 47820
+    
+    # Histórico de partidas (SQLite); None desativa
+    RUN_HISTORY_DB = "runs.db"
+    
+    # Efeitos sonoros: canais no pool e buffer do mixer (menor = menos latência)
+    SFX_CHANNELS = 16
+    SFX_BUFFER = 512
+    
+    # Presets dos emissores de partículas (explosão, fogo do motor, ...)
+    PARTICLE_PRESETS_FILE = "config/particles.json"
+    
+    # Bundle exportado pelo editor (dados, atlas e sons num arquivo só); se
+    # existir, as entradas dele substituem os arquivos soltos na carga (só a
+    # recarga ao vivo do tuning lê o arquivo solto)
+    BUNDLE_FILE = "game.bundle"
+    
+    # Padrões de movimento dos inimigos (senoides, splines, mergulhos, formações)
+    PATTERNS_FILE = "config/patterns.json"
+    
+    # Colisões de sprites pela máscara de pixels (depois do teste de rect);
+    # False volta a usar só os retângulos
+    PRECISE_COLLISIONS = True
+    
+    # Máximo de balas inimigas vivas (rajadas além disso são cortadas)
+    ENEMY_BULLET_LIMIT = 4096
+    
+    # Objetos criados antecipadamente nos pools de sprites (em segundo plano)
+    POOL_PREWARM = {'enemies': 32, 'powerups': 8, 'projectiles': 96}
+    
+    # Atlas de sprites gerado por "main.py --bake" (fallback procedural se ausente)
+    ATLAS_IMAGE = "assets/atlas.png"
+    ATLAS_MANIFEST = "assets/atlas.json"
+    
+    # Replay dos últimos segundos (kill-cam no game over e dump em caso de crash)
+    REPLAY_SECONDS = 10
+    REPLAY_KEYFRAME_INTERVAL = 60
+    REPLAY_DUMP_FILE = "crash.replay"
+    # Balas inimigas por tick no replay (além disso ficam as mais próximas do jogador)
+    REPLAY_MAX_BULLETS = 1024
+    KILLCAM_SECONDS = 3
+    
+    # Gravação de vídeo (F10 ou --record): .y4m ou diretório de PNGs, buffers
+    # pré-alocados na fila e política de descarte quando o disco não acompanha
+    RECORD_FILE = "recording.y4m"
+    RECORD_BUFFERS = 8
+    RECORD_DROP_POLICY = "drop_newest"
+    RECORD_EVERY = 1  # grava 1 a cada N frames (2 = vídeo a 30 FPS)
+    
+    # Entrada: teclas de cada ação (nomes do pygame.key.key_code), polling da
+    # fila de eventos entre frames (0 desliga), tempo que um toque fica no
+    # buffer esperando poder agir e amostras de latência por ação
+    INPUT_BINDINGS = {
+        'left': ["left", "a"],
+        'right': ["right", "d"],
+        'fire': ["space"],
+    }
+    INPUT_POLL_MS = 1
+    INPUT_BUFFER_MS = 100
+    INPUT_LATENCY_WINDOW = 120
+    
+    # Snapshots binários do mundo: quicksave (F5/F9, --resume) e o gravado
+    # automaticamente se o jogo quebrar
+    SNAPSHOT_FILE = "quicksave.snap"
+    CRASH_SNAPSHOT_FILE = "crash.snap"
\ No newline at end of file
@@ -0,0 +1,233 @@
+# src/entities/bullets.py
+import math
+import random
+import time
+import numpy as np
+from src.config import Config
+from src.graphics import atlas
+from src.graphics.sprites import BULLET_COLORS
+from src.systems import collision, tuning
+
+# Balas dos inimigos elite/chefe.
+#
+# Não são sprites: cada bala é uma linha em arrays paralelos (posição,
+# velocidade, índice do sprite), então mover, descartar as que saíram da
+# tela e testar colisão são operações numpy sobre todas de uma vez. As
+# rajadas (radial, espiral, mirada) vêm do tuning ("bullets.volleys") e
+# cada inimigo dispara pelos eventos da linha do tempo do jogo, com ritmo
+# e densidade pelo estado de áudio.
+
+BULLET_SPRITES = tuple(BULLET_COLORS)
+# Folga fora da tela antes de descartar (maior que o maior sprite de bala)
+MARGIN = 16
+
+class Gun:
+    """Uma rajada presa a um inimigo; cada disparo agenda o próximo"""
+    __slots__ = ('engine', 'enemy', 'volley', 'angle', 'handle')
+    
+    def __init__(self, engine, enemy, volley):
+        self.engine = engine
+        self.enemy = enemy
+        self.volley = volley
+        # Fase da espiral e atraso inicial sorteados: a formação não dispara em uníssono
+        self.angle = random.uniform(0, 2 * math.pi)
+        interval = engine.interval(tuning.current.volleys[volley])
+        self.handle = engine.timeline.after(random.uniform(0.3, 1.0) * interval, self.fire)
+    
+    def fire(self):
+        volley = tuning.current.volleys.get(self.volley)
+        if volley is None:
+            # Rajada removida por um reload do tuning
+            return
+        # Ainda entrando pelo topo: só espera o próximo disparo
+        if self.enemy.rect.bottom > 0:
+            self.engine.shoot(self, volley)
+        self.handle = self.engine.timeline.after(self.engine.interval(volley), self.fire)
+    
+    def cancel(self):
+        self.handle.cancel()
+
+class BulletEngine:
+    """Pool de balas em arrays (structure of arrays).
+    
+    As vivas ficam sempre em [:count]; o descarte compacta os arrays
+    mantendo a ordem, sem objeto por bala. A colisão com o jogador filtra
+    pelo retângulo em lote e só os candidatos testam a máscara.
+    """
+    
+    def __init__(self, timeline, target, capacity=256):
+        self.timeline = timeline
+        # Sprite mirado pelas rajadas "aimed" (o jogador)
+        self.target = target
+        self.count = 0
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.vx = np.zeros(capacity)
+        self.vy = np.zeros(capacity)
+        self.sprite = np.zeros(capacity, dtype=np.uint8)
+        
+        self.images = [atlas.get(f"bullet.{name}") for name in BULLET_SPRITES]
+        self.masks = [collision.masks.get(f"bullet.{name}") for name in BULLET_SPRITES]
+        self.sprite_ids = {name: i for i, name in enumerate(BULLET_SPRITES)}
+        
+        # Estado de áudio do último passo (ritmo, densidade e velocidade das rajadas)
+        self.game_state = "ambient"
+        self.volume = 0.0
+        
+        self.peak = 0
+        self.fired = 0
+        self.dropped = 0
+        self.step_ms = 0.0
+        self.step_avg_ms = 0.0
+        self.draw_avg_ms = 0.0
+    
+    def arm(self, enemy):
+        """Armas de um inimigo pelo tipo (vazio para os que não atiram)"""
+        return [Gun(self, enemy, volley)
+                for volley in tuning.current.enemy_volleys.get(enemy.enemy_type, ())]
+    
+    def interval(self, volley):
+        """Intervalo até o próximo disparo (no mínimo um frame, mesmo com o
+        tuning zerado pelo editor)"""
+        rate = max(tuning.current.bullet_rate[self.game_state], 0.01)
+        return max(volley["interval"] / rate, 1000 / Config.FPS)
+    
+    def shoot(self, gun, volley):
+        """Dispara uma rajada a partir do centro do inimigo da arma"""
+        tables = tuning.current
+        count = max(1, round(volley["count"] * tables.bullet_density[self.game_state]))
+        # Volume alto acelera as balas
+        speed = volley["speed"] * (1 + self.volume)
+        x, y = gun.enemy.rect.center
+        kind = volley["kind"]
+        
+        if kind == "aimed":
+            target = self.target.rect.center
+            aim = math.atan2(target[1] - y, target[0] - x)
+            spread = volley.get("spread", 0.0)
+            angles = aim + np.linspace(-spread / 2, spread / 2, count) if count > 1 else [aim]
+        else:
+            if kind == "spiral":
+                base = gun.angle
+                gun.angle += volley.get("spin", 0.3)
+            else:
+                base = random.uniform(0, 2 * math.pi)
+            angles = base + np.arange(count) * (2 * math.pi / count)
+        self.emit(x, y, np.asarray(angles, dtype=float), speed,
+                  self.sprite_ids.get(volley.get("sprite"), 0))
+    
+    def emit(self, x, y, angles, speed, sprite=0):
+        """Acrescenta balas saindo de (x, y) nas direções `angles`"""
+        room = max(0, Config.ENEMY_BULLET_LIMIT - self.count)
+        if len(angles) > room:
+            self.dropped += len(angles) - room
+            angles = angles[:room]
+        n = len(angles)
+        if not n:
+            return
+        while self.count + n > len(self.x):
+            self._grow()
+        part = slice(self.count, self.count + n)
+        self.x[part] = x
+        self.y[part] = y
+        self.vx[part] = np.cos(angles) * speed
+        self.vy[part] = np.sin(angles) * speed
+        self.sprite[part] = sprite
+        self.count += n
+        self.fired += n
+        self.peak = max(self.peak, self.count)
+    
+    def _grow(self):
+        for attr in ('x', 'y', 'vx', 'vy', 'sprite'):
+            array = getattr(self, attr)
+            grown = np.zeros(len(array) * 2, dtype=array.dtype)
+            grown[:len(array)] = array
+            setattr(self, attr, grown)
+    
+    def _keep(self, keep):
+        """Compacta os arrays ficando só com as balas marcadas em `keep`"""
+        kept = int(np.count_nonzero(keep))
+        for array in (self.x, self.y, self.vx, self.vy, self.sprite):
+            array[:kept] = array[:self.count][keep]
+        self.count = kept
+    
+    def update(self, game_state, volume):
+        """Move todas as balas e descarta as que saíram da tela"""
+        start = time.perf_counter()
+        self.game_state = game_state
+        self.volume = volume
+        n = self.count
+        if n:
+            x = self.x[:n]
+            y = self.y[:n]
+            x += self.vx[:n]
+            y += self.vy[:n]
+            inside = ((x > -MARGIN) & (x < Config.SCREEN_WIDTH + MARGIN) &
+                      (y > -MARGIN) & (y < Config.SCREEN_HEIGHT + MARGIN))
+            if not inside.all():
+                self._keep(inside)
+        self.step_ms = (time.perf_counter() - start) * 1000
+        self.step_avg_ms += (self.step_ms - self.step_avg_ms) * 0.05
+    
+    def collide(self, rect, mask_name):
+        """Remove as balas que tocam o sprite `mask_name` em `rect`; retorna quantas"""
+        n = self.count
+        if not n:
+            return 0
+        xs = self.x[:n]
+        ys = self.y[:n]
+        candidates = collision.points_in_rect(xs, ys, rect, MARGIN // 2)
+        if not len(candidates):
+            return 0
+        hits = collision.mask_hits(collision.masks.get(mask_name), rect, xs, ys, candidates,
+                                   self.masks, self.sprite[:n])
+        if hits:
+            keep = np.ones(n, dtype=bool)
+            keep[hits] = False
+            self._keep(keep)
+        return len(hits)
+    
+    def clear(self):
+        self.count = 0
+    
+    def rows(self):
+        """(x, y, vx, vy, sprite) de cada bala viva (snapshot)"""
+        n = self.count
+        return zip(self.x[:n].tolist(), self.y[:n].tolist(), self.vx[:n].tolist(),
+                   self.vy[:n].tolist(), (BULLET_SPRITES[i] for i in self.sprite[:n].tolist()))
+    
+    def restore(self, rows):
+        """Recria as balas de rows() (snapshot)"""
+        rows = list(rows)[:Config.ENEMY_BULLET_LIMIT]
+        while len(rows) > len(self.x):
+            self._grow()
+        for i, (x, y, vx, vy, sprite) in enumerate(rows):
+            self.x[i], self.y[i], self.vx[i], self.vy[i] = x, y, vx, vy
+            self.sprite[i] = self.sprite_ids.get(sprite, 0)
+        self.count = len(rows)
+    
+    def draw(self, surface):
+        """Um blits por sprite de bala, posições calculadas em lote"""
+        start = time.perf_counter()
+        n = self.count
+        if n:
+            sprites = self.sprite[:n]
+            for i, image in enumerate(self.images):
+                chosen = sprites == i
+                if not chosen.any():
+                    continue
+                xs = (self.x[:n][chosen] - image.get_width() // 2).astype(np.int32).tolist()
+                ys = (self.y[:n][chosen] - image.get_height() // 2).astype(np.int32).tolist()
+                surface.blits([(image, position) for position in zip(xs, ys)], doreturn=False)
+        self.draw_avg_ms += ((time.perf_counter() - start) * 1000 - self.draw_avg_ms) * 0.05
+    
+    def get_stats(self):
+        return {
+            'alive': self.count,
+            'peak': self.peak,
+            'fired': self.fired,
+            'dropped': self.dropped,
+            'step_ms': self.step_ms,
+            'step_avg_ms': self.step_avg_ms,
+            'draw_avg_ms': self.draw_avg_ms,
+        }
\ No newline at end of file
@@ -1,115 +1,117 @@
 # src/entities/enemies.py
+import numpy as np
 import pygame
 import random
-import math
 from src.config import Config
+from src.entities import patterns
+from src.graphics import atlas
+from src.systems import tuning
+from src.systems.pool import PooledSprite, SpritePool
+from src.systems.scheduler import Cooldown
 
-class Enemy(pygame.sprite.Sprite):
-    def __init__(self, x, y, enemy_type="basic"):
+class Enemy(PooledSprite):
+    motion = None
+    guns = ()
+    
+    def __init__(self, x=0, y=0, enemy_type="basic"):
         super().__init__()
+        self.reset(x, y, enemy_type)
+    
+    def reset(self, x, y, enemy_type="basic", motion=None, pattern=patterns.DEFAULT_PATTERN,
+              age=0, distance=0.0):
         self.enemy_type = enemy_type
-        self.image = self._create_enemy_surface()
+        # Tipos sem sprite próprio usam o do chefe
+        sprite = enemy_type if enemy_type in ("basic", "elite") else "boss"
+        self.mask_name = f"enemy.{sprite}"
+        self.image = atlas.get(self.mask_name)
         self.rect = self.image.get_rect()
         self.rect.x = x
         self.rect.y = y
         
-        # Movimento
-        self.speed = 2
-        self.angle = 0
-        self.wave_amplitude = 50
-        self.original_x = x
-        
-    def _create_enemy_surface(self):
-        size = 40
-        surface = pygame.Surface((size, size), pygame.SRCALPHA)
-        
-        if self.enemy_type == "basic":
-            # Inimigo triangular básico (vermelho)
-            color = (200, 30, 30)
-            points = [(size//2, 0), (0, size), (size, size)]
-            pygame.draw.polygon(surface, color, points)
-            pygame.draw.polygon(surface, (150, 20, 20), points, 2)
-            
-        elif self.enemy_type == "elite":
-            # Inimigo hexagonal mais elaborado (dourado)
-            color = (218, 165, 32)
-            radius = size // 2
-            points = []
-            for i in range(6):
-                angle = math.pi/3 * i
-                x = radius + radius * math.cos(angle)
-                y = radius + radius * math.sin(angle)
-                points.append((x, y))
-            pygame.draw.polygon(surface, color, points)
-            pygame.draw.polygon(surface, (255, 215, 0), points, 2)
-            
-        else:  # boss
-            # Chefe maior e mais detalhado
-            color = (180, 0, 0)
-            pygame.draw.circle(surface, color, (size//2, size//2), size//2)
-            pygame.draw.circle(surface, (255, 215, 0), (size//2, size//2), size//2, 2)
-            pygame.draw.circle(surface, (255, 215, 0), (size//2, size//2), size//4)
-        
-        return surface
+        # Movimento: o padrão é avançado em lote pelo MotionBank do spawner
+        # (x, y é a origem do padrão)
+        self.pattern = pattern
+        self.motion = motion
+        self.slot = motion.add(self, pattern, x, y, age, distance) if motion is not None else None
+        # Rajadas de balas (elite/chefe), armadas pelo spawner
+        self.guns = ()
     
-    def update(self, game_state):
-        # Movimento básico para baixo
-        self.rect.y += self.speed
-        
-        # Movimento ondulado
-        self.angle += 0.05
-        self.rect.x = self.original_x + math.sin(self.angle) * self.wave_amplitude
-        
-        # Ajusta velocidade baseado no estado do jogo
-        if game_state == "void":
-            self.speed = 1
-        elif game_state == "ambient":
-            self.speed = 2
-        else:  # intense
-            self.speed = 3
-        
-        # Remove inimigo se sair da tela
-        if self.rect.top > Config.SCREEN_HEIGHT:
-            self.kill()
+    def kill(self):
+        for gun in self.guns:
+            gun.cancel()
+        self.guns = ()
+        if self.motion is not None:
+            self.motion.remove(self.slot)
+            self.motion = None
+        super().kill()
 
 class EnemySpawner:
-    def __init__(self):
-        self.last_spawn = 0
-        self.spawn_delay = 1000  # 1 segundo entre spawns
+    def __init__(self, timeline, bullets=None):
+        # Intervalo entre ondas na linha do tempo do jogo (src/systems/scheduler.py)
+        self.cooldown = Cooldown(timeline, tuning.current.enemy_spawn_delay)
         self.enemies = pygame.sprite.Group()
+        self.pool = SpritePool(Enemy)
+        self.motion = patterns.MotionBank()
+        # Balas inimigas (src/entities/bullets.py); None: ninguém atira
+        self.bullets = bullets
         
-    def update(self, game_state, volume):
-        now = pygame.time.get_ticks()
+    def update(self, game_state, volume, target=None):
+        """Atualiza os inimigos; retorna os inimigos criados neste frame.
         
-        # Ajusta frequência de spawn baseado no estado e volume
-        spawn_chance = 0.1  # chance base
-        if game_state == "void":
-            spawn_chance = 0.05
-        elif game_state == "intense":
-            spawn_chance = 0.2
+        `target` é a posição perseguida pelos bandos (centro do jogador).
+        """
+        spawned = []
+        tables = tuning.current
         
-        # Aumenta chance baseado no volume
-        spawn_chance += volume
-        
-        # Tenta criar novo inimigo
-        if now - self.last_spawn > self.spawn_delay and random.random() < spawn_chance:
-            self._spawn_enemy(game_state)
-            self.last_spawn = now
+        # Passado o intervalo, chance de spawn pelo estado, aumentada pelo volume
+        if self.cooldown.ready and random.random() < tables.enemy_spawn_chance[game_state] + volume:
+            # Nova onda (um inimigo ou uma formação)
+            spawned = self._spawn_wave(game_state)
+            self.cooldown.restart(tables.enemy_spawn_delay)
             
         # Atualiza inimigos existentes
-        self.enemies.update(game_state)
+        self.motion.target = target
+        self._move(tables.enemy_speed[game_state])
+        return spawned
+    
+    def restore_cooldown(self, last):
+        """Intervalo contado a partir do último spawn `last` (snapshot)"""
+        self.cooldown.restart(tuning.current.enemy_spawn_delay, last)
     
-    def _spawn_enemy(self, game_state):
-        # Posição aleatória no topo da tela
-        x = random.randint(50, Config.SCREEN_WIDTH - 50)
+    def arm(self, enemy):
+        """Começa os disparos de um inimigo novo (ou restaurado)"""
+        if self.bullets is not None:
+            enemy.guns = self.bullets.arm(enemy)
+    
+    def _move(self, speed):
+        # Todos os padrões avaliados em lote; aqui só a escrita nos rects
+        xs, ys = self.motion.step(speed)
+        sprites = self.motion.sprites
+        gone = [sprites[i] for i in np.flatnonzero(ys > Config.SCREEN_HEIGHT).tolist()]
+        for enemy, x, y in zip(sprites, xs.tolist(), ys.tolist()):
+            enemy.rect.topleft = (x, y)
+        
+        # Remove inimigos que saíram da tela
+        for enemy in gone:
+            enemy.kill()
+    
+    def _spawn_wave(self, game_state):
+        tables = tuning.current
+        pattern = patterns.get(random.choice(tables.enemy_patterns[game_state]))
+        slots = pattern.formation
+        
+        # Posição aleatória no topo da tela, com a formação inteira dentro dela
+        low = 50 - min(dx for dx, _ in slots)
+        high = Config.SCREEN_WIDTH - 50 - max(dx for dx, _ in slots)
+        x = random.randint(int(low), int(max(low, high)))
         
-        # Tipo de inimigo baseado no estado
-        if game_state == "void":
-            enemy_type = "basic"
-        elif game_state == "ambient":
-            enemy_type = random.choice(["basic", "elite"])
-        else:  # intense
-            enemy_type = random.choice(["basic", "elite", "boss"])
+        # Tipo de inimigo baseado no estado (o mesmo para a formação toda)
+        enemy_type = random.choice(tables.enemy_types[game_state])
         
-        enemy = Enemy(x, -50, enemy_type)
-        self.enemies.add(enemy)
\ No newline at end of file
+        spawned = []
+        for dx, dy in slots:
+            enemy = self.pool.acquire(x + dx, -50 + dy, enemy_type, self.motion, pattern.name)
+            self.arm(enemy)
+            self.enemies.add(enemy)
+            spawned.append(enemy)
+        return spawned
\ No newline at end of file
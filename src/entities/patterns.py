@@ -0,0 +1,394 @@
+# src/entities/patterns.py
+import time
+import numpy as np
+from src.utils.registry import DataRegistry
+
+# Padrões de movimento dos inimigos definidos por dados.
+#
+# Cada padrão dá o deslocamento (dx, dy) em relação ao ponto de spawn em
+# função da idade em frames; a descida pela velocidade do estado de áudio
+# é somada por fora (multiplicada por "descent"). Na carga os padrões são
+# compilados: senoides viram avaliadores vetorizados e splines/mergulhos
+# viram tabelas por frame, então todos os inimigos de um padrão andam numa
+# única chamada numpy (MotionBank.step).
+#
+# Padrões "flock" não têm caminho fixo: os inimigos do padrão são agentes
+# (boids) com velocidade própria, guiados por separação, alinhamento,
+# coesão e perseguição ao jogador; os vizinhos saem de uma grade uniforme
+# refeita a cada passo e o steering de todos é calculado em lote.
+#
+# O designer de padrões do editor desenha e simula os mesmos padrões.
+
+DEFAULT_PATTERN = "sine"
+
+DEFAULT_PATTERNS = {
+    # Onda original: x = origem + sin(0.05 * idade) * 50
+    "sine": {"kind": "sine", "waves": [{"axis": "x", "amplitude": 50, "frequency": 0.05}]},
+    "orbit": {"kind": "sine", "descent": 0.8,
+              "waves": [{"axis": "x", "amplitude": 60, "frequency": 0.06},
+                        {"axis": "y", "amplitude": 40, "frequency": 0.06, "phase": -1.5708}]},
+    "zigzag": {"kind": "spline", "loop": True,
+               "points": [[0, 0, 0], [30, 60, 0], [90, -60, 0], [120, 0, 0]]},
+    "dive": {"kind": "dive", "descent": 0.4, "delay": 90, "sway": 40, "sway_frequency": 0.08,
+             "accel": 0.12},
+    "v_wing": {"kind": "sine", "waves": [{"axis": "x", "amplitude": 30, "frequency": 0.03}],
+               "formation": [[0, 0], [-40, -35], [40, -35], [-80, -70], [80, -70]]},
+    "swarm": {"kind": "flock", "radius": 60, "separation": 0.3, "alignment": 0.05,
+              "cohesion": 0.002, "pursuit": 0.03, "max_speed": 1.5, "min_descent": 0.4,
+              "formation": [[0, 0], [-35, -25], [35, -25], [-70, -50], [0, -50], [70, -50]]},
+}
+
+AXES = {"x": 0, "y": 1}
+
+class Pattern:
+    """Padrão compilado: offsets(idades) -> arrays (dx, dy)"""
+    # Padrões com steering (flock) movem os próprios slots em MotionBank.step
+    steers = False
+    
+    def __init__(self, name, data):
+        self.name = name
+        self.data = data
+        # Fração da velocidade do estado usada na descida (0 = só o padrão)
+        self.descent = float(data.get("descent", 1.0))
+        # Posições relativas dos inimigos de uma formação (um inimigo = [[0, 0]])
+        self.formation = [(float(dx), float(dy)) for dx, dy in data.get("formation") or [(0, 0)]]
+    
+    def offsets(self, ages):
+        raise NotImplementedError
+
+class SinePattern(Pattern):
+    """Soma de senoides por eixo, avaliada direto sobre o array de idades"""
+    
+    def __init__(self, name, data):
+        super().__init__(name, data)
+        self.waves = []
+        for wave in data.get("waves", []):
+            axis = wave.get("axis", "x")
+            if axis not in AXES:
+                raise ValueError(f"Pattern '{name}': unknown axis {axis!r}")
+            self.waves.append((AXES[axis], float(wave.get("amplitude", 0.0)),
+                               float(wave.get("frequency", 0.0)), float(wave.get("phase", 0.0))))
+        self.drift = tuple(float(v) for v in data.get("drift", (0.0, 0.0)))
+    
+    def offsets(self, ages):
+        offset = [ages * drift if drift else 0.0 for drift in self.drift]
+        for axis, amplitude, frequency, phase in self.waves:
+            offset[axis] = offset[axis] + amplitude * np.sin(ages * frequency + phase)
+        return offset[0], offset[1]
+
+class TablePattern(Pattern):
+    """Padrão tabelado: um offset por frame, consultado por índice.
+    
+    Depois do fim da tabela o padrão repete (loop) ou segue em linha reta
+    com a velocidade do último frame.
+    """
+    
+    def __init__(self, name, data):
+        super().__init__(name, data)
+        self.loop = bool(data.get("loop", False))
+        self.table = self.bake()
+        if len(self.table) < 2:
+            raise ValueError(f"Pattern '{name}': path must last at least 2 frames")
+        self.end_velocity = self.table[-1] - self.table[-2]
+    
+    def bake(self):
+        raise NotImplementedError
+    
+    def offsets(self, ages):
+        last = len(self.table) - 1
+        if self.loop:
+            rows = self.table[ages % len(self.table)]
+            return rows[:, 0], rows[:, 1]
+        rows = self.table[np.minimum(ages, last)]
+        beyond = np.maximum(ages - last, 0)
+        return (rows[:, 0] + beyond * self.end_velocity[0],
+                rows[:, 1] + beyond * self.end_velocity[1])
+
+class SplinePattern(TablePattern):
+    """Catmull-Rom pelos pontos [frame, dx, dy]; com loop o último ponto
+    deve coincidir com o primeiro"""
+    
+    def bake(self):
+        points = sorted((float(t), float(dx), float(dy)) for t, dx, dy in self.data["points"])
+        if len(points) < 2:
+            raise ValueError(f"Pattern '{self.name}': spline needs at least 2 points")
+        times = np.array([p[0] for p in points])
+        if np.any(np.diff(times) <= 0):
+            raise ValueError(f"Pattern '{self.name}': spline points need distinct frames")
+        coords = np.array([p[1:] for p in points])
+        # Vizinhos das pontas: repetidos, ou do outro lado da curva fechada
+        if self.loop and len(points) > 2:
+            coords = np.vstack([coords[-2], coords, coords[1]])
+        else:
+            coords = np.vstack([coords[0], coords, coords[-1]])
+        
+        # Com loop o último ponto é o primeiro da próxima volta
+        frames = np.arange(times[0], times[-1] + (0 if self.loop else 1))
+        segment = np.clip(np.searchsorted(times, frames, side='right') - 1, 0, len(times) - 2)
+        u = ((frames - times[segment]) / (times[segment + 1] - times[segment]))[:, None]
+        p0, p1, p2, p3 = (coords[segment + k] for k in range(4))
+        return 0.5 * (2 * p1 + (p2 - p0) * u + (2 * p0 - 5 * p1 + 4 * p2 - p3) * u ** 2
+                      + (3 * p1 - p0 - 3 * p2 + p3) * u ** 3)
+
+class DivePattern(TablePattern):
+    """Balança no lugar por `delay` frames e depois mergulha acelerando"""
+    
+    def bake(self):
+        delay = int(self.data.get("delay", 60))
+        sway = float(self.data.get("sway", 0.0))
+        frequency = float(self.data.get("sway_frequency", 0.1))
+        accel = float(self.data.get("accel", 0.1))
+        frames = np.arange(delay + int(self.data.get("length", 120)), dtype=float)
+        hover = np.minimum(frames, delay)
+        diving = np.maximum(frames - delay, 0)
+        return np.column_stack([sway * np.sin(hover * frequency), 0.5 * accel * diving ** 2])
+
+def neighbor_pairs(x, y, radius):
+    """Pares (i, j), i != j, de agentes a menos de `radius`, pela grade uniforme.
+    
+    Células do tamanho do raio: os vizinhos de um agente estão na célula
+    dele ou nas 8 em volta. Os agentes são ordenados pela chave da célula e
+    cada uma das 9 células vira uma faixa [início, fim) na ordem, achada
+    com searchsorted; as faixas são expandidas em pares sem laço Python.
+    Retorna (i, j, dx, dy, d2) só dos pares dentro do raio.
+    """
+    cx = np.floor(x / radius).astype(np.int64)
+    cy = np.floor(y / radius).astype(np.int64)
+    cx -= cx.min() - 1
+    cy -= cy.min() - 1
+    width = int(cx.max()) + 2
+    key = cy * width + cx
+    order = np.argsort(key, kind='stable')
+    sorted_key = key[order]
+    
+    agents = np.arange(len(x))
+    lookups = np.concatenate([key + dy * width + dx for dy in (-1, 0, 1) for dx in (-1, 0, 1)])
+    starts = np.searchsorted(sorted_key, lookups, side='left')
+    counts = np.searchsorted(sorted_key, lookups, side='right') - starts
+    total = int(counts.sum())
+    i = np.repeat(np.tile(agents, 9), counts)
+    first = np.repeat(np.cumsum(counts) - counts, counts)
+    j = order[np.repeat(starts, counts) + np.arange(total) - first]
+    
+    dx = x[j] - x[i]
+    dy = y[j] - y[i]
+    d2 = dx * dx + dy * dy
+    near = (i != j) & (d2 < radius * radius)
+    return i[near], j[near], dx[near], dy[near], d2[near]
+
+class FlockPattern(Pattern):
+    """Boids: cada slot tem posição e velocidade próprias (sem offsets).
+    
+    Os pesos são acelerações por frame; as velocidades são frações da
+    velocidade do estado de áudio. A descida mínima garante que o bando
+    passe pelo jogador e saia pela base da tela.
+    """
+    steers = True
+    
+    def __init__(self, name, data):
+        super().__init__(name, data)
+        # A descida vem do steering, não da velocidade do estado
+        self.descent = 0.0
+        self.radius = float(data.get("radius", 60.0))
+        if self.radius <= 0:
+            raise ValueError(f"Pattern '{name}': flock radius must be positive")
+        self.separation = float(data.get("separation", 0.3))
+        self.alignment = float(data.get("alignment", 0.05))
+        self.cohesion = float(data.get("cohesion", 0.002))
+        self.pursuit = float(data.get("pursuit", 0.03))
+        self.max_speed = float(data.get("max_speed", 1.5))
+        self.min_descent = float(data.get("min_descent", 0.4))
+    
+    def offsets(self, ages):
+        zeros = np.zeros(len(ages))
+        return zeros, zeros
+    
+    def steer(self, x, y, vx, vy, speed, target):
+        """Um passo do bando; retorna (x, y, vx, vy) novos"""
+        n = len(x)
+        ax = np.zeros(n)
+        ay = np.zeros(n)
+        if n > 1:
+            i, j, dx, dy, d2 = neighbor_pairs(x, y, self.radius)
+            neighbors = np.bincount(i, minlength=n)
+            has = neighbors > 0
+            count = np.maximum(neighbors, 1)
+            # Separação: afasta de cada vizinho com peso 1/distância
+            d2 = np.maximum(d2, 1.0)
+            ax -= self.separation * self.radius * np.bincount(i, dx / d2, n)
+            ay -= self.separation * self.radius * np.bincount(i, dy / d2, n)
+            # Alinhamento (velocidade média dos vizinhos) e coesão (centro deles)
+            ax += has * (self.alignment * (np.bincount(i, vx[j], n) / count - vx) +
+                         self.cohesion * np.bincount(i, dx, n) / count)
+            ay += has * (self.alignment * (np.bincount(i, vy[j], n) / count - vy) +
+                         self.cohesion * np.bincount(i, dy, n) / count)
+        
+        top_speed = max(speed * self.max_speed, 0.1)
+        if target is not None and self.pursuit:
+            # Perseguição: aproxima a velocidade da direção do jogador
+            tx = target[0] - x
+            ty = target[1] - y
+            length = np.maximum(np.hypot(tx, ty), 1.0)
+            ax += self.pursuit * (tx / length * top_speed - vx)
+            ay += self.pursuit * (ty / length * top_speed - vy)
+        
+        vx = vx + ax
+        vy = vy + ay
+        scale = np.minimum(1.0, top_speed / np.maximum(np.hypot(vx, vy), 1e-9))
+        vx *= scale
+        vy = np.maximum(vy * scale, speed * self.min_descent)
+        return x + vx, y + vy, vx, vy
+
+KINDS = {"sine": SinePattern, "spline": SplinePattern, "dive": DivePattern,
+         "flock": FlockPattern}
+
+def compile_pattern(name, data):
+    """Padrão compilado pela classe do seu tipo (campo "kind")"""
+    kind = KINDS.get(data.get("kind"))
+    if kind is None:
+        raise ValueError(f"Pattern '{name}': unknown kind {data.get('kind')!r}")
+    return kind(name, data)
+
+# Padrões em uso (o MotionBank resolve pelo nome a cada passo)
+registry = DataRegistry(DEFAULT_PATTERNS, compile_pattern)
+patterns = registry.entries
+load = registry.load
+install = registry.install
+
+def get(name):
+    """Padrão pelo nome; nomes desconhecidos caem no padrão original"""
+    return patterns.get(name) or patterns[DEFAULT_PATTERN]
+
+class MotionBank:
+    """Estado de movimento de todos os inimigos em arrays paralelos.
+    
+    Cada sprite ocupa um slot (sprite.slot); remove() move o último slot
+    para o buraco, então os ativos são sempre [:count] e step() avança
+    todos com uma avaliação vetorizada por padrão em uso. Nos padrões com
+    steering a origem é a posição atual e vx/vy a velocidade do agente.
+    """
+    
+    def __init__(self, capacity=64):
+        self.count = 0
+        self.sprites = []
+        self.names = []
+        self.ids = {}
+        self.pattern = np.zeros(capacity, dtype=np.int32)
+        self.age = np.zeros(capacity, dtype=np.int64)
+        self.distance = np.zeros(capacity)
+        self.origin_x = np.zeros(capacity)
+        self.origin_y = np.zeros(capacity)
+        self.vx = np.zeros(capacity)
+        self.vy = np.zeros(capacity)
+        # Posição (x, y) perseguida pelos bandos; None: sem perseguição
+        self.target = None
+        self.peak = 0
+        self.step_ms = 0.0
+        self.step_avg_ms = 0.0
+    
+    def _grow(self):
+        for attr in ('pattern', 'age', 'distance', 'origin_x', 'origin_y', 'vx', 'vy'):
+            array = getattr(self, attr)
+            grown = np.zeros(len(array) * 2, dtype=array.dtype)
+            grown[:len(array)] = array
+            setattr(self, attr, grown)
+    
+    def add(self, sprite, pattern, x, y, age=0, distance=0.0):
+        """Registra um sprite com origem (x, y); retorna o slot"""
+        pattern_id = self.ids.get(pattern)
+        if pattern_id is None:
+            pattern_id = self.ids[pattern] = len(self.names)
+            self.names.append(pattern)
+        if self.count == len(self.age):
+            self._grow()
+        slot = self.count
+        self.pattern[slot] = pattern_id
+        self.age[slot] = age
+        self.distance[slot] = distance
+        self.origin_x[slot] = x
+        self.origin_y[slot] = y
+        self.vx[slot] = 0.0
+        self.vy[slot] = 0.0
+        self.sprites.append(sprite)
+        self.count += 1
+        self.peak = max(self.peak, self.count)
+        return slot
+    
+    def remove(self, slot):
+        last = self.count - 1
+        if slot != last:
+            for array in (self.pattern, self.age, self.distance, self.origin_x, self.origin_y,
+                          self.vx, self.vy):
+                array[slot] = array[last]
+            moved = self.sprites[last]
+            self.sprites[slot] = moved
+            moved.slot = slot
+        self.sprites.pop()
+        self.count = last
+    
+    def clear(self):
+        self.count = 0
+        self.sprites = []
+    
+    def step(self, speed):
+        """Avança um frame; retorna arrays (x, y) alinhados com self.sprites"""
+        start = time.perf_counter()
+        count = self.count
+        age = self.age[:count]
+        age += 1
+        ids = self.pattern[:count]
+        compiled = [get(name) for name in self.names]
+        
+        distance = self.distance[:count]
+        flocks = []
+        if len(compiled) == 1:
+            distance += speed * compiled[0].descent
+            dx, dy = compiled[0].offsets(age)
+            if compiled[0].steers:
+                flocks.append((compiled[0], np.arange(count)))
+        else:
+            distance += speed * np.array([pattern.descent for pattern in compiled])[ids]
+            # Agrupa os slots por padrão: uma avaliação por fatia contígua
+            order = np.argsort(ids, kind='stable')
+            ends = np.cumsum(np.bincount(ids, minlength=len(compiled))).tolist()
+            ages = age[order]
+            dx = np.empty(count)
+            dy = np.empty(count)
+            start_slot = 0
+            for pattern, end in zip(compiled, ends):
+                if end > start_slot:
+                    part = slice(start_slot, end)
+                    dx[order[part]], dy[order[part]] = pattern.offsets(ages[part])
+                    if pattern.steers:
+                        flocks.append((pattern, order[part]))
+                start_slot = end
+        # Bandos: steering em lote de todos os agentes do padrão
+        for pattern, slots in flocks:
+            self._steer(pattern, slots, speed)
+        x = self.origin_x[:count] + dx
+        y = self.origin_y[:count] + distance + dy
+        
+        self.step_ms = (time.perf_counter() - start) * 1000
+        self.step_avg_ms += (self.step_ms - self.step_avg_ms) * 0.05
+        return x, y
+    
+    def _steer(self, pattern, slots, speed):
+        x, y, vx, vy = pattern.steer(self.origin_x[slots], self.origin_y[slots], self.vx[slots],
+                                     self.vy[slots], speed, self.target)
+        self.origin_x[slots] = x
+        self.origin_y[slots] = y
+        self.vx[slots] = vx
+        self.vy[slots] = vy
+    
+    def state(self, slot):
+        """Nome do padrão, idade e descida acumulada de um slot (snapshot)"""
+        return self.names[self.pattern[slot]], int(self.age[slot]), float(self.distance[slot])
+    
+    def get_stats(self):
+        return {
+            'alive': self.count,
+            'peak': self.peak,
+            'patterns': len(set(self.pattern[:self.count].tolist())),
+            'step_ms': self.step_ms,
+            'step_avg_ms': self.step_avg_ms,
+        }
\ No newline at end of file
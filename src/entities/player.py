@@ -2,12 +2,18 @@
 import pygame
 import math
 from src.config import Config
+from src.graphics import atlas
 from src.entities.projectiles import Projectile
+from src.systems.pool import SpritePool
+
+# Power-ups de tiro: um só ativo por vez
+WEAPON_POWERUPS = ('double_shot', 'triple_shot')
 
 class Player(pygame.sprite.Sprite):
-    def __init__(self, projectiles_group):
+    def __init__(self, projectiles_group, timeline, sfx=None, controls=None):
         super().__init__()
-        self.image = self._create_ship_surface()
+        self.mask_name = 'ship'
+        self.image = atlas.get(self.mask_name)
         self.rect = self.image.get_rect()
         self.rect.centerx = Config.SCREEN_WIDTH // 2
         self.rect.bottom = Config.SCREEN_HEIGHT - 20
@@ -16,107 +22,49 @@ class Player(pygame.sprite.Sprite):
         self.base_speed = 5
         self.speed = self.base_speed
         self.projectiles_group = projectiles_group
+        self.projectile_pool = SpritePool(Projectile)
+        self.sfx = sfx
+        
+        # Entrada com timestamp (src/systems/input.py); sem ela, lê o teclado no frame
+        self.controls = controls
+        self.subpixel = 0.0
+        
+        # Tempo de jogo (src/systems/scheduler.py): recarga, pulso do escudo e
+        # fim dos power-ups param junto com o jogo
+        self.timeline = timeline
         
         # Sistema de tiro
         self.shoot_delay = 250
         self.last_shot = 0
         self.shot_type = 'single'
         
-        # Power-ups ativos
+        # Power-ups ativos: tipo -> evento agendado do fim do efeito
         self.active_powerups = {}
         self.shield_active = False
         self.shield_alpha = 255
         
         # Surface do escudo
-        self.shield_surface = self._create_shield_surface()
-    
-    def _create_ship_surface(self):
-        """Cria a superfície da nave"""
-        # Tamanho maior para mais detalhes
-        surface = pygame.Surface((60, 80), pygame.SRCALPHA)
-        
-        # Cores
-        RED = (220, 20, 20)        # Vermelho mais escuro
-        DARK_RED = (180, 10, 10)   # Vermelho ainda mais escuro
-        GOLD = (255, 215, 0)       # Dourado para detalhes
-        GRAY = (80, 80, 80)        # Cinza para partes metálicas
-        
-        # Corpo principal (forma de asa)
-        points = [
-            (30, 0),    # Ponta
-            (0, 60),    # Base esquerda
-            (10, 70),   # Entalhe esquerdo
-            (50, 70),   # Entalhe direito
-            (60, 60),   # Base direita
-        ]
-        pygame.draw.polygon(surface, RED, points)
-        
-        # Contorno do corpo
-        pygame.draw.polygon(surface, DARK_RED, points, 2)
-        
-        # Asas laterais
-        left_wing = [
-            (5, 40),
-            (0, 60),
-            (20, 55)
-        ]
-        right_wing = [
-            (55, 40),
-            (60, 60),
-            (40, 55)
-        ]
-        pygame.draw.polygon(surface, DARK_RED, left_wing)
-        pygame.draw.polygon(surface, DARK_RED, right_wing)
-        
-        # Motores (retângulos na base)
-        pygame.draw.rect(surface, GRAY, (15, 65, 10, 15))
-        pygame.draw.rect(surface, GRAY, (35, 65, 10, 15))
-        
-        # Detalhes dourados (círculos e linhas)
-        pygame.draw.circle(surface, GOLD, (30, 30), 8)
-        pygame.draw.circle(surface, GOLD, (30, 30), 8, 1)
-        pygame.draw.line(surface, GOLD, (10, 50), (50, 50), 2)
-        
-        return surface
-    
-    def _create_shield_surface(self):
-        """Cria a superfície do escudo"""
-        size = max(self.rect.width, self.rect.height) + 20
-        surface = pygame.Surface((size, size), pygame.SRCALPHA)
-        center = size // 2
-        
-        # Círculo externo com gradiente
-        for radius in range(size//2, size//2 - 4, -1):
-            alpha = int(255 * (radius - (size//2 - 4)) / 4)
-            pygame.draw.circle(surface, (50, 150, 255, alpha), (center, center), radius)
-        
-        return surface
+        self.shield_surface = atlas.get('shield')
     
     def update(self, game_state):
-        now = pygame.time.get_ticks()
-        
-        # Atualiza power-ups ativos
-        expired_powerups = []
-        for effect, end_time in self.active_powerups.items():
-            if now >= end_time:
-                expired_powerups.append(effect)
-                self._remove_powerup_effect(effect)
-        
-        for effect in expired_powerups:
-            del self.active_powerups[effect]
-        
-        # Atualiza movimento
+        # Atualiza movimento (power-ups expiram sozinhos pela linha do tempo)
         self._handle_movement()
         
-        # Atualiza tiro
-        if pygame.key.get_pressed()[pygame.K_SPACE]:
+        # Atualiza tiro (um toque curto fica no buffer até a recarga terminar)
+        if self.controls:
+            if self.controls.triggered('fire') and self._handle_shooting(game_state):
+                self.controls.acted('fire')
+        elif pygame.key.get_pressed()[pygame.K_SPACE]:
             self._handle_shooting(game_state)
         
         # Efeito pulsante do escudo
         if self.shield_active:
-            self.shield_alpha = 128 + int(127 * math.sin(now * 0.01))
+            self.shield_alpha = 128 + int(127 * math.sin(self.timeline.now * 0.01))
     
     def _handle_movement(self):
+        if self.controls:
+            self._handle_timed_movement()
+            return
         keys = pygame.key.get_pressed()
         
         # Movimento horizontal
@@ -125,8 +73,25 @@ class Player(pygame.sprite.Sprite):
         if keys[pygame.K_RIGHT] and self.rect.right < Config.SCREEN_WIDTH:
             self.rect.x += self.speed
     
+    def _handle_timed_movement(self):
+        """Desloca pelo tempo que cada direção ficou pressionada dentro do passo"""
+        controls = self.controls
+        left = controls.amount('left')
+        right = controls.amount('right')
+        if not left and not right:
+            return
+        # Frações de pixel acumulam entre os passos (toques curtos também movem)
+        self.subpixel += self.speed * (right - left)
+        step = int(self.subpixel)
+        self.subpixel -= step
+        self.rect.x = max(0, min(self.rect.x + step, Config.SCREEN_WIDTH - self.rect.width))
+        if left:
+            controls.acted('left')
+        if right:
+            controls.acted('right')
+    
     def _handle_shooting(self, game_state):
-        now = pygame.time.get_ticks()
+        now = self.timeline.now
         
         if now - self.last_shot > self.shoot_delay:
             if self.shot_type == 'single':
@@ -136,31 +101,42 @@ class Player(pygame.sprite.Sprite):
             elif self.shot_type == 'triple':
                 self._shoot_triple()
             
+            if self.sfx:
+                self.sfx.trigger('laser')
             self.last_shot = now
+            return True
+        return False
     
     def _shoot_single(self):
         """Tiro único central"""
-        projectile = Projectile(self.rect.centerx, self.rect.top)
+        projectile = self.projectile_pool.acquire(self.rect.centerx, self.rect.top)
         self.projectiles_group.add(projectile)
     
     def _shoot_double(self):
         """Tiro duplo nas laterais"""
         offset = 10
-        projectile1 = Projectile(self.rect.centerx - offset, self.rect.top)
-        projectile2 = Projectile(self.rect.centerx + offset, self.rect.top)
+        projectile1 = self.projectile_pool.acquire(self.rect.centerx - offset, self.rect.top)
+        projectile2 = self.projectile_pool.acquire(self.rect.centerx + offset, self.rect.top)
         self.projectiles_group.add(projectile1, projectile2)
     
     def _shoot_triple(self):
         """Tiro triplo (centro e laterais)"""
-        projectile1 = Projectile(self.rect.centerx, self.rect.top)
-        projectile2 = Projectile(self.rect.centerx - 15, self.rect.top)
-        projectile3 = Projectile(self.rect.centerx + 15, self.rect.top)
+        projectile1 = self.projectile_pool.acquire(self.rect.centerx, self.rect.top)
+        projectile2 = self.projectile_pool.acquire(self.rect.centerx - 15, self.rect.top)
+        projectile3 = self.projectile_pool.acquire(self.rect.centerx + 15, self.rect.top)
         self.projectiles_group.add(projectile1, projectile2, projectile3)
     
     def activate_powerup(self, powerup_type, duration):
-        """Ativa um power-up por uma duração específica"""
-        now = pygame.time.get_ticks()
-        end_time = now + duration
+        """Ativa um power-up por uma duração específica.
+        
+        Pegar de novo um power-up ativo renova a duração (não soma). Os tiros
+        ocupam um único slot: double/triple substitui o outro e cancela o
+        fim dele. Escudo e velocidade acumulam com o tiro e entre si.
+        """
+        if powerup_type in WEAPON_POWERUPS:
+            for other in WEAPON_POWERUPS:
+                if other != powerup_type and other in self.active_powerups:
+                    self.active_powerups.pop(other).cancel()
         
         if powerup_type == 'double_shot':
             self.shot_type = 'double'
@@ -171,7 +147,19 @@ class Player(pygame.sprite.Sprite):
         elif powerup_type == 'speed':
             self.speed = self.base_speed * 1.5
         
-        self.active_powerups[powerup_type] = end_time
+        self.schedule_expiry(powerup_type, duration)
+    
+    def schedule_expiry(self, powerup_type, duration):
+        """(Re)agenda o fim de um power-up (também usado pelo snapshot)"""
+        previous = self.active_powerups.get(powerup_type)
+        if previous is not None:
+            previous.cancel()
+        self.active_powerups[powerup_type] = self.timeline.after(duration, self._expire,
+                                                                 powerup_type)
+    
+    def _expire(self, powerup_type):
+        del self.active_powerups[powerup_type]
+        self._remove_powerup_effect(powerup_type)
     
     def _remove_powerup_effect(self, powerup_type):
         """Remove o efeito de um power-up"""
@@ -182,6 +170,17 @@ class Player(pygame.sprite.Sprite):
         elif powerup_type == 'speed':
             self.speed = self.base_speed
     
+    def reset(self):
+        """Volta ao estado inicial da partida sem recriar surfaces"""
+        self.rect.centerx = Config.SCREEN_WIDTH // 2
+        self.rect.bottom = Config.SCREEN_HEIGHT - 20
+        for effect, expiry in self.active_powerups.items():
+            expiry.cancel()
+            self._remove_powerup_effect(effect)
+        self.active_powerups = {}
+        self.last_shot = 0
+        self.subpixel = 0.0
+    
     def draw(self, surface):
         """Sobrescreve o método draw para incluir o escudo"""
         # Desenha a nave
@@ -0,0 +1,127 @@
+# src/graphics/atlas.py
+import hashlib
+import json
+import os
+import pygame
+from src.config import Config
+from src.graphics import sprites
+from src.utils import bundle
+
+ATLAS_FORMAT = 1
+PADDING = 1
+
+def source_hash():
+    """Hash do código dos geradores: muda quando algum sprite muda"""
+    with open(sprites.__file__, 'rb') as f:
+        digest = hashlib.sha1(f.read())
+    digest.update(str(ATLAS_FORMAT).encode())
+    return digest.hexdigest()
+
+def pack(sizes, max_width=1024):
+    """Empacotamento em prateleiras (shelf): maiores alturas primeiro.
+    
+    Recebe {nome: (w, h)} e retorna ({nome: (x, y, w, h)}, (largura, altura)).
+    """
+    order = sorted(sizes, key=lambda name: (-sizes[name][1], -sizes[name][0], name))
+    rects = {}
+    x = y = shelf_height = width = 0
+    for name in order:
+        w, h = sizes[name]
+        if x + w > max_width and x > 0:
+            y += shelf_height + PADDING
+            x = shelf_height = 0
+        rects[name] = (x, y, w, h)
+        x += w + PADDING
+        shelf_height = max(shelf_height, h)
+        width = max(width, x)
+    return rects, (width, y + shelf_height)
+
+def bake(image_path=None, manifest_path=None):
+    """Renderiza todos os sprites num PNG único e grava o manifesto JSON"""
+    image_path = image_path or Config.ATLAS_IMAGE
+    manifest_path = manifest_path or Config.ATLAS_MANIFEST
+    
+    surfaces = {name: generate() for name, generate in sprites.catalog().items()}
+    rects, size = pack({name: surface.get_size() for name, surface in surfaces.items()})
+    
+    atlas = pygame.Surface(size, pygame.SRCALPHA)
+    for name, (x, y, w, h) in rects.items():
+        atlas.blit(surfaces[name], (x, y))
+    
+    directory = os.path.dirname(image_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    pygame.image.save(atlas, image_path)
+    manifest = {
+        'format': ATLAS_FORMAT,
+        'source_hash': source_hash(),
+        'image': os.path.basename(image_path),
+        'size': list(size),
+        'sprites': {name: list(rect) for name, rect in sorted(rects.items())},
+    }
+    with open(manifest_path, 'w') as f:
+        json.dump(manifest, f, indent=1)
+    return manifest
+
+class Atlas:
+    """Sprites do jogo vindos do atlas pré-gerado (uma única imagem).
+    
+    Cada sprite é uma subsurface da imagem do atlas, sem cópia. Se o atlas
+    não existe ou foi gerado por outra versão dos geradores, os sprites são
+    desenhados proceduralmente na primeira vez que forem pedidos.
+    """
+    
+    def __init__(self, image_path=None, manifest_path=None):
+        self.image_path = image_path or Config.ATLAS_IMAGE
+        self.manifest_path = manifest_path or Config.ATLAS_MANIFEST
+        self.generators = sprites.catalog()
+        self.cache = {}
+        self.image = None
+        self.rects = {}
+        self.baked = self._load()
+    
+    def _load(self):
+        if not bundle.exists(self.manifest_path):
+            return False
+        try:
+            manifest = bundle.load_json(self.manifest_path)
+            if manifest.get('source_hash') != source_hash():
+                print(f"Sprite atlas {self.image_path} is stale, using procedural sprites "
+                      "(run main.py --bake)")
+                return False
+            image = pygame.image.load(bundle.stream(self.image_path),
+                                      os.path.basename(self.image_path))
+        except (OSError, ValueError, pygame.error) as e:
+            print(f"Error loading sprite atlas: {e}")
+            return False
+        
+        # convert_alpha só é possível com a janela aberta
+        if pygame.display.get_surface() is not None:
+            image = image.convert_alpha()
+        self.image = image
+        self.rects = {name: tuple(rect) for name, rect in manifest['sprites'].items()}
+        return True
+    
+    def get(self, name):
+        surface = self.cache.get(name)
+        if surface is None:
+            if name in self.rects:
+                surface = self.image.subsurface(self.rects[name])
+            else:
+                surface = self.generators[name]()
+            self.cache[name] = surface
+        return surface
+
+# Atlas em uso (criado por init() ou no primeiro get())
+current = None
+
+def init(image_path=None, manifest_path=None):
+    global current
+    current = Atlas(image_path, manifest_path)
+    return current
+
+def get(name):
+    """Sprite pelo nome do manifesto (ex.: "ship", "enemy.elite", "powerup.shield@-3")"""
+    if current is None:
+        init()
+    return current.get(name)
\ No newline at end of file
@@ -3,6 +3,8 @@ import random
 import math
 import pygame
 from src.config import Config
+from src.graphics import atlas, sprites
+from src.systems.scheduler import Cooldown, Scheduler
 
 class Star:
     def __init__(self, layer):
@@ -81,22 +83,22 @@ class Nebula:
     def reset(self):
         self.x = random.randrange(Config.SCREEN_WIDTH)
         self.y = random.randrange(Config.SCREEN_HEIGHT)
-        self.size = random.randrange(100, 300)
-        self.color = self._generate_color()
+        self.set_shape(random.randrange(100, 300), random.randrange(len(sprites.NEBULA_COLORS)))
         self.alpha = random.randint(30, 50)
         self.pulse_speed = random.uniform(0.001, 0.003)
         self.time_offset = random.random() * math.pi * 2
-        
-    def _generate_color(self):
-        # Cores para nebulosas (tons de roxo, azul e rosa)
-        colors = [
-            (147, 39, 143),  # Roxo
-            (64, 84, 178),   # Azul
-            (191, 64, 191),  # Rosa
-            (75, 0, 130),    # Índigo
-        ]
-        return random.choice(colors)
     
+    def set_shape(self, size, color_index, image=None):
+        self.size = size
+        self.color_index = color_index
+        self.color = sprites.NEBULA_COLORS[color_index]
+        
+        # Gradiente do atlas escalado uma vez; o pulso só muda o alpha da surface
+        if image is None:
+            image = pygame.transform.smoothscale(
+                atlas.get(f"nebula.{color_index}"), (size * 2, size * 2))
+        self.image = image
+        
     def update(self, game_state, volume, time):
         # Pulso suave na transparência
         pulse = (math.sin(time * self.pulse_speed + self.time_offset) + 1) * 0.5
@@ -108,17 +110,9 @@ class Nebula:
             self.reset()
     
     def draw(self, surface):
-        # Cria superfície com transparência
-        nebula_surface = pygame.Surface((self.size * 2, self.size * 2), pygame.SRCALPHA)
-        
-        # Desenha gradiente circular
-        for radius in range(self.size, 0, -2):
-            alpha = int(self.alpha * (radius / self.size))
-            color = (*self.color, alpha)
-            pygame.draw.circle(nebula_surface, color, (self.size, self.size), radius)
-        
-        # Desenha na superfície principal
-        surface.blit(nebula_surface, (self.x - self.size, self.y - self.size))
+        # Gradiente circular com a transparência atual
+        self.image.set_alpha(self.alpha)
+        surface.blit(self.image, (self.x - self.size, self.y - self.size))
 
 class Supernova:
     def __init__(self, x, y):
@@ -166,13 +160,18 @@ class Background:
         # Nebulosas
         self.nebulas = [Nebula() for _ in range(3)]
         
-        # Supernovas
+        # Supernovas: o fundo anima também no menu, então o intervalo fica numa
+        # linha do tempo própria que anda com o relógio real
         self.supernovas = []
-        self.last_nova_time = 0
         self.nova_delay = 5000  # 5 segundos entre supernovas
+        self.timeline = Scheduler()
+        self.last_update = pygame.time.get_ticks()
+        self.nova_cooldown = Cooldown(self.timeline, self.nova_delay)
     
     def update(self, game_state, volume=0):
         current_time = pygame.time.get_ticks()
+        self.timeline.advance(current_time - self.last_update)
+        self.last_update = current_time
         
         # Atualiza estrelas
         for star in self.stars:
@@ -186,12 +185,11 @@ class Background:
         self.supernovas = [nova for nova in self.supernovas if nova.update()]
         
         # Chance de criar nova supernova
-        if (current_time - self.last_nova_time > self.nova_delay and 
-            random.random() < 0.01 + (volume * 0.1)):
+        if self.nova_cooldown.ready and random.random() < 0.01 + (volume * 0.1):
             x = random.randrange(Config.SCREEN_WIDTH)
             y = random.randrange(Config.SCREEN_HEIGHT)
             self.supernovas.append(Supernova(x, y))
-            self.last_nova_time = current_time
+            self.nova_cooldown.restart(self.nova_delay)
     
     def draw(self, surface):
         # Desenha nebulosas primeiro (fundo)
@@ -84,11 +84,22 @@ class HUD:
         surface.blit(score_surf, score_rect)
         surface.blit(restart_surf, restart_rect)
     
+    def draw_loading(self, surface, progress, label=""):
+        """Tela de carregamento: título e barra de progresso (0.0 a 1.0)"""
+        title = self.font_big.render("SPACE SHOOTER", True, self.SCORE_COLOR)
+        surface.blit(title, title.get_rect(center=(Config.SCREEN_WIDTH/2, Config.SCREEN_HEIGHT/2 - 40)))
+        
+        x = (Config.SCREEN_WIDTH - self.health_width) // 2
+        y = Config.SCREEN_HEIGHT // 2
+        pygame.draw.rect(surface, self.HEALTH_BG, (x, y, self.health_width, self.health_height))
+        pygame.draw.rect(surface, self.MULTIPLIER_COLOR,
+                        (x, y, int(self.health_width * progress), self.health_height))
+        
+        if label:
+            text = self.font_small.render(f"Carregando {label}...", True, self.SCORE_COLOR)
+            surface.blit(text, text.get_rect(center=(Config.SCREEN_WIDTH/2, y + 40)))
+    
     def draw(self, surface, game_state):
         # Desenha elementos básicos do HUD
         self.draw_health_bar(surface, game_state.current_health, game_state.max_health)
-        self.draw_score(surface, game_state.score, game_state.high_score, game_state.multiplier)
-        
-        # Se game over, desenha tela de game over
-        if game_state.game_over:
-            self.draw_game_over(surface, game_state.score)
\ No newline at end of file
+        self.draw_score(surface, game_state.score, game_state.high_score, game_state.multiplier)
\ No newline at end of file
@@ -1,7 +1,131 @@
 # src/graphics/particles.py
-import pygame
-import random
 import math
+import random
+import time
+import pygame
+from src.utils.registry import DataRegistry
+
+# Efeitos de partículas definidos por dados (presets de emissor), também
+# simulados pelo designer de partículas do editor. O arquivo de presets
+# (Config.PARTICLE_PRESETS_FILE) sobrescreve os padrões abaixo por nome;
+# campos ausentes ficam com o valor padrão.
+
+DEFAULT_PRESET = {
+    "count": 1,                 # partículas por emissão (int ou [min, max])
+    "angle": [0, 360],          # graus, 0 = direita, 90 = cima
+    "speed": [1, 2],
+    "velocity": None,           # {"x": [min, max], "y": [min, max]} no lugar de angle/speed
+    "lifetime": [20, 40],       # frames
+    "size": [2, 4],
+    "drag": 1.0,                # velocidade multiplicada a cada frame
+    "drag_y": None,             # arrasto só do eixo vertical (None: igual a drag)
+    "gravity": 0.0,             # somado à velocidade vertical a cada frame
+    "shrink": 1.0,              # tamanho multiplicado a cada frame
+    "color": [255, 255, 255],
+    "color_max": None,          # sorteia cada canal entre color e color_max
+    "color_ramp": None,         # [[idade 0..1, [r, g, b]], ...] ao longo da vida
+}
+
+DEFAULT_PRESETS = {
+    "explosion": {"count": 20, "speed": [2, 5], "lifetime": [20, 40], "size": [2, 4],
+                  "color": [255, 200, 0]},
+    "engine_fire": {"velocity": {"x": [-0.5, 0.5], "y": [1, 3]}, "lifetime": [10, 20],
+                    "size": [2, 4], "drag": 0.98, "gravity": -0.1, "shrink": 0.95,
+                    "color": [255, 100, 0], "color_max": [255, 200, 0]},
+    "hit_sparks": {"count": 5, "angle": [-45, 45], "speed": [3, 6], "lifetime": [15, 25],
+                   "size": [1, 3], "drag": 0.98, "drag_y": 1.0, "gravity": 0.2,
+                   "color": [255, 200, 0], "color_max": [255, 255, 100]},
+    "powerup": {"count": 16, "speed": [1, 3], "lifetime": [25, 40], "size": [2, 3],
+                "drag": 0.95, "shrink": 0.98},
+}
+
+RAMP_STEPS = 32
+SPRITE_CACHE_LIMIT = 4096
+# Cores sorteadas (color_max) andam em degraus: menos sprites distintos no cache
+COLOR_STEP = 8
+
+def _range(value, cast):
+    if isinstance(value, (list, tuple)):
+        low, high = value
+        return cast(low), cast(high)
+    return cast(value), cast(value)
+
+def _pick_channel(a, b):
+    """Canal sorteado entre a e b, no degrau de COLOR_STEP mais próximo
+    (canal fixo fica exato)"""
+    if a == b:
+        return a
+    low, high = min(a, b), max(a, b)
+    value = round(random.randint(low, high) / COLOR_STEP) * COLOR_STEP
+    return min(max(value, low), high)
+
+class EmitterPreset:
+    """Preset compilado: intervalos já convertidos e rampa de cor tabelada"""
+    
+    def __init__(self, name, data):
+        self.name = name
+        self.data = data
+        self.count = _range(data["count"], int)
+        velocity = data["velocity"]
+        if velocity:
+            self.velocity_x = _range(velocity["x"], float)
+            self.velocity_y = _range(velocity["y"], float)
+        else:
+            self.velocity_x = self.velocity_y = None
+            low, high = _range(data["angle"], float)
+            self.angle = (math.radians(low), math.radians(high))
+            self.speed = _range(data["speed"], float)
+        self.lifetime = _range(data["lifetime"], int)
+        if self.lifetime[0] < 1:
+            raise ValueError(f"Particle preset '{name}': lifetime must be at least 1 frame")
+        self.size = _range(data["size"], int)
+        self.drag = float(data["drag"])
+        self.drag_y = self.drag if data["drag_y"] is None else float(data["drag_y"])
+        self.gravity = float(data["gravity"])
+        self.shrink = float(data["shrink"])
+        self.color = tuple(int(c) for c in data["color"])
+        self.color_max = tuple(int(c) for c in data["color_max"]) if data["color_max"] else None
+        self.ramp = self._compile_ramp(data["color_ramp"])
+    
+    def _compile_ramp(self, stops):
+        """Tabela de RAMP_STEPS cores por idade (None sem rampa)"""
+        if not stops:
+            return None
+        stops = sorted((float(t), tuple(int(c) for c in color)) for t, color in stops)
+        table = []
+        for i in range(RAMP_STEPS):
+            age = i / (RAMP_STEPS - 1)
+            before = stops[0]
+            after = stops[-1]
+            for stop in stops:
+                if stop[0] <= age:
+                    before = stop
+                if stop[0] >= age:
+                    after = stop
+                    break
+            span = after[0] - before[0]
+            mix = (age - before[0]) / span if span > 0 else 0.0
+            table.append(tuple(int(a + (b - a) * mix) for a, b in zip(before[1], after[1])))
+        return table
+    
+    def make_color(self):
+        if self.color_max is None:
+            return self.color
+        return tuple(_pick_channel(a, b) for a, b in zip(self.color, self.color_max))
+    
+    def make_velocity(self):
+        if self.velocity_x is not None:
+            return (random.uniform(*self.velocity_x), random.uniform(*self.velocity_y))
+        angle = random.uniform(*self.angle)
+        speed = random.uniform(*self.speed)
+        # y da tela cresce para baixo: 90 graus aponta para cima
+        return (math.cos(angle) * speed, -math.sin(angle) * speed)
+
+# Presets em uso (a partícula consulta o comportamento pelo nome do tipo)
+registry = DataRegistry(DEFAULT_PRESETS, EmitterPreset, DEFAULT_PRESET)
+presets = registry.entries
+load = registry.load
+install = registry.install
 
 class Particle:
     def __init__(self, x, y, color, velocity=(0, 0), lifetime=30, size=3, particle_type="normal"):
@@ -15,6 +139,7 @@ class Particle:
         self.size = size
         self.type = particle_type
         self.alpha = 255
+        self.preset = presets.get(particle_type)
     
     def update(self):
         # Atualiza posição
@@ -25,93 +150,113 @@ class Particle:
         self.lifetime -= 1
         
         # Atualiza alpha para fade out
-        self.alpha = int((self.lifetime / self.original_lifetime) * 255)
+        life = max(self.lifetime, 0) / self.original_lifetime
+        self.alpha = int(life * 255)
         
-        # Efeitos específicos por tipo
-        if self.type == "fire":
-            # Partículas de fogo ficam menores com o tempo
-            self.size = max(1, self.size * 0.95)
-            # Afeta velocidade para movimento mais orgânico
-            self.velocity = (
-                self.velocity[0] * 0.98,
-                self.velocity[1] * 0.98 - 0.1
-            )
-        elif self.type == "spark":
-            # Faíscas são afetadas pela gravidade
+        preset = self.preset
+        if preset is None:
+            return
+        # Arrasto e gravidade do preset (fogo sobe e encolhe, faíscas caem)
+        if preset.drag != 1.0 or preset.drag_y != 1.0 or preset.gravity:
             self.velocity = (
-                self.velocity[0] * 0.98,
-                self.velocity[1] + 0.2
+                self.velocity[0] * preset.drag,
+                self.velocity[1] * preset.drag_y + preset.gravity
             )
+        if preset.shrink != 1.0:
+            self.size = max(1, self.size * preset.shrink)
+        if preset.ramp:
+            self.color = preset.ramp[int((1.0 - life) * (RAMP_STEPS - 1))]
 
 class ParticleSystem:
     def __init__(self):
         self.particles = []
+        # Círculo pré-desenhado por (raio, cor); o alpha vai por set_alpha no blit
+        self.sprites = {}
+        
+        # Custo por frame (overlay de profiling e designer do editor)
+        self.emitted = 0
+        self.update_ms = 0.0
+        self.draw_ms = 0.0
+        self.update_avg_ms = 0.0
+        self.draw_avg_ms = 0.0
+        self.peak = 0
     
-    def create_explosion(self, x, y, color, particle_count=20):
-        for _ in range(particle_count):
-            angle = random.uniform(0, math.pi * 2)
-            speed = random.uniform(2, 5)
-            velocity = (
-                math.cos(angle) * speed,
-                math.sin(angle) * speed
-            )
-            lifetime = random.randint(20, 40)
-            size = random.randint(2, 4)
-            
-            particle = Particle(x, y, color, velocity, lifetime, size, "normal")
-            self.particles.append(particle)
+    def emit(self, name, x, y, color=None, count=None):
+        """Dispara o preset `name` em (x, y); `color` substitui a cor do preset"""
+        preset = presets.get(name)
+        if preset is None:
+            return
+        if count is None:
+            count = random.randint(*preset.count)
+        particles = self.particles
+        for _ in range(count):
+            particles.append(Particle(
+                x, y,
+                color or preset.make_color(),
+                preset.make_velocity(),
+                random.randint(*preset.lifetime),
+                random.randint(*preset.size),
+                name
+            ))
+        self.emitted += count
+    
+    def create_explosion(self, x, y, color, particle_count=None):
+        self.emit("explosion", x, y, color, particle_count)
     
     def create_engine_fire(self, x, y):
-        color = (255, random.randint(100, 200), 0)  # Tons de laranja
-        velocity = (
-            random.uniform(-0.5, 0.5),
-            random.uniform(1, 3)
-        )
-        lifetime = random.randint(10, 20)
-        size = random.randint(2, 4)
-        
-        particle = Particle(x, y, color, velocity, lifetime, size, "fire")
-        self.particles.append(particle)
+        self.emit("engine_fire", x, y)
     
     def create_hit_sparks(self, x, y):
-        for _ in range(5):
-            color = (255, random.randint(200, 255), random.randint(0, 100))
-            angle = random.uniform(-math.pi/4, math.pi/4)
-            speed = random.uniform(3, 6)
-            velocity = (
-                math.cos(angle) * speed,
-                -math.sin(angle) * speed
-            )
-            lifetime = random.randint(15, 25)
-            size = random.randint(1, 3)
-            
-            particle = Particle(x, y, color, velocity, lifetime, size, "spark")
-            self.particles.append(particle)
+        self.emit("hit_sparks", x, y)
+    
+    def create_powerup_effect(self, x, y, color=None):
+        self.emit("powerup", x, y, color)
     
     def update(self):
+        start = time.perf_counter()
         # Remove partículas mortas e atualiza as restantes
         self.particles = [p for p in self.particles if p.lifetime > 0]
         for particle in self.particles:
             particle.update()
+        self.peak = max(self.peak, len(self.particles))
+        self.update_ms = (time.perf_counter() - start) * 1000
+        self.update_avg_ms += 0.05 * (self.update_ms - self.update_avg_ms)
+    
+    def _sprite(self, radius, color):
+        key = (radius, color)
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            if len(self.sprites) >= SPRITE_CACHE_LIMIT:
+                # Descarta o mais antigo (dict mantém a ordem de inserção)
+                del self.sprites[next(iter(self.sprites))]
+            sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, color, (radius, radius), radius)
+            self.sprites[key] = sprite
+        return sprite
     
     def draw(self, surface):
+        start = time.perf_counter()
+        sprite_for = self._sprite
+        blit = surface.blit
         for particle in self.particles:
-            # Cria superfície para partícula com alpha
-            particle_surface = pygame.Surface((particle.size * 2, particle.size * 2), pygame.SRCALPHA)
-            
-            # Ajusta cor com alpha atual
-            color_with_alpha = (*particle.color, particle.alpha)
-            
-            # Desenha partícula
-            pygame.draw.circle(
-                particle_surface,
-                color_with_alpha,
-                (particle.size, particle.size),
-                particle.size
-            )
-            
-            # Desenha na superfície principal
-            surface.blit(
-                particle_surface,
-                (int(particle.x - particle.size), int(particle.y - particle.size))
-            )
\ No newline at end of file
+            radius = int(particle.size)
+            if radius < 1 or particle.alpha <= 0:
+                continue
+            sprite = sprite_for(radius, particle.color)
+            sprite.set_alpha(particle.alpha)
+            blit(sprite, (int(particle.x - radius), int(particle.y - radius)))
+        self.draw_ms = (time.perf_counter() - start) * 1000
+        self.draw_avg_ms += 0.05 * (self.draw_ms - self.draw_avg_ms)
+    
+    def get_stats(self):
+        """Partículas vivas, total emitido e custo de update/draw do último frame"""
+        return {
+            'alive': len(self.particles),
+            'peak': self.peak,
+            'emitted': self.emitted,
+            'update_ms': self.update_ms,
+            'draw_ms': self.draw_ms,
+            'update_avg_ms': self.update_avg_ms,
+            'draw_avg_ms': self.draw_avg_ms,
+            'sprites_cached': len(self.sprites),
+        }
\ No newline at end of file
@@ -0,0 +1,101 @@
+# src/graphics/profiler.py
+import pygame
+from src.config import Config
+
+class ProfilerOverlay:
+    """Painel de métricas sobre o jogo (F3 liga/desliga)"""
+    
+    def __init__(self):
+        self.visible = False
+        self.font = pygame.font.Font(None, 20)
+        self.TEXT_COLOR = (180, 255, 180)
+        self.WARN_COLOR = (255, 120, 80)
+        self.BG_COLOR = (0, 0, 0, 170)
+        self.line_height = 16
+    
+    def toggle(self):
+        self.visible = not self.visible
+    
+    def _lines(self, metrics):
+        frame = metrics['frame']
+        audio = metrics['audio']
+        lines = [
+            (f"FPS {frame['fps']:.0f}  frame {frame['frame_ms']:.1f} ms", False),
+            (f"update {frame['update_ms']:.2f} ms  draw {frame['draw_ms']:.2f} ms", False),
+            ("-- audio --", False),
+            # Latência acima de um bloco indica fila acumulando
+            (f"latency {audio['latency_avg_ms']:.1f} / max {audio['latency_max_ms']:.1f} ms",
+             audio['latency_avg_ms'] > audio['deadline_ms']),
+            (f"analysis {audio['analysis_avg_ms']:.2f} / max {audio['analysis_max_ms']:.2f} ms",
+             audio['analysis_max_ms'] > audio['deadline_ms']),
+            (f"queue {audio['queue_depth']:.0f} (max {audio['queue_depth_max']:.0f})",
+             audio['queue_depth'] > 1),
+            (f"dropped {audio['dropped']:.0f}  overflows {audio['overflows']:.0f}",
+             audio['dropped'] > 0 or audio['overflows'] > 0),
+            (f"volume age {audio['volume_age_ms']:.1f} ms", False),
+        ]
+        # Custo por etapa do pipeline de DSP (só no analisador em thread)
+        for label, ms in audio.get('stages', {}).items():
+            lines.append((f"  {label} {ms:.3f} ms", False))
+        if audio.get('dsp_overruns'):
+            lines.append((f"dsp overruns {audio['dsp_overruns']}", True))
+        sfx = metrics.get('sfx')
+        if sfx and sfx['enabled']:
+            lines.append(("-- sfx --", False))
+            lines.append((f"voices {sfx['voices_busy']}/{sfx['voices_total']}  "
+                          f"latency {sfx['latency_avg_ms']:.1f} ms", sfx['dropped'] > 0))
+        particles = metrics.get('particles')
+        if particles:
+            lines.append(("-- particles --", False))
+            lines.append((f"alive {particles['alive']}  peak {particles['peak']}", False))
+            # Acima de ~1/4 do frame as partículas já comprometem o FPS
+            lines.append((f"update {particles['update_avg_ms']:.2f}  draw "
+                          f"{particles['draw_avg_ms']:.2f} ms",
+                          particles['update_avg_ms'] + particles['draw_avg_ms'] > 250 / Config.FPS))
+        enemies = metrics.get('enemies')
+        if enemies:
+            lines.append(("-- enemies --", False))
+            lines.append((f"alive {enemies['alive']}  patterns {enemies['patterns']}  "
+                          f"step {enemies['step_avg_ms']:.2f} ms", False))
+        bullets = metrics.get('bullets')
+        if bullets:
+            lines.append(("-- bullets --", False))
+            lines.append((f"alive {bullets['alive']}  peak {bullets['peak']}  "
+                          f"dropped {bullets['dropped']}", bullets['dropped'] > 0))
+            lines.append((f"step {bullets['step_avg_ms']:.2f}  draw "
+                          f"{bullets['draw_avg_ms']:.2f} ms",
+                          bullets['step_avg_ms'] + bullets['draw_avg_ms'] > 250 / Config.FPS))
+        controls = metrics.get('input')
+        if controls and controls['latency']:
+            lines.append(("-- input --", False))
+            # Tecla até o flip que mostra o efeito; acima de 2 frames fica perceptível
+            for action, stats in controls['latency'].items():
+                lines.append((f"{action} {stats['avg_ms']:.1f} / p95 {stats['p95_ms']:.1f} ms",
+                              stats['p95_ms'] > 2000 / Config.FPS))
+        recorder = metrics.get('recorder')
+        if recorder:
+            lines.append(("-- recording --", False))
+            lines.append((f"capture {recorder['capture_avg_ms']:.2f} / max "
+                          f"{recorder['capture_max_ms']:.2f} ms", False))
+            lines.append((f"written {recorder['written']}  queued {recorder['queued']}  "
+                          f"dropped {recorder['dropped']}", recorder['dropped'] > 0))
+        return lines
+    
+    def draw(self, surface, metrics):
+        if not self.visible:
+            return
+        lines = self._lines(metrics)
+        
+        # Fundo translúcido atrás do texto
+        width = 260
+        height = len(lines) * self.line_height + 10
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel.fill(self.BG_COLOR)
+        x = surface.get_width() - width - 10
+        y = 60
+        surface.blit(panel, (x, y))
+        
+        for i, (text, warn) in enumerate(lines):
+            color = self.WARN_COLOR if warn else self.TEXT_COLOR
+            text_surf = self.font.render(text, True, color)
+            surface.blit(text_surf, (x + 6, y + 5 + i * self.line_height))
\ No newline at end of file
@@ -0,0 +1,190 @@
+# src/graphics/recorder.py
+import collections
+import os
+import threading
+import time
+import numpy as np
+import pygame
+from src.config import Config
+
+DROP_POLICIES = ("drop_newest", "drop_oldest")
+
+class Y4MWriter:
+    """Vídeo YUV4MPEG2 (4:2:0) cru: qualquer ffmpeg/player converte depois"""
+    
+    def __init__(self, path, size, fps):
+        self.file = open(path, 'wb')
+        width, height = size
+        # 4:2:0 precisa de dimensões pares
+        self.width = width - width % 2
+        self.height = height - height % 2
+        self.file.write(f"YUV4MPEG2 W{self.width} H{self.height} F{fps}:1 Ip A1:1 C420jpeg\n".encode())
+    
+    def write(self, rgb, index):
+        rgb = rgb[:self.height, :self.width].astype(np.uint16)
+        r, g, b = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+        # BT.601 full range (JPEG) em ponto fixo; luma cabe em uint16
+        # (77 + 150 + 29 = 256) e o croma é calculado já na média 2x2
+        y = (77 * r + 150 * g + 29 * b) >> 8
+        half = rgb.reshape(self.height // 2, 2, self.width // 2, 2, 3).sum(axis=(1, 3), dtype=np.int32) >> 2
+        hr, hg, hb = half[..., 0], half[..., 1], half[..., 2]
+        u = ((-43 * hr - 85 * hg + 128 * hb) >> 8) + 128
+        v = ((128 * hr - 107 * hg - 21 * hb) >> 8) + 128
+        self.file.write(b"FRAME\n")
+        self.file.write(y.astype(np.uint8).tobytes())
+        for plane in (u, v):
+            self.file.write(np.clip(plane, 0, 255).astype(np.uint8).tobytes())
+    
+    def close(self):
+        self.file.close()
+
+class PNGSequenceWriter:
+    """Um PNG por frame num diretório (frame_000000.png, ...)"""
+    
+    def __init__(self, path, size, fps):
+        self.directory = path
+        os.makedirs(path, exist_ok=True)
+    
+    def write(self, rgb, index):
+        height, width = rgb.shape[:2]
+        image = pygame.image.frombuffer(np.ascontiguousarray(rgb).tobytes(), (width, height), 'RGB')
+        pygame.image.save(image, os.path.join(self.directory, f"frame_{index:06d}.png"))
+    
+    def close(self):
+        pass
+
+def writer_for(path):
+    return Y4MWriter if path.lower().endswith('.y4m') else PNGSequenceWriter
+
+class FrameRecorder:
+    """Captura frames da tela e grava numa thread de fundo.
+    
+    capture() só copia os pixels crus da surface para um buffer de um pool
+    pré-alocado e o enfileira; conversão de cor e escrita em disco ficam
+    com a thread de escrita. Sem buffer livre (disco mais lento que o jogo)
+    o frame é descartado pela política: "drop_newest" descarta o frame atual,
+    "drop_oldest" reaproveita o frame mais antigo ainda não gravado.
+    """
+    
+    def __init__(self, path, size, fps=None, buffers=None, drop_policy=None, every=None):
+        self.path = path
+        self.every = max(1, every or Config.RECORD_EVERY)
+        self.fps = fps or Config.FPS // self.every
+        self.drop_policy = drop_policy or Config.RECORD_DROP_POLICY
+        if self.drop_policy not in DROP_POLICIES:
+            raise ValueError(f"Unknown drop policy: {self.drop_policy}")
+        
+        self.size = size
+        self.layout = None
+        self.free = []
+        self.pending = collections.deque()
+        self.buffer_count = buffers or Config.RECORD_BUFFERS
+        self.cond = threading.Condition()
+        self.closed = False
+        
+        self.frame_index = 0
+        self.captured = 0
+        self.dropped = 0
+        self.written = 0
+        self.capture_ms = 0.0
+        self.capture_avg_ms = 0.0
+        self.capture_max_ms = 0.0
+        self.write_avg_ms = 0.0
+        
+        self.writer = writer_for(path)(path, size, self.fps)
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+    
+    def _setup(self, surface):
+        # Layout dos pixels da surface (ordem dos bytes R, G e B dentro do pixel)
+        bytesize = surface.get_bytesize()
+        if bytesize not in (3, 4):
+            raise ValueError(f"Unsupported surface depth: {surface.get_bitsize()} bits")
+        shifts = surface.get_shifts()
+        self.layout = (surface.get_size(), surface.get_pitch(), bytesize,
+                       [shift // 8 for shift in shifts[:3]])
+        nbytes = surface.get_pitch() * surface.get_height()
+        self.free = [bytearray(nbytes) for _ in range(self.buffer_count)]
+    
+    def capture(self, surface):
+        """Copia o frame atual (chamar depois de desenhar, antes do flip)"""
+        index = self.frame_index
+        self.frame_index += 1
+        if index % self.every:
+            return
+        start = time.perf_counter()
+        if self.layout is None:
+            self._setup(surface)
+        
+        with self.cond:
+            if self.free:
+                buffer = self.free.pop()
+            elif self.drop_policy == "drop_oldest" and self.pending:
+                buffer = self.pending.popleft()[1]
+                self.dropped += 1
+            else:
+                self.dropped += 1
+                buffer = None
+        
+        if buffer is not None:
+            view = surface.get_view('0')
+            pixels = memoryview(view)
+            buffer[:] = pixels
+            # Libera o lock da surface antes do próximo blit/flip
+            pixels.release()
+            del view
+            with self.cond:
+                self.pending.append((self.captured, buffer))
+                self.captured += 1
+                self.cond.notify()
+        
+        self.capture_ms = (time.perf_counter() - start) * 1000
+        self.capture_avg_ms += 0.05 * (self.capture_ms - self.capture_avg_ms)
+        self.capture_max_ms = max(self.capture_max_ms, self.capture_ms)
+    
+    def _to_rgb(self, buffer):
+        (width, height), pitch, bytesize, channels = self.layout
+        rows = np.frombuffer(buffer, dtype=np.uint8).reshape(height, pitch)
+        pixels = rows[:, :width * bytesize].reshape(height, width, bytesize)
+        return pixels[..., channels]
+    
+    def _run(self):
+        while True:
+            with self.cond:
+                while not self.pending and not self.closed:
+                    self.cond.wait()
+                if not self.pending:
+                    break
+                index, buffer = self.pending.popleft()
+            start = time.perf_counter()
+            try:
+                self.writer.write(self._to_rgb(buffer), index)
+                self.written += 1
+            except Exception as e:
+                print(f"Error writing frame {index}: {e}")
+            finally:
+                with self.cond:
+                    self.free.append(buffer)
+            self.write_avg_ms += 0.05 * ((time.perf_counter() - start) * 1000 - self.write_avg_ms)
+        self.writer.close()
+    
+    def get_stats(self):
+        with self.cond:
+            queued = len(self.pending)
+        return {
+            'captured': self.captured,
+            'written': self.written,
+            'dropped': self.dropped,
+            'queued': queued,
+            'capture_ms': self.capture_ms,
+            'capture_avg_ms': self.capture_avg_ms,
+            'capture_max_ms': self.capture_max_ms,
+            'write_avg_ms': self.write_avg_ms,
+        }
+    
+    def close(self, timeout=10.0):
+        """Grava os frames pendentes e fecha o arquivo"""
+        with self.cond:
+            self.closed = True
+            self.cond.notify()
+        self.thread.join(timeout)
\ No newline at end of file
@@ -0,0 +1,243 @@
+# src/graphics/sprites.py
+import math
+import pygame
+from src.config import Config
+
+# Geradores procedurais de todos os sprites do jogo. São usados pelo bake do
+# atlas (src/graphics/atlas.py) e como fallback quando o atlas está ausente
+# ou desatualizado; qualquer mudança aqui invalida o atlas gerado.
+
+POWERUP_COLORS = {
+    'double_shot': (255, 50, 50),    # Vermelho
+    'triple_shot': (255, 100, 50),   # Laranja
+    'shield': (50, 150, 255),        # Azul
+    'speed': (50, 255, 50)           # Verde
+}
+
+# Balas inimigas (src/entities/bullets.py): a ordem é o índice do sprite
+BULLET_COLORS = {
+    'orb': (255, 60, 120),      # Rosa (rajada radial)
+    'spark': (255, 170, 40),    # Laranja (espiral)
+    'needle': (120, 220, 255),  # Ciano (mirada)
+}
+
+# Power-ups oscilam entre -15 e 15 graus; cada grau é um frame pré-rotacionado
+POWERUP_ROTATIONS = range(-15, 16)
+
+NEBULA_COLORS = [
+    (147, 39, 143),  # Roxo
+    (64, 84, 178),   # Azul
+    (191, 64, 191),  # Rosa
+    (75, 0, 130),    # Índigo
+]
+
+# Raio de referência do gradiente das nebulosas (escalado no reset)
+NEBULA_RADIUS = 128
+
+def ship():
+    """Cria a superfície da nave"""
+    # Tamanho maior para mais detalhes
+    surface = pygame.Surface((60, 80), pygame.SRCALPHA)
+    
+    # Cores
+    RED = (220, 20, 20)        # Vermelho mais escuro
+    DARK_RED = (180, 10, 10)   # Vermelho ainda mais escuro
+    GOLD = (255, 215, 0)       # Dourado para detalhes
+    GRAY = (80, 80, 80)        # Cinza para partes metálicas
+    
+    # Corpo principal (forma de asa)
+    points = [
+        (30, 0),    # Ponta
+        (0, 60),    # Base esquerda
+        (10, 70),   # Entalhe esquerdo
+        (50, 70),   # Entalhe direito
+        (60, 60),   # Base direita
+    ]
+    pygame.draw.polygon(surface, RED, points)
+    
+    # Contorno do corpo
+    pygame.draw.polygon(surface, DARK_RED, points, 2)
+    
+    # Asas laterais
+    left_wing = [
+        (5, 40),
+        (0, 60),
+        (20, 55)
+    ]
+    right_wing = [
+        (55, 40),
+        (60, 60),
+        (40, 55)
+    ]
+    pygame.draw.polygon(surface, DARK_RED, left_wing)
+    pygame.draw.polygon(surface, DARK_RED, right_wing)
+    
+    # Motores (retângulos na base)
+    pygame.draw.rect(surface, GRAY, (15, 65, 10, 15))
+    pygame.draw.rect(surface, GRAY, (35, 65, 10, 15))
+    
+    # Detalhes dourados (círculos e linhas)
+    pygame.draw.circle(surface, GOLD, (30, 30), 8)
+    pygame.draw.circle(surface, GOLD, (30, 30), 8, 1)
+    pygame.draw.line(surface, GOLD, (10, 50), (50, 50), 2)
+    
+    return surface
+
+def shield(size=100):
+    """Cria a superfície do escudo (maior lado da nave + 20)"""
+    surface = pygame.Surface((size, size), pygame.SRCALPHA)
+    center = size // 2
+    
+    # Círculo externo com gradiente
+    for radius in range(size//2, size//2 - 4, -1):
+        alpha = int(255 * (radius - (size//2 - 4)) / 4)
+        pygame.draw.circle(surface, (50, 150, 255, alpha), (center, center), radius)
+    
+    return surface
+
+def enemy(enemy_type):
+    size = 40
+    surface = pygame.Surface((size, size), pygame.SRCALPHA)
+    
+    if enemy_type == "basic":
+        # Inimigo triangular básico (vermelho)
+        color = (200, 30, 30)
+        points = [(size//2, 0), (0, size), (size, size)]
+        pygame.draw.polygon(surface, color, points)
+        pygame.draw.polygon(surface, (150, 20, 20), points, 2)
+    
+    elif enemy_type == "elite":
+        # Inimigo hexagonal mais elaborado (dourado)
+        color = (218, 165, 32)
+        radius = size // 2
+        points = []
+        for i in range(6):
+            angle = math.pi/3 * i
+            x = radius + radius * math.cos(angle)
+            y = radius + radius * math.sin(angle)
+            points.append((x, y))
+        pygame.draw.polygon(surface, color, points)
+        pygame.draw.polygon(surface, (255, 215, 0), points, 2)
+    
+    else:  # boss
+        # Chefe maior e mais detalhado
+        color = (180, 0, 0)
+        pygame.draw.circle(surface, color, (size//2, size//2), size//2)
+        pygame.draw.circle(surface, (255, 215, 0), (size//2, size//2), size//2, 2)
+        pygame.draw.circle(surface, (255, 215, 0), (size//2, size//2), size//4)
+    
+    return surface
+
+def powerup(powerup_type):
+    size = 30
+    surface = pygame.Surface((size, size), pygame.SRCALPHA)
+    
+    base_color = POWERUP_COLORS.get(powerup_type, (255, 255, 255))
+    glow_color = tuple(min(255, c + 100) for c in base_color)
+    
+    # Desenha o power-up com efeito de brilho
+    if powerup_type in ['double_shot', 'triple_shot']:
+        # Forma de projétil
+        points = [
+            (size//2, 0),
+            (0, size),
+            (size//2, size*3//4),
+            (size, size)
+        ]
+        # Brilho
+        pygame.draw.polygon(surface, glow_color, points)
+        # Base
+        smaller_points = [(x + 2 if i % 2 == 0 else x - 2, y + 2 if i % 2 == 1 else y - 2)
+                        for i, (x, y) in enumerate(points)]
+        pygame.draw.polygon(surface, base_color, smaller_points)
+    
+    elif powerup_type == 'shield':
+        # Forma circular com brilho
+        pygame.draw.circle(surface, glow_color, (size//2, size//2), size//2)
+        pygame.draw.circle(surface, base_color, (size//2, size//2), size//2 - 2)
+        pygame.draw.circle(surface, glow_color, (size//2, size//2), size//4)
+    
+    elif powerup_type == 'speed':
+        # Forma de raio
+        points = [
+            (size//2, 0),
+            (size//4, size//2),
+            (size//2, size//2),
+            (size//4, size),
+            (size*3//4, size//2),
+            (size//2, size//2)
+        ]
+        # Brilho
+        pygame.draw.polygon(surface, glow_color, points)
+        # Base
+        smaller_points = [(x + 1 if i % 2 == 0 else x - 1, y + 1 if i % 2 == 1 else y - 1)
+                        for i, (x, y) in enumerate(points)]
+        pygame.draw.polygon(surface, base_color, smaller_points)
+    
+    return surface
+
+def projectile(game_state):
+    # Diferentes tipos de tiro baseado no estado do jogo
+    if game_state == "void":
+        # Tiro básico (azul pequeno)
+        surface = pygame.Surface((4, 10), pygame.SRCALPHA)
+        pygame.draw.rect(surface, (0, 255, 255), (0, 0, 4, 10))
+    
+    elif game_state == "ambient":
+        # Tiro médio (vermelho)
+        surface = pygame.Surface((6, 15), pygame.SRCALPHA)
+        pygame.draw.rect(surface, (255, 50, 50), (0, 0, 6, 15))
+    
+    else:  # intense
+        # Tiro grande (dourado)
+        surface = pygame.Surface((8, 20), pygame.SRCALPHA)
+        pygame.draw.rect(surface, (255, 215, 0), (0, 0, 8, 20))
+    
+    return surface
+
+def bullet(kind):
+    """Bala inimiga pequena: borda colorida e núcleo claro"""
+    color = BULLET_COLORS[kind]
+    size = 12 if kind == 'orb' else 10
+    surface = pygame.Surface((size, size), pygame.SRCALPHA)
+    center = size // 2
+    if kind == 'needle':
+        # Losango
+        points = [(center, 0), (size - 1, center), (center, size - 1), (0, center)]
+        pygame.draw.polygon(surface, color, points)
+    else:
+        pygame.draw.circle(surface, color, (center, center), center)
+    pygame.draw.circle(surface, (255, 255, 230), (center, center), size // 5)
+    return surface
+
+def nebula(color, radius=NEBULA_RADIUS):
+    """Gradiente circular com alpha máximo; a opacidade real vem de set_alpha"""
+    surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+    for r in range(radius, 0, -2):
+        alpha = int(255 * (r / radius))
+        pygame.draw.circle(surface, (*color, alpha), (radius, radius), r)
+    return surface
+
+def rotated(base, angle):
+    return lambda: pygame.transform.rotate(base(), angle)
+
+def catalog():
+    """Nome -> função geradora de cada sprite do atlas"""
+    generators = {
+        'ship': ship,
+        'shield': shield,
+    }
+    for enemy_type in ("basic", "elite", "boss"):
+        generators[f"enemy.{enemy_type}"] = lambda t=enemy_type: enemy(t)
+    for powerup_type in POWERUP_COLORS:
+        base = lambda t=powerup_type: powerup(t)
+        generators[f"powerup.{powerup_type}"] = base
+        for angle in POWERUP_ROTATIONS:
+            generators[f"powerup.{powerup_type}@{angle}"] = rotated(base, angle)
+    for game_state in Config.AUDIO_STATES:
+        generators[f"projectile.{game_state}"] = lambda s=game_state: projectile(s)
+    for kind in BULLET_COLORS:
+        generators[f"bullet.{kind}"] = lambda k=kind: bullet(k)
+    for i, color in enumerate(NEBULA_COLORS):
+        generators[f"nebula.{i}"] = lambda c=color: nebula(c)
+    return generators
\ No newline at end of file
@@ -1,9 +1,22 @@
 # src/states/game_state.py
-import json
-import os
+from src.states.persistence import WriteBehindStore
+from src.states.run_history import RunRecorder
+from src.systems import tuning
 
 class GameState:
-    def __init__(self):
+    def __init__(self, highscore_path='highscore.json', history=None, track="unknown", persist=True):
+        # Persistência do recorde: gravação adiada e atômica em segundo plano
+        # (persist=False só lê o recorde salvo: partidas de teste do editor)
+        self.store = WriteBehindStore(highscore_path)
+        self.persist = persist
+        
+        # Histórico de partidas (opcional) e estatísticas da partida atual,
+        # criadas no primeiro passo de jogo (só menu não vira partida)
+        self.history = history
+        self.track = track
+        self.run = None
+        self.last_run = None
+        
         # Pontuação
         self.score = 0
         self.high_score = self.load_high_score()
@@ -20,13 +33,8 @@ class GameState:
         
     def add_score(self, base_points, game_state):
         # Ajusta multiplicador baseado no estado do áudio
-        if game_state == "void":
-            self.multiplier = 1.0
-        elif game_state == "ambient":
-            self.multiplier = 1.5
-        else:  # intense
-            self.multiplier = 2.0
-            
+        self.multiplier = tuning.current.score_multiplier[game_state]
+        
         # Calcula pontos com multiplicador
         points = int(base_points * self.multiplier)
         self.score += points
@@ -46,6 +54,7 @@ class GameState:
         if self.current_health <= 0:
             self.game_over = True
             self.is_alive = False
+            self.finish_run()
     
     def heal(self, amount):
         if not self.is_alive:
@@ -53,7 +62,35 @@ class GameState:
             
         self.current_health = min(self.max_health, self.current_health + amount)
     
+    def record_kill(self, enemy_type):
+        if self.run is not None:
+            self.run.record_kill(enemy_type)
+    
+    def record_powerup(self, powerup_type):
+        if self.run is not None:
+            self.run.record_powerup(powerup_type)
+    
+    def tick(self, audio_state, elapsed):
+        """Contabiliza o passo de jogo (ms) no estado de áudio atual"""
+        if self.run is None:
+            self.run = RunRecorder(self.track)
+        self.run.tick(audio_state, elapsed)
+    
+    def finish_run(self):
+        """Envia a partida ao histórico (uma vez por partida, sem bloquear)"""
+        if self.run is None or not self.run.ticks:
+            self.run = None
+            return
+        # Guardada para a tela de game over (a gravação no histórico é assíncrona)
+        self.last_run = self.run.finish(self.score, completed=self.game_over)
+        if self.history is not None:
+            self.history.record(self.last_run)
+        self.run = None
+    
     def reset(self):
+        # Partida abandonada antes do game over também entra no histórico
+        self.finish_run()
+        
         self.score = 0
         self.multiplier = 1.0
         self.current_health = self.max_health
@@ -62,18 +99,16 @@ class GameState:
         self.level = 1
     
     def load_high_score(self):
-        try:
-            if os.path.exists('highscore.json'):
-                with open('highscore.json', 'r') as f:
-                    data = json.load(f)
-                    return data.get('high_score', 0)
-        except Exception as e:
-            print(f"Error loading high score: {e}")
-        return 0
+        return self.store.get('high_score', 0)
     
     def save_high_score(self):
-        try:
-            with open('highscore.json', 'w') as f:
-                json.dump({'high_score': self.high_score}, f)
-        except Exception as e:
-            print(f"Error saving high score: {e}")
\ No newline at end of file
+        """Agenda a gravação do recorde (não bloqueia o frame)"""
+        if self.persist:
+            self.store.set('high_score', self.high_score)
+    
+    def close(self):
+        """Grava o que estiver pendente; chamar no encerramento do jogo"""
+        self.finish_run()
+        self.store.close()
+        if self.history is not None:
+            self.history.close()
\ No newline at end of file
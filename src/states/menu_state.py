@@ -0,0 +1,305 @@
+# src/states/menu_state.py
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pygame
+from src.config import Config
+from src.systems.replay import draw_frame
+
+class State:
+    """Cena do jogo na pilha de estados (menu, jogo, pausa, game over).
+    
+    load() roda numa thread de preload e devolve os assets da cena (textos
+    renderizados, overlays, consultas ao histórico); enter() só usa o que já
+    está pronto. `preload` lista as cenas que podem vir depois desta, que a
+    pilha começa a preparar assim que esta entra.
+    """
+    name = None
+    overlay = False  # desenha por cima da cena de baixo
+    preload = ()
+    
+    def __init__(self, stack):
+        self.stack = stack
+        self.game = stack.game
+        self.assets = None
+        self.future = None
+    
+    def load(self):
+        return {}
+    
+    def enter(self):
+        pass
+    
+    def exit(self):
+        pass
+    
+    def handle_event(self, event):
+        pass
+    
+    def update(self):
+        pass
+    
+    def draw(self, surface):
+        pass
+
+def render_lines(font, lines, color):
+    return [font.render(line, True, color) for line in lines]
+
+def blit_centered(surface, images, y, spacing=8):
+    for image in images:
+        surface.blit(image, image.get_rect(midtop=(Config.SCREEN_WIDTH // 2, y)))
+        y += image.get_height() + spacing
+    return y
+
+def dim_overlay(alpha=128):
+    overlay = pygame.Surface((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT))
+    overlay.fill((0, 0, 0))
+    overlay.set_alpha(alpha)
+    return overlay
+
+def score_lines(runs, current=None):
+    """Linhas do placar; a partida `current` sai marcada"""
+    lines = []
+    for i, run in enumerate(runs):
+        mark = "  <" if current is not None and run['started_at'] == current['started_at'] else ""
+        lines.append(f"{i + 1:>2}. {run['score']:>7}  {run['track']}{mark}")
+    return lines
+
+class MenuState(State):
+    name = 'menu'
+    preload = ('play',)
+    
+    def load(self):
+        hud = self.game.hud
+        history = self.game.game_state.history
+        top = history.top_scores(5) if history is not None else []
+        return {
+            'title': hud.font_big.render("SPACE SHOOTER", True, hud.SCORE_COLOR),
+            'hint': hud.font_small.render("SPACE para jogar  -  ESC para sair", True, hud.SCORE_COLOR),
+            'scores': render_lines(hud.font_small, score_lines(top), hud.MULTIPLIER_COLOR),
+        }
+    
+    def handle_event(self, event):
+        if event.type != pygame.KEYDOWN:
+            return
+        if event.key in (pygame.K_SPACE, pygame.K_RETURN):
+            self.stack.replace('play')
+        elif event.key == pygame.K_ESCAPE:
+            self.game.running = False
+    
+    def update(self):
+        # O fundo continua animado atrás do menu
+        self.game.background.update("void")
+    
+    def draw(self, surface):
+        self.game.background.draw(surface)
+        y = blit_centered(surface, [self.assets['title']], Config.SCREEN_HEIGHT // 4)
+        y = blit_centered(surface, self.assets['scores'], y + 30, spacing=4)
+        blit_centered(surface, [self.assets['hint']], max(y + 30, Config.SCREEN_HEIGHT * 3 // 4))
+
+class PlayState(State):
+    name = 'play'
+    preload = ('pause', 'game_over')
+    
+    def load(self):
+        # Pools cheios antes da partida: spawns do começo não alocam
+        game = self.game
+        game.enemy_spawner.pool.prewarm(Config.POOL_PREWARM['enemies'])
+        game.powerup_spawner.pool.prewarm(Config.POOL_PREWARM['powerups'])
+        game.player.projectile_pool.prewarm(Config.POOL_PREWARM['projectiles'])
+        return {}
+    
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN and event.key in (pygame.K_ESCAPE, pygame.K_p):
+            self.stack.push('pause')
+    
+    def update(self):
+        self.game.update_world()
+        if self.game.game_state.game_over:
+            self.stack.push('game_over')
+    
+    def draw(self, surface):
+        self.game.draw_world(surface)
+
+class PauseState(State):
+    name = 'pause'
+    overlay = True
+    preload = ('menu',)
+    
+    def load(self):
+        hud = self.game.hud
+        return {
+            'overlay': dim_overlay(),
+            'title': hud.font_big.render("PAUSE", True, hud.SCORE_COLOR),
+            'hint': render_lines(hud.font_small, ["P/ESC para continuar", "Q para voltar ao menu"],
+                                 hud.SCORE_COLOR),
+        }
+    
+    def handle_event(self, event):
+        if event.type != pygame.KEYDOWN:
+            return
+        if event.key in (pygame.K_ESCAPE, pygame.K_p):
+            self.stack.pop()
+        elif event.key == pygame.K_q:
+            self.game.reset_game()
+            self.stack.reset('menu')
+    
+    def draw(self, surface):
+        surface.blit(self.assets['overlay'], (0, 0))
+        y = blit_centered(surface, [self.assets['title']], Config.SCREEN_HEIGHT // 3)
+        blit_centered(surface, self.assets['hint'], y + 20)
+
+class GameOverState(State):
+    name = 'game_over'
+    overlay = True
+    preload = ('menu',)
+    
+    def load(self):
+        # Leaderboard da trilha atual consultado em segundo plano durante a
+        # partida (ainda sem ela; entra em enter())
+        hud = self.game.hud
+        state = self.game.game_state
+        best = state.history.leaderboard(state.track, 5) if state.history is not None else []
+        return {
+            'runs': best,
+            'hint': hud.font_small.render("R para o replay  -  M para o menu", True, hud.SCORE_COLOR),
+            'replay': hud.font_normal.render("REPLAY", True, hud.HEALTH_FG),
+        }
+    
+    def enter(self):
+        self.replay_tick = None
+        # A partida que acabou de terminar (a gravação no histórico é assíncrona)
+        hud = self.game.hud
+        runs = self.assets['runs']
+        last_run = self.game.game_state.last_run
+        if last_run is not None and self.game.game_state.history is not None:
+            if all(run['started_at'] != last_run['started_at'] for run in runs):
+                runs = sorted(runs + [last_run], key=lambda run: -run['score'])[:5]
+        self.assets['best'] = render_lines(hud.font_small, score_lines(runs, last_run),
+                                           hud.MULTIPLIER_COLOR)
+    
+    def handle_event(self, event):
+        if event.type != pygame.KEYDOWN:
+            return
+        if event.key == pygame.K_SPACE:
+            self.game.reset_game()
+            self.stack.pop()
+        elif event.key == pygame.K_m:
+            self.game.reset_game()
+            self.stack.reset('menu')
+        elif event.key == pygame.K_r:
+            # Kill-cam: últimos segundos antes do game over, em loop
+            self.replay_tick = None if self.replay_tick is not None else self._replay_start()
+    
+    def _replay_start(self):
+        replay = self.game.replay
+        return max(replay.oldest, replay.tick - Config.KILLCAM_SECONDS * Config.FPS)
+    
+    def update(self):
+        if self.replay_tick is not None:
+            self.replay_tick += 1
+            if self.replay_tick >= self.game.replay.tick:
+                self.replay_tick = self._replay_start()
+    
+    def draw(self, surface):
+        frame = self.game.replay.frame(self.replay_tick) if self.replay_tick is not None else None
+        if frame is not None:
+            surface.fill(Config.BLACK)
+            self.game.background.draw(surface)
+            draw_frame(surface, frame)
+            surface.blit(self.assets['replay'], (20, 20))
+            blit_centered(surface, [self.assets['hint']], Config.SCREEN_HEIGHT - 40)
+            return
+        self.game.hud.draw_game_over(surface, self.game.game_state.score)
+        y = blit_centered(surface, self.assets['best'], Config.SCREEN_HEIGHT // 2 + 110, spacing=2)
+        blit_centered(surface, [self.assets['hint']], y + 10)
+
+STATES = {state.name: state for state in (MenuState, PlayState, PauseState, GameOverState)}
+
+class StateStack:
+    """Pilha de cenas com preparação antecipada numa thread de fundo.
+    
+    Ao entrar numa cena, as cenas de `preload` são instanciadas e seus
+    load() vão para o executor; quando a transição acontece os assets já
+    estão prontos e a troca cabe num frame. Se não estiverem, a espera é
+    contada em `stalls`.
+    """
+    
+    def __init__(self, game):
+        self.game = game
+        self.states = []
+        self.prepared = {}
+        self.stalls = 0
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="state-preload")
+    
+    @property
+    def top(self):
+        return self.states[-1] if self.states else None
+    
+    def prepare(self, name):
+        state = self.prepared.get(name)
+        if state is None:
+            state = STATES[name](self)
+            state.future = self.executor.submit(state.load)
+            self.prepared[name] = state
+        return state
+    
+    def _activate(self, name):
+        state = self.prepare(name)
+        del self.prepared[name]
+        if not state.future.done():
+            self.stalls += 1
+            start = time.perf_counter()
+            state.assets = state.future.result()
+            print(f"State '{name}' was not preloaded, waited "
+                  f"{(time.perf_counter() - start) * 1000:.1f} ms")
+        else:
+            state.assets = state.future.result()
+        state.enter()
+        for next_name in state.preload:
+            self.prepare(next_name)
+        return state
+    
+    def push(self, name):
+        state = self._activate(name)
+        self.states.append(state)
+        return state
+    
+    def pop(self):
+        state = self.states.pop()
+        state.exit()
+        # A cena que volta ao topo prepara de novo as próximas (ex.: leaderboard atualizado)
+        if self.top is not None:
+            for next_name in self.top.preload:
+                self.prepare(next_name)
+        return state
+    
+    def replace(self, name):
+        if self.states:
+            self.pop()
+        return self.push(name)
+    
+    def reset(self, name):
+        """Esvazia a pilha e começa de novo na cena `name`"""
+        while self.states:
+            self.pop()
+        return self.push(name)
+    
+    def handle_event(self, event):
+        if self.top is not None:
+            self.top.handle_event(event)
+    
+    def update(self):
+        # Só a cena do topo atualiza (pausa e game over congelam o jogo)
+        if self.top is not None:
+            self.top.update()
+    
+    def draw(self, surface):
+        # Desenha da última cena opaca até o topo
+        start = len(self.states) - 1
+        while start > 0 and self.states[start].overlay:
+            start -= 1
+        for state in self.states[start:]:
+            state.draw(surface)
+    
+    def close(self):
+        self.executor.shutdown(wait=True, cancel_futures=True)
\ No newline at end of file
@@ -0,0 +1,135 @@
+# src/states/persistence.py
+import json
+import os
+import tempfile
+import threading
+import time
+
+def atomic_write(path, data):
+    """Grava `data` (bytes) num arquivo temporário e troca por rename.
+    
+    O fsync antes do rename garante que o nome nunca aponte para um
+    arquivo vazio ou pela metade, nem depois de uma queda.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(prefix='.tmp-', dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+def atomic_write_json(path, data):
+    """Grava JSON de forma atômica (nunca corrompe o original)"""
+    atomic_write(path, json.dumps(data).encode('utf-8'))
+
+class WriteBehindStore:
+    """Persistência de um dict JSON com escrita adiada numa thread de fundo.
+    
+    set() só atualiza a memória e agenda a gravação; após `delay` segundos
+    sem novas mudanças (ou no máximo `max_delay` desde a primeira mudança
+    pendente) a thread grava o arquivo de forma atômica. flush() grava na
+    hora e close() garante a gravação no encerramento.
+    """
+    
+    def __init__(self, path, delay=1.0, max_delay=5.0):
+        self.path = path
+        self.delay = delay
+        self.max_delay = max_delay
+        self.data = self._load()
+        
+        self._lock = threading.Lock()
+        self._io_lock = threading.Lock()
+        self._version = 0
+        self._written_version = 0
+        self._wakeup = threading.Condition(self._lock)
+        self._dirty_since = None
+        self._last_change = None
+        self._closed = False
+        
+        self._thread = threading.Thread(target=self._writer, daemon=True)
+        self._thread.start()
+    
+    def _load(self):
+        try:
+            if os.path.exists(self.path):
+                with open(self.path, 'r') as f:
+                    return json.load(f)
+        except Exception as e:
+            print(f"Error loading {self.path}: {e}")
+        return {}
+    
+    def get(self, key, default=None):
+        return self.data.get(key, default)
+    
+    def set(self, key, value):
+        with self._lock:
+            if self.data.get(key) == value:
+                return
+            self.data[key] = value
+            self._version += 1
+            now = time.monotonic()
+            self._last_change = now
+            if self._dirty_since is None:
+                self._dirty_since = now
+            self._wakeup.notify()
+    
+    def _due_in(self):
+        """Segundos até a próxima gravação (None se nada pendente)"""
+        if self._dirty_since is None:
+            return None
+        now = time.monotonic()
+        due = min(self._last_change + self.delay, self._dirty_since + self.max_delay)
+        return max(0.0, due - now)
+    
+    def _writer(self):
+        while True:
+            with self._lock:
+                while not self._closed:
+                    wait = self._due_in()
+                    if wait == 0.0:
+                        break
+                    self._wakeup.wait(wait)
+                if self._closed:
+                    return
+                snapshot, version = self._take_pending()
+            self._write(snapshot, version)
+    
+    def _take_pending(self):
+        # Chamado com _lock adquirido
+        self._dirty_since = None
+        self._last_change = None
+        return dict(self.data), self._version
+    
+    def _write(self, snapshot, version):
+        # Gravações serializadas; uma versão antiga nunca sobrescreve uma nova
+        with self._io_lock:
+            if version <= self._written_version:
+                return
+            try:
+                atomic_write_json(self.path, snapshot)
+                self._written_version = version
+            except Exception as e:
+                print(f"Error saving {self.path}: {e}")
+    
+    def flush(self):
+        """Grava imediatamente o que estiver pendente"""
+        with self._lock:
+            if self._dirty_since is None:
+                return
+            snapshot, version = self._take_pending()
+        self._write(snapshot, version)
+    
+    def close(self, timeout=2.0):
+        with self._lock:
+            self._closed = True
+            self._wakeup.notify()
+        self._thread.join(timeout)
+        self.flush()
\ No newline at end of file
@@ -0,0 +1,195 @@
+# src/states/run_history.py
+import json
+import queue
+import sqlite3
+import threading
+import time
+from src.config import Config
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    started_at REAL NOT NULL,
+    duration REAL NOT NULL,
+    score INTEGER NOT NULL,
+    track TEXT NOT NULL,
+    completed INTEGER NOT NULL,
+    kills INTEGER NOT NULL,
+    kills_by_type TEXT NOT NULL,
+    powerups INTEGER NOT NULL,
+    powerups_by_type TEXT NOT NULL,
+    time_void REAL NOT NULL,
+    time_ambient REAL NOT NULL,
+    time_intense REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_runs_score ON runs (score DESC);
+CREATE INDEX IF NOT EXISTS idx_runs_track_score ON runs (track, score DESC);
+CREATE INDEX IF NOT EXISTS idx_runs_started ON runs (started_at);
+"""
+
+INSERT = """
+INSERT INTO runs (started_at, duration, score, track, completed, kills, kills_by_type,
+                  powerups, powerups_by_type, time_void, time_ambient, time_intense)
+VALUES (:started_at, :duration, :score, :track, :completed, :kills, :kills_by_type,
+        :powerups, :powerups_by_type, :time_void, :time_ambient, :time_intense)
+"""
+
+class RunRecorder:
+    """Acumula as estatísticas da partida atual (sem I/O).
+    
+    Os tempos são de jogo: somam só o `elapsed` de cada passo da partida,
+    então menu, pausa e carregamento não contam.
+    """
+    
+    def __init__(self, track="unknown"):
+        self.track = track
+        self.started_at = time.time()
+        self.duration = 0.0
+        self.ticks = 0
+        self.kills = {}
+        self.powerups = {}
+        self.state_time = {state: 0.0 for state in Config.AUDIO_STATES}
+    
+    def tick(self, audio_state, elapsed):
+        """Soma o passo de jogo (ms) ao estado de áudio atual"""
+        seconds = elapsed / 1000
+        self.duration += seconds
+        self.ticks += 1
+        self.state_time[audio_state] = self.state_time.get(audio_state, 0.0) + seconds
+    
+    def record_kill(self, enemy_type):
+        self.kills[enemy_type] = self.kills.get(enemy_type, 0) + 1
+    
+    def record_powerup(self, powerup_type):
+        self.powerups[powerup_type] = self.powerups.get(powerup_type, 0) + 1
+    
+    def finish(self, score, completed=True):
+        """Retorna o registro da partida no formato da tabela runs"""
+        return {
+            'started_at': self.started_at,
+            'duration': self.duration,
+            'score': int(score),
+            'track': self.track,
+            'completed': int(completed),
+            'kills': sum(self.kills.values()),
+            'kills_by_type': json.dumps(self.kills),
+            'powerups': sum(self.powerups.values()),
+            'powerups_by_type': json.dumps(self.powerups),
+            'time_void': self.state_time.get('void', 0.0),
+            'time_ambient': self.state_time.get('ambient', 0.0),
+            'time_intense': self.state_time.get('intense', 0.0),
+        }
+
+class RunHistory:
+    """Histórico de partidas em SQLite.
+    
+    record() só enfileira; uma thread de fundo grava em lotes (uma transação
+    por lote). As consultas usam outra conexão e os índices de score/track,
+    sem carregar a tabela inteira na memória.
+    """
+    
+    def __init__(self, path='runs.db', batch_size=50, batch_delay=2.0):
+        self.path = path
+        self.batch_size = batch_size
+        self.batch_delay = batch_delay
+        self.queue = queue.Queue()
+        
+        conn = self._connect()
+        conn.executescript(SCHEMA)
+        conn.close()
+        
+        self._read_conn = None
+        self._thread = threading.Thread(target=self._writer, daemon=True)
+        self._thread.start()
+    
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=5.0, check_same_thread=False)
+        # WAL permite ler enquanto a thread de escrita grava
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+    
+    def record(self, run):
+        """Enfileira um registro de RunRecorder.finish() (não bloqueia)"""
+        self.queue.put(run)
+    
+    def _writer(self):
+        conn = self._connect()
+        running = True
+        while running:
+            batch = []
+            try:
+                item = self.queue.get(timeout=self.batch_delay)
+            except queue.Empty:
+                continue
+            
+            # Junta o que chegar até completar o lote ou esvaziar a fila
+            while item is not None:
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+            if item is None:
+                running = False
+            
+            if batch:
+                try:
+                    with conn:
+                        conn.executemany(INSERT, batch)
+                except sqlite3.Error as e:
+                    print(f"Error saving run history: {e}")
+        conn.close()
+    
+    def _reader(self):
+        if self._read_conn is None:
+            self._read_conn = self._connect()
+            self._read_conn.row_factory = sqlite3.Row
+        return self._read_conn
+    
+    def top_scores(self, n=10):
+        rows = self._reader().execute(
+            "SELECT * FROM runs ORDER BY score DESC LIMIT ?", (n,))
+        return [dict(row) for row in rows]
+    
+    def leaderboard(self, track, n=10):
+        """Melhores partidas de uma trilha de áudio"""
+        rows = self._reader().execute(
+            "SELECT * FROM runs WHERE track = ? ORDER BY score DESC LIMIT ?", (track, n))
+        return [dict(row) for row in rows]
+    
+    def tracks(self):
+        rows = self._reader().execute(
+            "SELECT track, COUNT(*) AS runs, MAX(score) AS best FROM runs GROUP BY track")
+        return [dict(row) for row in rows]
+    
+    def percentiles(self, percentiles=(50, 90, 99), track=None):
+        """Percentis de score; cada um é uma busca no índice, não um sort em memória"""
+        conn = self._reader()
+        where, params = ("WHERE track = ?", (track,)) if track is not None else ("", ())
+        count = conn.execute(f"SELECT COUNT(*) FROM runs {where}", params).fetchone()[0]
+        result = {'count': count}
+        if count == 0:
+            return result
+        
+        for p in percentiles:
+            offset = min(count - 1, int(count * p / 100))
+            row = conn.execute(
+                f"SELECT score FROM runs {where} ORDER BY score LIMIT 1 OFFSET ?",
+                params + (offset,)).fetchone()
+            result[f"p{p}"] = row[0]
+        
+        stats = conn.execute(
+            f"SELECT AVG(score), AVG(duration), MAX(score) FROM runs {where}", params).fetchone()
+        result['avg_score'], result['avg_duration'], result['max_score'] = stats
+        return result
+    
+    def close(self, timeout=5.0):
+        """Grava os registros pendentes e encerra a thread de escrita"""
+        self.queue.put(None)
+        self._thread.join(timeout)
+        if self._read_conn is not None:
+            self._read_conn.close()
+            self._read_conn = None
\ No newline at end of file
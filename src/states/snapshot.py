@@ -0,0 +1,288 @@
+# src/states/snapshot.py
+import struct
+import time
+from src.graphics.background import Nebula, Star, Supernova
+from src.graphics.particles import Particle
+from src.states.persistence import atomic_write
+
+# Formato binário do snapshot (little-endian):
+#   cabeçalho | tabela de strings | seções (contador uint32 + registros fixos)
+# Tipos de inimigo, power-up etc. são índices na tabela de strings. Timers
+# (tempo de jogo da linha do tempo, src/systems/scheduler.py) são gravados
+# relativos ao instante da captura, então o restore funciona em outra
+# execução do jogo.
+MAGIC = b'SSNP'
+VERSION = 4
+FLAG_EFFECTS = 1
+
+HEADER = struct.Struct('<4sHHd')
+COUNT = struct.Struct('<I')
+STRING_LEN = struct.Struct('<H')
+
+# score, high_score, multiplier, vida atual/máxima, vivo, game over, nível
+GAME_STATE = struct.Struct('<qqdii??i')
+# rect x/y, velocidade, tipo de tiro, último tiro, escudo ativo, alpha do escudo
+PLAYER = struct.Struct('<iidHi?i')
+# tipo, tempo restante (ms)
+ACTIVE_POWERUP = struct.Struct('<Hi')
+# último spawn de inimigos e de power-ups
+SPAWNERS = struct.Struct('<ii')
+# tipo, rect x/y, padrão, idade (frames), descida acumulada, origem x/y, velocidade (bandos)
+ENEMY = struct.Struct('<HiiHqddddd')
+# variante, rect x/y, velocidade
+PROJECTILE = struct.Struct('<Hiii')
+# x, y, vx, vy, sprite da bala inimiga
+BULLET = struct.Struct('<ddddH')
+# tipo, centro x/y, velocidade, offset de flutuação, velocidade de flutuação, x original
+POWERUP = struct.Struct('<Hiiiddd')
+# tipo, x, y, vx, vy, cor original rgb, cor rgb, vida, vida original, tamanho, alpha
+PARTICLE = struct.Struct('<Hdddd3B3Biidi')
+# camada, x, y, tamanho, tamanho original, velocidade, velocidade base, brilho, warp, pulso
+STAR = struct.Struct('<Bddiiddddd')
+# x, y, tamanho, índice da cor, alpha, velocidade do pulso, offset
+NEBULA = struct.Struct('<ddiBidd')
+# x, y, tamanho, tamanho máximo, crescimento, alpha
+SUPERNOVA = struct.Struct('<iididi')
+# último instante de supernova
+BACKGROUND = struct.Struct('<i')
+
+class SnapshotError(ValueError):
+    pass
+
+class _Writer:
+    def __init__(self):
+        self.parts = []
+        self.strings = {}
+    
+    def string(self, value):
+        """Índice do valor na tabela de strings"""
+        index = self.strings.get(value)
+        if index is None:
+            index = self.strings[value] = len(self.strings)
+        return index
+    
+    def pack(self, record, *values):
+        self.parts.append(record.pack(*values))
+    
+    def array(self, record, rows):
+        self.parts.append(COUNT.pack(len(rows)))
+        self.parts.extend(record.pack(*row) for row in rows)
+    
+    def getvalue(self, flags):
+        table = [COUNT.pack(len(self.strings))]
+        for value in self.strings:
+            encoded = value.encode('utf-8')
+            table.append(STRING_LEN.pack(len(encoded)))
+            table.append(encoded)
+        header = HEADER.pack(MAGIC, VERSION, flags, time.time())
+        return b''.join([header] + table + self.parts)
+
+class _Reader:
+    def __init__(self, data):
+        self.data = memoryview(data)
+        self.offset = 0
+        self.strings = []
+    
+    def unpack(self, record):
+        values = record.unpack_from(self.data, self.offset)
+        self.offset += record.size
+        return values
+    
+    def array(self, record):
+        count, = self.unpack(COUNT)
+        start = self.offset
+        self.offset += count * record.size
+        return record.iter_unpack(self.data[start:self.offset])
+    
+    def read_strings(self):
+        count, = self.unpack(COUNT)
+        for _ in range(count):
+            length, = self.unpack(STRING_LEN)
+            self.strings.append(bytes(self.data[self.offset:self.offset + length]).decode('utf-8'))
+            self.offset += length
+
+def capture(game, include_effects=False):
+    """Serializa o mundo do jogo em bytes (sprites viram registros struct)"""
+    now = game.timeline.now
+    w = _Writer()
+    s = w.string
+    
+    state = game.game_state
+    w.pack(GAME_STATE, state.score, state.high_score, state.multiplier, state.current_health,
+           state.max_health, state.is_alive, state.game_over, state.level)
+    
+    player = game.player
+    w.pack(PLAYER, player.rect.x, player.rect.y, player.speed, s(player.shot_type),
+           player.last_shot - now, player.shield_active, player.shield_alpha)
+    w.array(ACTIVE_POWERUP, [(s(kind), expiry.remaining)
+                             for kind, expiry in player.active_powerups.items()])
+    
+    w.pack(SPAWNERS, game.enemy_spawner.cooldown.last - now,
+           game.powerup_spawner.cooldown.last - now)
+    motion = game.enemy_spawner.motion
+    enemies = []
+    for e in game.enemy_spawner.enemies:
+        pattern, age, distance = motion.state(e.slot)
+        enemies.append((s(e.enemy_type), e.rect.x, e.rect.y, s(pattern), age, distance,
+                        motion.origin_x[e.slot], motion.origin_y[e.slot], motion.vx[e.slot],
+                        motion.vy[e.slot]))
+    w.array(ENEMY, enemies)
+    w.array(PROJECTILE, [(s(p.variant), p.rect.x, p.rect.y, p.speed) for p in game.projectiles])
+    w.array(BULLET, [(x, y, vx, vy, s(sprite)) for x, y, vx, vy, sprite in game.bullets.rows()])
+    w.array(POWERUP, [
+        (s(p.type), p.rect.centerx, p.rect.centery, p.speed, p.float_offset, p.float_speed,
+         p.original_x)
+        for p in game.powerup_spawner.powerups
+    ])
+    
+    if include_effects:
+        w.array(PARTICLE, [
+            (s(p.type), p.x, p.y, p.velocity[0], p.velocity[1], *p.original_color, *p.color,
+             p.lifetime, p.original_lifetime, p.size, p.alpha)
+            for p in game.particle_system.particles
+        ])
+        background = game.background
+        w.pack(BACKGROUND, background.nova_cooldown.last - background.timeline.now)
+        w.array(STAR, [
+            (star.layer, star.x, star.y, star.size, star.original_size, star.speed,
+             star.base_speed, star.brightness, star.warp_effect, star.pulse_offset)
+            for star in background.stars
+        ])
+        w.array(NEBULA, [
+            (n.x, n.y, n.size, n.color_index, n.alpha, n.pulse_speed, n.time_offset)
+            for n in background.nebulas
+        ])
+        w.array(SUPERNOVA, [
+            (nova.x, nova.y, nova.size, nova.max_size, nova.growth_speed, nova.alpha)
+            for nova in background.supernovas
+        ])
+    
+    return w.getvalue(FLAG_EFFECTS if include_effects else 0)
+
+def restore(game, data):
+    """Recria o mundo a partir de capture(); efeitos só se estiverem no snapshot"""
+    r = _Reader(data)
+    try:
+        magic, version, flags, _ = r.unpack(HEADER)
+    except struct.error as e:
+        raise SnapshotError(f"Truncated snapshot: {e}")
+    if magic != MAGIC or version != VERSION:
+        raise SnapshotError(f"Unsupported snapshot (magic={magic!r}, version={version})")
+    
+    try:
+        _restore(game, r, flags)
+    except (struct.error, IndexError, KeyError) as e:
+        raise SnapshotError(f"Corrupt snapshot: {e}")
+
+def _restore(game, r, flags):
+    now = game.timeline.now
+    r.read_strings()
+    name = r.strings.__getitem__
+    
+    state = game.game_state
+    (state.score, high_score, state.multiplier, state.current_health, state.max_health,
+     state.is_alive, state.game_over, state.level) = r.unpack(GAME_STATE)
+    if high_score > state.high_score:
+        state.high_score = high_score
+        state.save_high_score()
+    
+    player = game.player
+    x, y, player.speed, shot_type, last_shot, player.shield_active, player.shield_alpha = \
+        r.unpack(PLAYER)
+    player.rect.topleft = (x, y)
+    player.shot_type = name(shot_type)
+    player.last_shot = now + last_shot
+    # Os efeitos já vieram no registro do jogador; só os fins são reagendados
+    for expiry in player.active_powerups.values():
+        expiry.cancel()
+    player.active_powerups = {}
+    for kind, remaining in r.array(ACTIVE_POWERUP):
+        player.schedule_expiry(name(kind), remaining)
+    
+    enemy_spawn, powerup_spawn = r.unpack(SPAWNERS)
+    game.enemy_spawner.restore_cooldown(now + enemy_spawn)
+    game.powerup_spawner.restore_cooldown(now + powerup_spawn)
+    
+    # Entidades saem dos pools (as atuais voltam para eles antes)
+    enemies = game.enemy_spawner.enemies
+    game.enemy_spawner.pool.recycle(enemies)
+    motion = game.enemy_spawner.motion
+    for kind, x, y, pattern, age, distance, origin_x, origin_y, vx, vy in r.array(ENEMY):
+        enemy = game.enemy_spawner.pool.acquire(origin_x, origin_y, name(kind), motion,
+                                                name(pattern), age, distance)
+        enemy.rect.topleft = (x, y)
+        motion.vx[enemy.slot] = vx
+        motion.vy[enemy.slot] = vy
+        # Os disparos recomeçam com atraso novo (os timers das armas não são gravados)
+        game.enemy_spawner.arm(enemy)
+        enemies.add(enemy)
+    
+    projectile_pool = game.player.projectile_pool
+    projectile_pool.recycle(game.projectiles)
+    for variant, x, y, speed in r.array(PROJECTILE):
+        projectile = projectile_pool.acquire(0, 0, name(variant))
+        projectile.rect.topleft = (x, y)
+        projectile.speed = speed
+        game.projectiles.add(projectile)
+    
+    game.bullets.restore((x, y, vx, vy, name(sprite))
+                         for x, y, vx, vy, sprite in r.array(BULLET))
+    
+    powerups = game.powerup_spawner.powerups
+    game.powerup_spawner.pool.recycle(powerups)
+    for kind, cx, cy, speed, float_offset, float_speed, original_x in r.array(POWERUP):
+        powerup = game.powerup_spawner.pool.acquire(cx, cy, name(kind))
+        powerup.speed = speed
+        powerup.float_offset = float_offset
+        powerup.float_speed = float_speed
+        powerup.original_x = original_x
+        powerups.add(powerup)
+    
+    if not flags & FLAG_EFFECTS:
+        return
+    
+    particles = []
+    for row in r.array(PARTICLE):
+        kind, x, y, vx, vy = row[:5]
+        particle = Particle(x, y, tuple(row[5:8]), (vx, vy), particle_type=name(kind))
+        particle.color = tuple(row[8:11])
+        particle.lifetime, particle.original_lifetime, particle.size, particle.alpha = row[11:]
+        particles.append(particle)
+    game.particle_system.particles = particles
+    
+    background = game.background
+    last_nova, = r.unpack(BACKGROUND)
+    background.nova_cooldown.restart(background.nova_delay, background.timeline.now + last_nova)
+    stars = []
+    for layer, x, y, size, original_size, speed, base_speed, brightness, warp, pulse in r.array(STAR):
+        star = Star.__new__(Star)
+        star.layer = layer
+        star.x, star.y, star.size, star.original_size = x, y, size, original_size
+        star.speed, star.base_speed, star.brightness = speed, base_speed, brightness
+        star.warp_effect, star.pulse_offset = warp, pulse
+        stars.append(star)
+    background.stars = stars
+    # Reaproveita gradientes já escalados (restore repetido do mesmo momento)
+    scaled = {(n.size, n.color_index): n.image for n in background.nebulas}
+    nebulas = []
+    for x, y, size, color_index, alpha, pulse_speed, time_offset in r.array(NEBULA):
+        nebula = Nebula.__new__(Nebula)
+        nebula.set_shape(size, color_index, scaled.get((size, color_index)))
+        nebula.x, nebula.y, nebula.alpha = x, y, alpha
+        nebula.pulse_speed, nebula.time_offset = pulse_speed, time_offset
+        nebulas.append(nebula)
+    background.nebulas = nebulas
+    supernovas = []
+    for x, y, size, max_size, growth_speed, alpha in r.array(SUPERNOVA):
+        nova = Supernova(x, y)
+        nova.size, nova.max_size, nova.growth_speed, nova.alpha = size, max_size, growth_speed, alpha
+        supernovas.append(nova)
+    background.supernovas = supernovas
+
+def save(path, data):
+    """Grava o snapshot de forma atômica (arquivo temporário + rename)"""
+    atomic_write(path, data)
+
+def load(path):
+    with open(path, 'rb') as f:
+        return f.read()
\ No newline at end of file
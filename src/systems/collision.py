@@ -0,0 +1,91 @@
+# src/systems/collision.py
+import numpy as np
+import pygame
+from src.config import Config
+from src.graphics import atlas
+
+# Colisão precisa em duas fases: um teste barato de retângulo descarta quase
+# tudo e só os candidatos que sobram passam pela máscara de pixels. As
+# máscaras saem dos sprites do atlas e são criadas uma vez por nome (cada
+# frame pré-rotacionado de power-up tem a sua); sprites informam o nome da
+# imagem atual em `mask_name`.
+
+class MaskCache:
+    """pygame.mask por nome de sprite do atlas, criada no primeiro pedido"""
+    
+    def __init__(self):
+        self.masks = {}
+    
+    def get(self, name):
+        mask = self.masks.get(name)
+        if mask is None:
+            mask = self.masks[name] = pygame.mask.from_surface(atlas.get(name))
+        return mask
+    
+    def clear(self):
+        self.masks.clear()
+
+# Cache em uso (atlas e sprites não mudam durante a execução)
+masks = MaskCache()
+
+def overlap(a, b):
+    """As máscaras de dois sprites se tocam nas posições dos rects?"""
+    offset = (b.rect.x - a.rect.x, b.rect.y - a.rect.y)
+    return masks.get(a.mask_name).overlap(masks.get(b.mask_name), offset) is not None
+
+def spritecollide(sprite, group, dokill):
+    """pygame.sprite.spritecollide com máscara nos pares que passaram pelo rect
+    (só rect se Config.PRECISE_COLLISIONS estiver desligado)"""
+    hits = pygame.sprite.spritecollide(sprite, group, False)
+    if Config.PRECISE_COLLISIONS:
+        hits = [hit for hit in hits if overlap(sprite, hit)]
+    if dokill:
+        for hit in hits:
+            hit.kill()
+    return hits
+
+def groupcollide(group_a, group_b, dokill_a, dokill_b):
+    """pygame.sprite.groupcollide com a mesma fase de máscara.
+    
+    Como no pygame, com dokill_b um sprite de group_b atingido sai do
+    teste dos seguintes (dois tiros no mesmo inimigo contam uma vez).
+    """
+    candidates = pygame.sprite.groupcollide(group_a, group_b, False, False)
+    precise = Config.PRECISE_COLLISIONS
+    hits = {}
+    taken = set()
+    for a, targets in candidates.items():
+        targets = [b for b in targets if b not in taken and (not precise or overlap(a, b))]
+        if not targets:
+            continue
+        hits[a] = targets
+        if dokill_b:
+            taken.update(targets)
+    for a, targets in hits.items():
+        if dokill_a:
+            a.kill()
+        if dokill_b:
+            for b in targets:
+                b.kill()
+    return hits
+
+def points_in_rect(xs, ys, rect, margin=0):
+    """Índices dos pontos (centros) dentro do rect aumentado de `margin`"""
+    inside = ((xs >= rect.left - margin) & (xs < rect.right + margin) &
+              (ys >= rect.top - margin) & (ys < rect.bottom + margin))
+    return np.flatnonzero(inside)
+
+def mask_hits(mask, rect, xs, ys, candidates, point_masks, kinds):
+    """Candidatos cuja máscara (point_masks[kind], centrada no ponto) toca
+    `mask` posicionada em `rect`"""
+    left, top = rect.left, rect.top
+    overlap = mask.overlap
+    hits = []
+    for i, x, y, kind in zip(candidates.tolist(), xs[candidates].tolist(),
+                             ys[candidates].tolist(), kinds[candidates].tolist()):
+        point_mask = point_masks[kind]
+        width, height = point_mask.get_size()
+        offset = (int(x) - width // 2 - left, int(y) - height // 2 - top)
+        if overlap(point_mask, offset):
+            hits.append(i)
+    return hits
\ No newline at end of file
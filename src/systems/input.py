@@ -0,0 +1,180 @@
+# src/systems/input.py
+import collections
+import time
+import pygame
+from src.config import Config
+
+# Entrada orientada a eventos: KEYDOWN/KEYUP recebem um timestamp quando
+# saem da fila do SDL e são aplicados em ordem no passo da simulação.
+#
+# O pygame não expõe o timestamp do SDL, então a precisão vem de esvaziar a
+# fila várias vezes por frame (wait() substitui a espera do clock.tick por
+# um polling a cada INPUT_POLL_MS). Cada passo sabe quanto tempo de cada
+# ação ficou pressionado dentro do intervalo (toques curtos não somem) e
+# toques de tiro ficam guardados por INPUT_BUFFER_MS até poderem agir.
+#
+# Latência: o timestamp do KEYDOWN é guardado até o jogo reagir à ação
+# (acted) e fechado no flip seguinte (presented): tecla -> efeito na tela.
+
+FOCUS_EVENTS = (pygame.WINDOWFOCUSLOST, pygame.WINDOWHIDDEN)
+
+class ActionState:
+    def __init__(self):
+        self.keys = 0           # teclas da ação pressionadas agora
+        self.down_since = 0.0
+        self.held = 0.0         # tempo pressionado dentro do último passo (s)
+        self.fraction = 0.0     # held / duração do passo
+        self.pressed_at = None  # KEYDOWN ainda não atendido (buffer de toque)
+        self.latency_start = None
+        self.acted = False
+        self.samples = collections.deque(maxlen=Config.INPUT_LATENCY_WINDOW)
+        self.count = 0
+
+class InputBuffer:
+    def __init__(self, bindings=None):
+        bindings = bindings or Config.INPUT_BINDINGS
+        self.actions = {action: ActionState() for action in bindings}
+        self.keymap = {}
+        for action, names in bindings.items():
+            for name in names:
+                try:
+                    self.keymap[pygame.key.key_code(name)] = action
+                except ValueError:
+                    print(f"Error binding key '{name}' to '{action}': unknown key")
+        
+        self.events = []                  # todos os eventos, para o handle_events do jogo
+        self.pending = collections.deque()  # (t, ação, pressionada) ainda não aplicados
+        self.last_step = time.perf_counter()
+        self.buffer_s = Config.INPUT_BUFFER_MS / 1000
+        self.poll_s = Config.INPUT_POLL_MS / 1000
+        self.polls = 0
+    
+    def pump(self):
+        """Esvazia a fila do SDL carimbando os eventos com o instante atual"""
+        events = pygame.event.get()
+        if not events:
+            return
+        now = time.perf_counter()
+        self.polls += 1
+        keymap = self.keymap
+        for event in events:
+            self.events.append(event)
+            if event.type == pygame.KEYDOWN or event.type == pygame.KEYUP:
+                action = keymap.get(event.key)
+                if action is not None:
+                    self.pending.append((now, action, event.type == pygame.KEYDOWN))
+            elif event.type in FOCUS_EVENTS:
+                # Sem foco o KEYUP pode nunca chegar: solta tudo
+                for action, state in self.actions.items():
+                    for _ in range(state.keys):
+                        self.pending.append((now, action, False))
+    
+    def poll(self):
+        """Eventos recebidos desde a última chamada (inclusive os do polling entre frames)"""
+        self.pump()
+        events = self.events
+        self.events = []
+        return events
+    
+    def wait(self, deadline):
+        """Espera até `deadline` (perf_counter) esvaziando a fila a cada INPUT_POLL_MS"""
+        if self.poll_s <= 0:
+            return
+        # A última fração fica para o clock.tick, que mantém a cadência do frame
+        deadline -= self.poll_s
+        while True:
+            self.pump()
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            time.sleep(min(self.poll_s, remaining))
+    
+    def step(self, now=None):
+        """Aplica os eventos até `now` e calcula o estado das ações para este passo"""
+        now = now or time.perf_counter()
+        start = self.last_step
+        duration = max(now - start, 1e-6)
+        actions = self.actions
+        for state in actions.values():
+            state.held = 0.0
+        
+        pending = self.pending
+        while pending and pending[0][0] <= now:
+            t, action, down = pending.popleft()
+            state = actions[action]
+            if down:
+                state.keys += 1
+                if state.keys == 1:
+                    state.down_since = t
+                    state.pressed_at = t
+                    if state.latency_start is None:
+                        state.latency_start = t
+            elif state.keys:
+                state.keys -= 1
+                if not state.keys:
+                    state.held += t - max(state.down_since, start)
+        
+        for state in actions.values():
+            if state.keys:
+                state.held += now - max(state.down_since, start)
+            state.fraction = min(state.held / duration, 1.0)
+            # Toque que não pôde agir a tempo (ex.: tiro em recarga) expira
+            if state.pressed_at is not None and not state.keys and now - state.pressed_at > self.buffer_s:
+                state.pressed_at = None
+                state.latency_start = None
+        self.last_step = now
+    
+    def down(self, action):
+        """Ação pressionada no fim do passo"""
+        return self.actions[action].keys > 0
+    
+    def amount(self, action):
+        """Fração do passo com a ação pressionada (0 a 1), para movimento"""
+        return self.actions[action].fraction
+    
+    def triggered(self, action):
+        """Pressionada agora ou com um toque ainda no buffer"""
+        state = self.actions[action]
+        return state.keys > 0 or state.pressed_at is not None
+    
+    def acted(self, action):
+        """O jogo reagiu à ação: consome o toque e marca a latência para o próximo flip"""
+        state = self.actions[action]
+        state.pressed_at = None
+        if state.latency_start is not None:
+            state.acted = True
+    
+    def presented(self, now=None):
+        """Chamar logo após o flip: fecha as medições de latência das ações atendidas"""
+        now = now or time.perf_counter()
+        for state in self.actions.values():
+            if state.acted:
+                state.samples.append((now - state.latency_start) * 1000)
+                state.count += 1
+                state.latency_start = None
+                state.acted = False
+    
+    def clear(self):
+        """Solta todas as ações (reset de partida, troca de cena)"""
+        self.pending.clear()
+        for state in self.actions.values():
+            state.keys = 0
+            state.held = state.fraction = 0.0
+            state.pressed_at = state.latency_start = None
+            state.acted = False
+        self.last_step = time.perf_counter()
+    
+    def get_stats(self):
+        latency = {}
+        for action, state in self.actions.items():
+            if not state.samples:
+                continue
+            samples = sorted(state.samples)
+            latency[action] = {
+                'count': state.count,
+                'last_ms': state.samples[-1],
+                'avg_ms': sum(samples) / len(samples),
+                'p95_ms': samples[min(len(samples) - 1, int(len(samples) * 0.95))],
+                'max_ms': samples[-1],
+            }
+        return {'polls': self.polls, 'pending': len(self.pending), 'latency': latency}
\ No newline at end of file
@@ -0,0 +1,50 @@
+# src/systems/pool.py
+import pygame
+
+class PooledSprite(pygame.sprite.Sprite):
+    """Sprite reaproveitável: kill() devolve o objeto ao pool de origem.
+    
+    Subclasses fazem toda a inicialização em reset(...), que o pool chama
+    a cada reuso; __init__ só cria o objeto e delega para reset.
+    """
+    pool = None
+    
+    def kill(self):
+        super().kill()
+        pool = self.pool
+        if pool is not None:
+            self.pool = None
+            pool.release(self)
+
+class SpritePool:
+    """Lista livre de sprites de um tipo, para spawns e resets sem alocação"""
+    
+    def __init__(self, factory, prewarm=0):
+        self.factory = factory
+        self.free = []
+        self.created = 0
+        self.prewarm(prewarm)
+    
+    def prewarm(self, count):
+        """Cria objetos antecipadamente (pode rodar numa thread de preload)"""
+        for _ in range(count - len(self.free)):
+            self.free.append(self._create())
+    
+    def _create(self):
+        self.created += 1
+        return self.factory()
+    
+    def acquire(self, *args, **kwargs):
+        sprite = self.free.pop() if self.free else self._create()
+        sprite.reset(*args, **kwargs)
+        sprite.pool = self
+        return sprite
+    
+    def release(self, sprite):
+        self.free.append(sprite)
+    
+    def recycle(self, group):
+        """Devolve ao pool todos os sprites de um grupo (e esvazia o grupo)"""
+        for sprite in group.sprites():
+            sprite.kill()
+        group.empty()
\ No newline at end of file
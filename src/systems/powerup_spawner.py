@@ -3,85 +3,68 @@ import pygame
 import random
 from src.config import Config
 from src.entities.powerups import PowerUp
+from src.systems import collision, tuning
+from src.systems.pool import SpritePool
+from src.systems.scheduler import Cooldown
 
 class PowerUpSpawner:
-    def __init__(self):
+    def __init__(self, timeline):
         self.powerups = pygame.sprite.Group()
-        self.last_spawn_time = 0
+        self.pool = SpritePool(PowerUp)
+        # O intervalo depende do estado de áudio no frame: o evento agendado
+        # abre a janela no menor deles e o do estado atual é conferido depois
+        self.cooldown = Cooldown(timeline, self._min_delay())
         
-        # Configurações de spawn
-        self.base_spawn_delay = 5000  # 5 segundos base entre spawns
-        self.min_spawn_delay = 2000   # Mínimo de 2 segundos entre spawns
-        self.spawn_chance = 0.1       # 10% chance base de spawn
-        
-        # Weights para cada tipo de power-up
-        self.powerup_weights = {
-            'double_shot': 40,  # 40% chance
-            'triple_shot': 20,  # 20% chance
-            'shield': 20,       # 20% chance
-            'speed': 20         # 20% chance
-        }
+        # Chances, intervalos e pesos por estado de áudio ficam nas tabelas
+        # de tuning (src/systems/tuning.py)
     
     def update(self, game_state, audio_state, audio_volume):
-        current_time = pygame.time.get_ticks()
-        
-        # Ajusta chance de spawn baseado no estado do áudio
-        if audio_state == "void":
-            spawn_chance = self.spawn_chance * 0.5
-        elif audio_state == "ambient":
-            spawn_chance = self.spawn_chance
-        else:  # intense
-            spawn_chance = self.spawn_chance * 2
-        
-        # Aumenta chance baseado no volume
-        spawn_chance += audio_volume * 0.2
+        """Atualiza os power-ups; retorna o power-up criado neste frame (ou None)"""
+        spawned = None
+        tables = tuning.current
         
-        # Ajusta delay baseado no estado
-        spawn_delay = self.base_spawn_delay
-        if audio_state == "intense":
-            spawn_delay = self.base_spawn_delay * 0.5
-        
-        # Tenta spawnar novo power-up
-        if (current_time - self.last_spawn_time > spawn_delay and 
-            random.random() < spawn_chance):
-            self._spawn_powerup(audio_state)
-            self.last_spawn_time = current_time
+        # Chance e intervalo de spawn pelo estado do áudio, chance aumentada pelo volume
+        cooldown = self.cooldown
+        if cooldown.ready and cooldown.elapsed > tables.powerup_spawn_delay[audio_state]:
+            spawn_chance = tables.powerup_spawn_chance[audio_state] + audio_volume * 0.2
+            if random.random() < spawn_chance:
+                spawned = self._spawn_powerup(audio_state)
+                cooldown.restart(self._min_delay())
         
         # Atualiza power-ups existentes
         self.powerups.update()
+        return spawned
+    
+    def _min_delay(self):
+        return min(tuning.current.powerup_spawn_delay.values())
+    
+    def restore_cooldown(self, last):
+        """Intervalo contado a partir do último spawn `last` (snapshot)"""
+        self.cooldown.restart(self._min_delay(), last)
     
     def _spawn_powerup(self, audio_state):
         # Posição aleatória no topo da tela
         x = random.randint(50, Config.SCREEN_WIDTH - 50)
         y = -30  # Acima da tela
         
-        # Ajusta weights baseado no estado do áudio
-        weights = self.powerup_weights.copy()
-        if audio_state == "intense":
-            # Aumenta chance de power-ups mais poderosos
-            weights['triple_shot'] += 20
-            weights['shield'] += 10
-        
-        # Escolhe tipo baseado nos weights
-        total = sum(weights.values())
-        r = random.uniform(0, total)
-        cumsum = 0
-        
-        for powerup_type, weight in weights.items():
-            cumsum += weight
-            if r <= cumsum:
-                powerup = PowerUp(x, y, powerup_type)
-                self.powerups.add(powerup)
-                break
+        # Escolhe tipo pelos pesos do estado (já acumulados na compilação)
+        tables = tuning.current
+        powerup_type = random.choices(
+            tables.powerup_types[audio_state],
+            cum_weights=tables.powerup_cum_weights[audio_state]
+        )[0]
+        powerup = self.pool.acquire(x, y, powerup_type)
+        self.powerups.add(powerup)
+        return powerup
     
     def spawn_specific(self, powerup_type, x, y):
         """Spawna um power-up específico em uma posição específica"""
-        powerup = PowerUp(x, y, powerup_type)
+        powerup = self.pool.acquire(x, y, powerup_type)
         self.powerups.add(powerup)
     
     def check_collisions(self, player):
         """Verifica colisões com o jogador e aplica efeitos"""
-        hits = pygame.sprite.spritecollide(player, self.powerups, True)
+        hits = collision.spritecollide(player, self.powerups, True)
         for powerup in hits:
             powerup.apply_effect(player)
             return powerup.type
@@ -92,5 +75,5 @@ class PowerUpSpawner:
         return len(self.powerups)
     
     def clear(self):
-        """Remove todos os power-ups ativos"""
-        self.powerups.empty()
\ No newline at end of file
+        """Remove todos os power-ups ativos (devolvidos ao pool)"""
+        self.pool.recycle(self.powerups)
\ No newline at end of file
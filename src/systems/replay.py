@@ -0,0 +1,273 @@
+# src/systems/replay.py
+import struct
+import numpy as np
+from src.config import Config
+from src.entities.bullets import BULLET_SPRITES
+from src.graphics import atlas
+from src.states import snapshot
+
+# Registro dos últimos N segundos de jogo num buffer circular de tamanho fixo.
+#
+# Cada tick ocupa um slot de bytes pré-alocado com cabeçalho, eventos (spawn,
+# kill, dano, power-up), a posição de cada entidade e as balas inimigas
+# (copiadas dos arrays do BulletEngine: x, y e sprite em blocos contíguos);
+# a memória não cresce com a duração da sessão. A cada `keyframe_interval`
+# ticks guarda também um snapshot completo (src/states/snapshot.py) para
+# restaurar o mundo.
+
+# tick, score, x/y do jogador, vida, estado de áudio, nº de eventos, de entidades e de balas
+TICK_HEADER = struct.Struct('<IIhhhBBHH')
+# tipo do evento, nome (índice na tabela), x, y, valor
+EVENT = struct.Struct('<BBhhH')
+# grupo, tipo (índice na tabela), x, y (centro)
+ENTITY = struct.Struct('<BBhh')
+
+SPAWN, KILL, DAMAGE, POWERUP, DROP = range(1, 6)
+EVENT_NAMES = {SPAWN: 'spawn', KILL: 'kill', DAMAGE: 'damage', POWERUP: 'powerup', DROP: 'drop'}
+ENEMY, PROJECTILE, POWERUP_ITEM = range(3)
+AUDIO_STATES = Config.AUDIO_STATES
+
+DUMP_MAGIC = b'SRPL'
+DUMP_VERSION = 2
+DUMP_HEADER = struct.Struct('<4sHIIIIII')
+
+class ReplayBuffer:
+    def __init__(self, seconds=None, fps=None, keyframe_interval=None,
+                 max_events=32, max_entities=256, max_bullets=None):
+        seconds = seconds or Config.REPLAY_SECONDS
+        fps = fps or Config.FPS
+        self.capacity = int(seconds * fps)
+        self.keyframe_interval = keyframe_interval or Config.REPLAY_KEYFRAME_INTERVAL
+        self.max_events = max_events
+        self.max_entities = max_entities
+        self.max_bullets = Config.REPLAY_MAX_BULLETS if max_bullets is None else max_bullets
+        self._layout()
+        self.data = bytearray(self.capacity * self.slot_size)
+        self.keyframes = [None] * (self.capacity // self.keyframe_interval + 1)
+        
+        self.tick = 0
+        self.names = {}
+        self.name_list = []
+        self.pending = []
+        self.dropped = 0
+        # Índice na tabela de nomes de cada sprite de bala do BulletEngine
+        self.bullet_names = np.array([self.name_index(name) for name in BULLET_SPRITES],
+                                     dtype=np.uint8)
+    
+    def _layout(self):
+        """Offsets dentro do slot: cabeçalho | eventos | entidades | balas (x, y, sprite)"""
+        self.entities_offset = TICK_HEADER.size + self.max_events * EVENT.size
+        self.bullets_offset = self.entities_offset + self.max_entities * ENTITY.size
+        self.slot_size = self.bullets_offset + self.max_bullets * 5
+    
+    def name_index(self, name):
+        index = self.names.get(name)
+        if index is None:
+            index = self.names[name] = len(self.name_list)
+            self.name_list.append(name)
+        return index
+    
+    def event(self, kind, name="", x=0, y=0, value=0):
+        """Evento do tick atual (gravado no próximo record_tick)"""
+        self.pending.append((kind, self.name_index(name), x, y, value))
+    
+    def record_tick(self, game, audio_state):
+        """Grava o tick (chamar uma vez por update do mundo)"""
+        data = self.data
+        offset = (self.tick % self.capacity) * self.slot_size
+        names = self.names
+        name_index = self.name_index
+        
+        events = self.pending
+        if len(events) > self.max_events:
+            self.dropped += len(events) - self.max_events
+            events = events[:self.max_events]
+        pos = offset + TICK_HEADER.size
+        for record in events:
+            EVENT.pack_into(data, pos, *record)
+            pos += EVENT.size
+        self.pending = []
+        
+        pos = offset + self.entities_offset
+        end = pos + self.max_entities * ENTITY.size
+        count = 0
+        for group, sprites, attr in ((ENEMY, game.enemy_spawner.enemies, 'enemy_type'),
+                                     (PROJECTILE, game.projectiles, 'variant'),
+                                     (POWERUP_ITEM, game.powerup_spawner.powerups, 'type')):
+            for sprite in sprites:
+                if pos >= end:
+                    self.dropped += 1
+                    continue
+                kind = getattr(sprite, attr)
+                index = names.get(kind)
+                if index is None:
+                    index = name_index(kind)
+                center = sprite.rect.center
+                ENTITY.pack_into(data, pos, group, index, center[0], center[1])
+                pos += ENTITY.size
+                count += 1
+        
+        state = game.game_state
+        player = game.player.rect.center
+        n_bullets = self._record_bullets(game.bullets, offset + self.bullets_offset, player)
+        TICK_HEADER.pack_into(data, offset, self.tick, state.score, player[0], player[1],
+                              state.current_health, AUDIO_STATES.index(audio_state),
+                              len(events), count, n_bullets)
+        
+        if self.tick % self.keyframe_interval == 0:
+            slot = (self.tick // self.keyframe_interval) % len(self.keyframes)
+            self.keyframes[slot] = (self.tick, snapshot.capture(game))
+        self.tick += 1
+    
+    def _record_bullets(self, bullets, pos, player):
+        """Copia as balas vivas para o slot em `pos`; retorna quantas"""
+        n = bullets.count
+        xs = bullets.x[:n]
+        ys = bullets.y[:n]
+        sprites = bullets.sprite[:n]
+        if n > self.max_bullets:
+            # Ficam as mais próximas do jogador (a que acertou aparece no kill-cam)
+            self.dropped += n - self.max_bullets
+            near = np.argpartition((xs - player[0]) ** 2 + (ys - player[1]) ** 2,
+                                   self.max_bullets)[:self.max_bullets]
+            xs, ys, sprites = xs[near], ys[near], sprites[near]
+            n = self.max_bullets
+        size = self.max_bullets * 2
+        data = self.data
+        data[pos:pos + n * 2] = xs.astype('<i2').tobytes()
+        data[pos + size:pos + size + n * 2] = ys.astype('<i2').tobytes()
+        data[pos + size * 2:pos + size * 2 + n] = self.bullet_names[sprites].tobytes()
+        return n
+    
+    @property
+    def oldest(self):
+        return max(0, self.tick - self.capacity)
+    
+    def frame(self, tick):
+        """Decodifica um tick do buffer (None se já saiu da janela)"""
+        if not self.oldest <= tick < self.tick:
+            return None
+        return self._decode(self.data, (tick % self.capacity) * self.slot_size)
+    
+    def _decode(self, data, offset):
+        (tick, score, px, py, health, audio_state,
+         n_events, n_entities, n_bullets) = TICK_HEADER.unpack_from(data, offset)
+        names = self.name_list
+        pos = offset + TICK_HEADER.size
+        events = []
+        for _ in range(n_events):
+            kind, name, x, y, value = EVENT.unpack_from(data, pos)
+            events.append((EVENT_NAMES[kind], names[name], x, y, value))
+            pos += EVENT.size
+        pos = offset + self.entities_offset
+        entities = []
+        for _ in range(n_entities):
+            group, kind, x, y = ENTITY.unpack_from(data, pos)
+            entities.append((group, names[kind], x, y))
+            pos += ENTITY.size
+        pos = offset + self.bullets_offset
+        size = self.max_bullets * 2
+        xs = np.frombuffer(data, '<i2', n_bullets, pos).tolist()
+        ys = np.frombuffer(data, '<i2', n_bullets, pos + size).tolist()
+        kinds = np.frombuffer(data, np.uint8, n_bullets, pos + size * 2).tolist()
+        bullets = [(names[kind], x, y) for kind, x, y in zip(kinds, xs, ys)]
+        return {
+            'tick': tick, 'score': score, 'player': (px, py), 'health': health,
+            'audio_state': AUDIO_STATES[audio_state], 'events': events, 'entities': entities,
+            'bullets': bullets,
+        }
+    
+    def keyframe_before(self, tick):
+        """Keyframe mais recente com tick <= `tick` (tick, snapshot) ou None"""
+        best = None
+        for keyframe in self.keyframes:
+            if keyframe and self.oldest <= keyframe[0] <= tick:
+                if best is None or keyframe[0] > best[0]:
+                    best = keyframe
+        return best
+    
+    def seek(self, game, tick):
+        """Restaura o mundo no keyframe mais próximo antes de `tick`; retorna o tick restaurado"""
+        keyframe = self.keyframe_before(tick)
+        if keyframe is None:
+            return None
+        snapshot.restore(game, keyframe[1])
+        return keyframe[0]
+    
+    def dump(self, path):
+        """Grava a janela inteira (ticks em ordem + keyframes) para análise posterior"""
+        first = self.oldest
+        count = self.tick - first
+        names = '\n'.join(self.name_list).encode('utf-8')
+        keyframes = sorted(k for k in self.keyframes if k and k[0] >= first)
+        with open(path, 'wb') as f:
+            f.write(DUMP_HEADER.pack(DUMP_MAGIC, DUMP_VERSION, self.slot_size, self.max_events,
+                                     self.max_entities, self.max_bullets, count, len(keyframes)))
+            f.write(struct.pack('<I', len(names)))
+            f.write(names)
+            for tick in range(first, self.tick):
+                offset = (tick % self.capacity) * self.slot_size
+                f.write(self.data[offset:offset + self.slot_size])
+            for tick, data in keyframes:
+                f.write(struct.pack('<II', tick, len(data)))
+                f.write(data)
+    
+    @classmethod
+    def load(cls, path):
+        """Lê um dump de dump(); o buffer resultante tem exatamente os ticks gravados"""
+        with open(path, 'rb') as f:
+            data = f.read()
+        (magic, version, slot_size, max_events, max_entities, max_bullets,
+         count, n_keyframes) = DUMP_HEADER.unpack_from(data, 0)
+        if magic != DUMP_MAGIC or version != DUMP_VERSION:
+            raise ValueError(f"Not a replay dump (version {DUMP_VERSION}): {path}")
+        pos = DUMP_HEADER.size
+        names_len, = struct.unpack_from('<I', data, pos)
+        pos += 4
+        name_list = data[pos:pos + names_len].decode('utf-8').split('\n') if names_len else []
+        pos += names_len
+        
+        buffer = cls.__new__(cls)
+        buffer.max_events = max_events
+        buffer.max_entities = max_entities
+        buffer.max_bullets = max_bullets
+        buffer._layout()
+        buffer.capacity = max(count, 1)
+        buffer.names = {name: i for i, name in enumerate(name_list)}
+        buffer.name_list = name_list
+        buffer.pending = []
+        buffer.dropped = 0
+        buffer.data = bytearray(data[pos:pos + count * slot_size])
+        pos += count * slot_size
+        first_tick = TICK_HEADER.unpack_from(buffer.data, 0)[0] if count else 0
+        buffer.tick = first_tick + count
+        # Ticks reposicionados: o slot de cada tick passa a ser (tick % capacity)
+        shift = first_tick % buffer.capacity
+        if shift:
+            split = (buffer.capacity - shift) * slot_size
+            buffer.data = buffer.data[split:] + buffer.data[:split]
+        buffer.keyframes = []
+        for _ in range(n_keyframes):
+            tick, size = struct.unpack_from('<II', data, pos)
+            pos += 8
+            buffer.keyframes.append((tick, data[pos:pos + size]))
+            pos += size
+        buffer.keyframe_interval = Config.REPLAY_KEYFRAME_INTERVAL
+        return buffer
+
+def draw_frame(surface, frame):
+    """Desenha um tick gravado (kill-cam): entidades e jogador pelos sprites do atlas"""
+    for group, kind, x, y in frame['entities']:
+        if group == ENEMY:
+            name = "enemy." + (kind if kind in ("basic", "elite") else "boss")
+        elif group == PROJECTILE:
+            name = f"projectile.{kind}"
+        else:
+            name = f"powerup.{kind}"
+        image = atlas.get(name)
+        surface.blit(image, image.get_rect(center=(x, y)))
+    for kind, x, y in frame['bullets']:
+        image = atlas.get(f"bullet.{kind}")
+        surface.blit(image, image.get_rect(center=(x, y)))
+    ship = atlas.get('ship')
+    surface.blit(ship, ship.get_rect(center=frame['player']))
\ No newline at end of file
@@ -0,0 +1,123 @@
+# src/systems/scheduler.py
+import heapq
+import itertools
+
+class Handle:
+    """Evento agendado; cancel() só marca (o heap descarta ao chegar nele)"""
+    __slots__ = ('time', 'callback', 'args', 'cancelled', 'timeline')
+    
+    def __init__(self, timeline, time, callback, args):
+        self.timeline = timeline
+        self.time = time
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+    
+    @property
+    def pending(self):
+        return not self.cancelled and self.timeline is not None
+    
+    @property
+    def remaining(self):
+        """Tempo de jogo (ms) até disparar"""
+        return max(0, self.time - self.timeline.now) if self.timeline is not None else 0
+    
+    def cancel(self):
+        if self.pending:
+            self.cancelled = True
+            self.timeline.cancelled += 1
+            self.timeline = None
+
+class Scheduler:
+    """Linha do tempo do jogo: fila de prioridade de eventos por instante.
+    
+    O tempo (ms) só anda em advance(); quem não chama advance congela
+    todos os timers de uma vez (pausa, game over, menu). Cada advance
+    processa apenas os eventos vencidos, em ordem de instante e, no mesmo
+    instante, de agendamento. Eventos agendados pelos callbacks durante o
+    advance ficam para o próximo, mesmo já vencidos (um callback que se
+    reagenda em `now` não prende o laço). Cancelados ficam no heap até
+    chegarem ao topo (ou até a compactação, se forem a maioria).
+    """
+    
+    def __init__(self):
+        self.now = 0
+        self.heap = []
+        self.sequence = itertools.count()
+        self.cancelled = 0
+        self.fired = 0
+    
+    def at(self, time, callback, *args):
+        """Agenda callback(*args) no instante `time` (já vencido: no próximo advance)"""
+        handle = Handle(self, time, callback, args)
+        heapq.heappush(self.heap, (time, next(self.sequence), handle))
+        return handle
+    
+    def after(self, delay, callback, *args):
+        return self.at(self.now + delay, callback, *args)
+    
+    def advance(self, elapsed):
+        """Avança o tempo de jogo e dispara os eventos vencidos; retorna quantos"""
+        self.now += elapsed
+        heap = self.heap
+        fired = 0
+        # Agendados a partir daqui (pelos callbacks) esperam o próximo advance;
+        # parar no primeiro deles mantém a ordem por instante
+        boundary = next(self.sequence)
+        while heap and heap[0][0] <= self.now and heap[0][1] < boundary:
+            handle = heapq.heappop(heap)[2]
+            if handle.cancelled:
+                self.cancelled -= 1
+                continue
+            handle.timeline = None
+            handle.callback(*handle.args)
+            fired += 1
+        self.fired += fired
+        
+        # Muitos cancelados (power-ups renovados etc.): reconstrói o heap
+        if self.cancelled > 32 and self.cancelled * 2 > len(heap):
+            self.heap = [entry for entry in heap if not entry[2].cancelled]
+            heapq.heapify(self.heap)
+            self.cancelled = 0
+        return fired
+    
+    def clear(self):
+        for _, _, handle in self.heap:
+            handle.timeline = None
+        self.heap = []
+        self.cancelled = 0
+    
+    def get_stats(self):
+        return {
+            'now': self.now,
+            'pending': len(self.heap) - self.cancelled,
+            'fired': self.fired,
+        }
+
+class Cooldown:
+    """Intervalo mínimo entre ações sorteadas por frame (spawns).
+    
+    `ready` vira True por um evento agendado ao fim do intervalo; o código
+    por frame só testa o flag, sem comparar tempos.
+    """
+    
+    def __init__(self, timeline, delay=0):
+        self.timeline = timeline
+        self.handle = None
+        self.restart(delay)
+    
+    def restart(self, delay, last=None):
+        """Começa um intervalo a partir de agora (ou do instante `last`)"""
+        if self.handle is not None:
+            self.handle.cancel()
+        self.last = self.timeline.now if last is None else last
+        self.ready = False
+        self.handle = self.timeline.at(self.last + delay, self._open)
+    
+    def _open(self):
+        self.ready = True
+        self.handle = None
+    
+    @property
+    def elapsed(self):
+        return self.timeline.now - self.last
\ No newline at end of file
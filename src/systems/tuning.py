@@ -0,0 +1,418 @@
+# src/systems/tuning.py
+import copy
+import json
+import os
+import selectors
+import socket
+import threading
+from src.config import Config
+from src.utils import bundle
+
+AUDIO_STATES = Config.AUDIO_STATES
+# Formas de rajada das balas inimigas (src/entities/bullets.py)
+VOLLEY_KINDS = ("radial", "spiral", "aimed")
+
+# Valores padrão; o arquivo de tuning sobrescreve apenas as chaves presentes
+DEFAULTS = {
+    "audio": {
+        "void_threshold": 0.02,
+        "intense_threshold": 0.10,
+    },
+    "score": {
+        "multiplier": {"void": 1.0, "ambient": 1.5, "intense": 2.0},
+    },
+    "enemies": {
+        "speed": {"void": 1, "ambient": 2, "intense": 3},
+        "points": {"basic": 10, "elite": 20, "boss": 50},
+        "spawn_delay": 1000,
+        "spawn_chance": {"void": 0.05, "ambient": 0.1, "intense": 0.2},
+        "types": {
+            "void": ["basic"],
+            "ambient": ["basic", "elite"],
+            "intense": ["basic", "elite", "boss"],
+        },
+        # Padrões de movimento sorteados por onda (src/entities/patterns.py)
+        "patterns": {
+            "void": ["sine"],
+            "ambient": ["sine", "zigzag", "orbit"],
+            "intense": ["sine", "zigzag", "dive", "v_wing", "swarm"],
+        },
+        "drop_chance": 0.1,
+        "drop_types": ["double_shot", "triple_shot", "shield", "speed"],
+    },
+    "powerups": {
+        "duration": {"double_shot": 10000, "triple_shot": 8000, "shield": 12000, "speed": 15000},
+        "spawn_chance": {"void": 0.05, "ambient": 0.1, "intense": 0.2},
+        "spawn_delay": {"void": 5000, "ambient": 5000, "intense": 2500},
+        "weights": {
+            "void": {"double_shot": 40, "triple_shot": 20, "shield": 20, "speed": 20},
+            "ambient": {"double_shot": 40, "triple_shot": 20, "shield": 20, "speed": 20},
+            "intense": {"double_shot": 40, "triple_shot": 40, "shield": 30, "speed": 20},
+        },
+    },
+    "bullets": {
+        # Rajadas: intervalo em ms de jogo, velocidade em px/frame, ângulos em radianos
+        "volleys": {
+            "radial": {"kind": "radial", "count": 16, "speed": 3.0, "interval": 1400,
+                       "sprite": "orb"},
+            "spiral": {"kind": "spiral", "count": 3, "speed": 3.5, "interval": 120,
+                       "spin": 0.3, "sprite": "spark"},
+            "aimed": {"kind": "aimed", "count": 3, "speed": 5.0, "interval": 1100,
+                      "spread": 0.35, "sprite": "needle"},
+        },
+        # Rajadas de cada tipo de inimigo (cada uma com o próprio ritmo)
+        "enemies": {"basic": [], "elite": ["aimed"], "boss": ["radial", "spiral"]},
+        # Multiplicadores pelo estado de áudio: disparos por segundo e balas por rajada
+        "rate": {"void": 0.5, "ambient": 1.0, "intense": 2.0},
+        "density": {"void": 0.5, "ambient": 1.0, "intense": 1.5},
+        "damage": 5,
+    },
+}
+
+def merge(base, override):
+    """Mescla dicts recursivamente (override vence)"""
+    result = copy.deepcopy(base)
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(result.get(key), dict):
+            result[key] = merge(result[key], value)
+        else:
+            result[key] = value
+    return result
+
+class Tuning:
+    """Tabelas compiladas a partir dos dados de tuning.
+    
+    Tudo que o código por frame consulta vira um dict plano indexado pelo
+    estado de áudio ou pelo tipo de entidade, sem cadeias de if/elif.
+    """
+    
+    def __init__(self, data):
+        self.data = data
+        audio = data["audio"]
+        enemies = data["enemies"]
+        powerups = data["powerups"]
+        bullets = data["bullets"]
+        
+        self.void_threshold = float(audio["void_threshold"])
+        self.intense_threshold = float(audio["intense_threshold"])
+        
+        self.score_multiplier = self._per_state(data["score"]["multiplier"], float)
+        
+        self.enemy_speed = self._per_state(enemies["speed"], float)
+        self.enemy_points = {kind: int(points) for kind, points in enemies["points"].items()}
+        self.enemy_spawn_delay = int(enemies["spawn_delay"])
+        self.enemy_spawn_chance = self._per_state(enemies["spawn_chance"], float)
+        self.enemy_types = self._per_state(enemies["types"], tuple)
+        self.enemy_patterns = self._per_state(enemies["patterns"], tuple)
+        self.drop_chance = float(enemies["drop_chance"])
+        self.drop_types = tuple(enemies["drop_types"])
+        
+        self.powerup_duration = {kind: int(ms) for kind, ms in powerups["duration"].items()}
+        self.powerup_spawn_chance = self._per_state(powerups["spawn_chance"], float)
+        self.powerup_spawn_delay = self._per_state(powerups["spawn_delay"], int)
+        
+        # Valores fora da faixa derrubariam o jogo no próximo spawn: o tuning
+        # inteiro é recusado e as tabelas em uso continuam
+        _check_chances("enemies.spawn_chance", self.enemy_spawn_chance)
+        _check_chances("enemies.drop_chance", {"": self.drop_chance})
+        _check_chances("powerups.spawn_chance", self.powerup_spawn_chance)
+        _check_delays("enemies.spawn_delay", {"": self.enemy_spawn_delay})
+        _check_delays("powerups.spawn_delay", self.powerup_spawn_delay)
+        
+        # Pesos pré-acumulados para random.choices(cum_weights=...)
+        self.powerup_types = {}
+        self.powerup_cum_weights = {}
+        for state in AUDIO_STATES:
+            weights = powerups["weights"][state]
+            total = 0
+            cumulative = []
+            for kind, weight in weights.items():
+                if weight < 0:
+                    raise ValueError(f"powerups.weights.{state}.{kind}: weight must not be negative")
+                total += weight
+                cumulative.append(total)
+            if total <= 0:
+                raise ValueError(f"powerups.weights.{state}: weights must add up to more than zero")
+            self.powerup_types[state] = tuple(weights.keys())
+            self.powerup_cum_weights[state] = tuple(cumulative)
+        
+        self.volleys = {name: dict(volley) for name, volley in bullets["volleys"].items()}
+        for name, volley in self.volleys.items():
+            if volley.get("kind") not in VOLLEY_KINDS:
+                raise ValueError(f"Volley '{name}': unknown kind {volley.get('kind')!r}")
+        self.enemy_volleys = {kind: tuple(names) for kind, names in bullets["enemies"].items()}
+        unknown = [name for names in self.enemy_volleys.values() for name in names
+                   if name not in self.volleys]
+        if unknown:
+            raise ValueError(f"Unknown volleys in tuning: {unknown}")
+        self.bullet_rate = self._per_state(bullets["rate"], float)
+        self.bullet_density = self._per_state(bullets["density"], float)
+        self.bullet_damage = int(bullets["damage"])
+    
+    def _per_state(self, table, cast):
+        missing = [state for state in AUDIO_STATES if state not in table]
+        if missing:
+            raise ValueError(f"Missing audio states in tuning table: {missing}")
+        return {state: cast(table[state]) for state in AUDIO_STATES}
+    
+    def apply_to_config(self):
+        Config.VOID_THRESHOLD = self.void_threshold
+        Config.INTENSE_THRESHOLD = self.intense_threshold
+
+def _check_chances(path, table):
+    """ValueError se alguma chance de `table` sair de [0, 1]"""
+    for key, chance in table.items():
+        if not 0.0 <= chance <= 1.0:
+            raise ValueError(f"{'.'.join(filter(None, (path, key)))}: chance must be between 0 and 1")
+
+def _check_delays(path, table):
+    """ValueError se algum intervalo (ms) de `table` não for positivo"""
+    for key, delay in table.items():
+        if delay <= 0:
+            raise ValueError(f"{'.'.join(filter(None, (path, key)))}: delay must be positive")
+
+def load(path, from_disk=False):
+    """Lê e compila o arquivo de tuning (ValueError se inválido).
+    
+    Com um bundle aberto, a cópia dele tem prioridade sobre o arquivo
+    solto; from_disk=True lê sempre o arquivo (recarga ao vivo do watcher).
+    """
+    data = DEFAULTS
+    if from_disk:
+        if path and os.path.exists(path):
+            with open(path, 'r') as f:
+                data = merge(DEFAULTS, json.load(f))
+    elif path and bundle.exists(path):
+        data = merge(DEFAULTS, bundle.load_json(path))
+    return Tuning(data)
+
+def apply_diff(data, diff):
+    """Cópia de `data` com os caminhos de `diff` ("enemies.speed.void": valor)
+    trocados; só os dicts no caminho de cada chave são copiados"""
+    result = dict(data)
+    for path, value in diff.items():
+        keys = path.split('.')
+        node = result
+        for key in keys[:-1]:
+            node[key] = dict(node[key])
+            node = node[key]
+        node[keys[-1]] = value
+    return result
+
+def check_diff(data, diff):
+    """Valida caminhos e tipos de um diff contra os dados atuais (ValueError)"""
+    for path, value in diff.items():
+        node = data
+        keys = path.split('.')
+        for key in keys[:-1]:
+            node = node.get(key) if isinstance(node, dict) else None
+            if not isinstance(node, dict):
+                raise ValueError(f"Unknown tuning key: {path}")
+        if keys[-1] not in node:
+            raise ValueError(f"Unknown tuning key: {path}")
+        old = node[keys[-1]]
+        numbers = (int, float)
+        same_kind = (isinstance(old, numbers) and isinstance(value, numbers)
+                     and not isinstance(value, bool)) or type(old) is type(value)
+        if not same_kind:
+            raise ValueError(f"Wrong type for {path}: expected {type(old).__name__}")
+
+# Tabelas em uso; trocadas por referência, de uma vez, no início de um frame
+current = Tuning(DEFAULTS)
+_pending = None
+# Alterações recebidas do editor desde o último frame (caminho -> valor)
+_pending_diff = {}
+_diff_lock = threading.Lock()
+
+def init(path=None):
+    """Carrega o tuning na inicialização (padrões se o arquivo falhar)"""
+    global current
+    try:
+        current = load(path or Config.TUNING_FILE)
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        print(f"Error loading tuning: {e}")
+        current = Tuning(DEFAULTS)
+    current.apply_to_config()
+    return current
+
+def apply_pending():
+    """Aplica um reload concluído em segundo plano; chamar no início do frame"""
+    global current, _pending, _pending_diff
+    pending = _pending
+    if pending is not None:
+        _pending = None
+        current = pending
+    
+    # Diffs do editor: um lote por frame, já com uma chave arrastada várias
+    # vezes reduzida ao último valor
+    diff = None
+    if _pending_diff:
+        # Compilado sob o lock: push() valida contra as tabelas já trocadas
+        with _diff_lock:
+            diff, _pending_diff = _pending_diff, {}
+            try:
+                current = Tuning(apply_diff(current.data, diff))
+            except (ValueError, KeyError, TypeError) as e:
+                # Só com um reload do arquivo no meio (push() já validou o lote)
+                print(f"Error applying tuning changes: {e}")
+                diff = None
+    
+    if pending is None and diff is None:
+        return False
+    current.apply_to_config()
+    return True
+
+def stage(tuning):
+    """Agenda novas tabelas para o próximo apply_pending()"""
+    global _pending
+    _pending = tuning
+
+def push(diff):
+    """Agenda alterações pontuais (caminho -> valor) para o próximo apply_pending().
+    
+    As tabelas resultantes (com o que já está agendado) são compiladas
+    aqui: um diff inválido levanta ValueError e nada dele é agendado.
+    """
+    check_diff(current.data, diff)
+    with _diff_lock:
+        try:
+            Tuning(apply_diff(current.data, {**_pending_diff, **diff}))
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"Invalid tuning change: {e}") from e
+        _pending_diff.update(diff)
+
+class TuningWatcher:
+    """Observa o arquivo de tuning e recompila em segundo plano quando muda.
+    
+    A leitura e a compilação acontecem na thread do watcher; o jogo só troca
+    a referência em apply_pending(), então um reload não causa engasgo. O
+    arquivo observado é lido do disco mesmo com um bundle aberto (a cópia
+    do bundle ficaria sempre igual).
+    """
+    
+    def __init__(self, path=None, interval=0.5):
+        self.path = path or Config.TUNING_FILE
+        self.interval = interval
+        self.mtime = self._mtime()
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+    
+    def _mtime(self):
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except OSError:
+            return None
+    
+    def _run(self):
+        while not self._stop_event.wait(self.interval):
+            mtime = self._mtime()
+            if mtime is None or mtime == self.mtime:
+                continue
+            self.mtime = mtime
+            try:
+                stage(load(self.path, from_disk=True))
+                print(f"Tuning reloaded from {self.path}")
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                # Arquivo inválido (ou salvo pela metade): mantém as tabelas atuais
+                print(f"Error reloading tuning: {e}")
+    
+    def stop(self, timeout=1.0):
+        self._stop_event.set()
+        self._thread.join(timeout)
+
+class TuningServer:
+    """Recebe alterações de tuning do editor por uma conexão local.
+    
+    Protocolo: uma mensagem JSON por linha, {"seq": n, "set": {"caminho":
+    valor}}; a resposta é {"seq": n, "ok": true} ou {"seq": n, "error": ...}.
+    Escuta só no loopback. As alterações válidas vão para push() e entram
+    no jogo no próximo frame, sem recarregar o arquivo nem reiniciar.
+    """
+    
+    def __init__(self, port=None, host="127.0.0.1"):
+        self.port = Config.TUNING_PORT if port is None else port
+        self.selector = selectors.DefaultSelector()
+        self.listener = socket.create_server((host, self.port))
+        self.listener.setblocking(False)
+        self.selector.register(self.listener, selectors.EVENT_READ)
+        self.buffers = {}
+        self.received = 0
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+    
+    def _run(self):
+        while not self._stop_event.is_set():
+            for key, _ in self.selector.select(timeout=0.2):
+                if key.fileobj is self.listener:
+                    self._accept()
+                else:
+                    self._read(key.fileobj)
+        for conn in list(self.buffers):
+            self._close(conn)
+        self.selector.close()
+        self.listener.close()
+    
+    def _accept(self):
+        try:
+            conn, _ = self.listener.accept()
+        except OSError:
+            return
+        conn.setblocking(False)
+        self.buffers[conn] = b""
+        self.selector.register(conn, selectors.EVENT_READ)
+    
+    def _close(self, conn):
+        self.selector.unregister(conn)
+        del self.buffers[conn]
+        conn.close()
+    
+    def _read(self, conn):
+        try:
+            data = conn.recv(65536)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            data = b""
+        if not data:
+            self._close(conn)
+            return
+        lines = (self.buffers[conn] + data).split(b"\n")
+        self.buffers[conn] = lines.pop()
+        for line in lines:
+            if line.strip():
+                self._reply(conn, self._handle(line))
+    
+    def _handle(self, line):
+        seq = None
+        try:
+            message = json.loads(line)
+            seq = message.get("seq")
+            diff = message["set"]
+            if not isinstance(diff, dict):
+                raise ValueError("'set' must be an object")
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            return {"seq": seq, "error": str(e)}
+        # Chaves inválidas (caminho, tipo ou valor) são recusadas uma a uma;
+        # as demais do lote entram
+        errors = []
+        for path, value in diff.items():
+            try:
+                push({path: value})
+                self.received += 1
+            except ValueError as e:
+                errors.append(str(e))
+        if errors:
+            return {"seq": seq, "error": "; ".join(errors)}
+        return {"seq": seq, "ok": True}
+    
+    def _reply(self, conn, reply):
+        try:
+            conn.sendall(json.dumps(reply).encode() + b"\n")
+        except OSError:
+            pass
+    
+    def stop(self, timeout=1.0):
+        self._stop_event.set()
+        self._thread.join(timeout)
\ No newline at end of file
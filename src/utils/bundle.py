@@ -0,0 +1,156 @@
+# src/utils/bundle.py
+import io
+import json
+import mmap
+import os
+import struct
+import zlib
+from src.states.persistence import atomic_write
+
+# Bundle do projeto: um único arquivo com todos os dados do jogo (tuning,
+# presets, padrões, atlas, sons) e um índice no fim.
+#
+#   cabeçalho | entradas (alinhadas a 16 bytes) | índice
+#
+# O jogo abre o arquivo com mmap e lê só o índice; cada entrada é lida (e
+# descompactada, se for o caso) quando alguém pede por ela. As entradas são
+# nomeadas pelo caminho relativo usado no Config ("config/tuning.json").
+# O editor usa este mesmo módulo para exportar o bundle.
+MAGIC = b'SSBN'
+VERSION = 1
+ALIGN = 16
+
+# magic, versão, flags, nº de entradas, offset e tamanho do índice
+HEADER = struct.Struct('<4sHHIQQ')
+# tamanho do nome, compressão, offset, tamanho gravado, tamanho original, crc32
+ENTRY = struct.Struct('<HBxQQQI')
+
+STORED = 0
+ZLIB = 1
+
+class BundleError(ValueError):
+    pass
+
+def entry_name(path):
+    """Nome da entrada para um caminho (separador '/', sem './')"""
+    return os.path.normpath(path).replace(os.sep, '/')
+
+def write(path, entries, level=9):
+    """Grava o bundle com as entradas (nome, bytes) de forma atômica.
+    
+    Cada entrada é compactada com zlib só se ficar menor que 90% do
+    original (PNG e afins vão como estão). Retorna [(nome, tamanho,
+    tamanho gravado)].
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    # Montado em memória e gravado de uma vez (o cabeçalho aponta para o índice)
+    f = io.BytesIO()
+    f.write(b'\0' * HEADER.size)
+    index = []
+    summary = []
+    for name, data in entries:
+        name = entry_name(name)
+        packed = zlib.compress(data, level)
+        compression = ZLIB if len(packed) < len(data) * 0.9 else STORED
+        stored = packed if compression == ZLIB else data
+        f.write(b'\0' * (-f.tell() % ALIGN))
+        encoded = name.encode('utf-8')
+        index.append(ENTRY.pack(len(encoded), compression, f.tell(), len(stored),
+                                len(data), zlib.crc32(data)) + encoded)
+        f.write(stored)
+        summary.append((name, len(data), len(stored)))
+    
+    toc = b''.join(index)
+    toc_offset = f.tell()
+    f.write(toc)
+    f.seek(0)
+    f.write(HEADER.pack(MAGIC, VERSION, 0, len(index), toc_offset, len(toc)))
+    atomic_write(path, f.getvalue())
+    return summary
+
+class Bundle:
+    """Bundle aberto com mmap: índice na abertura, entradas sob demanda"""
+    
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, 'rb')
+        try:
+            self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.entries = self._read_index()
+        except (OSError, ValueError, struct.error) as e:
+            self.file.close()
+            raise BundleError(f"Invalid bundle {path}: {e}")
+        self.reads = 0
+    
+    def _read_index(self):
+        magic, version, _, count, toc_offset, toc_size = HEADER.unpack_from(self.map, 0)
+        if magic != MAGIC or version != VERSION:
+            raise BundleError(f"unsupported format (magic={magic!r}, version={version})")
+        entries = {}
+        pos = toc_offset
+        for _ in range(count):
+            name_size, compression, offset, stored, size, crc = ENTRY.unpack_from(self.map, pos)
+            pos += ENTRY.size
+            name = self.map[pos:pos + name_size].decode('utf-8')
+            pos += name_size
+            entries[name] = (compression, offset, stored, size, crc)
+        if pos != toc_offset + toc_size:
+            raise BundleError("index size mismatch")
+        return entries
+    
+    def __contains__(self, name):
+        return entry_name(name) in self.entries
+    
+    def names(self):
+        return list(self.entries)
+    
+    def read(self, name):
+        """Conteúdo de uma entrada (só as páginas dela são lidas do disco)"""
+        compression, offset, stored, size, crc = self.entries[entry_name(name)]
+        data = self.map[offset:offset + stored]
+        if compression == ZLIB:
+            data = zlib.decompress(data)
+        if len(data) != size or zlib.crc32(data) != crc:
+            raise BundleError(f"Corrupt bundle entry: {name}")
+        self.reads += 1
+        return data
+    
+    def close(self):
+        self.map.close()
+        self.file.close()
+
+# Bundle em uso (None: tudo vem dos arquivos soltos)
+current = None
+
+def init(path):
+    """Abre o bundle se existir; as entradas dele têm prioridade sobre os arquivos"""
+    global current
+    close()
+    if path and os.path.exists(path):
+        current = Bundle(path)
+    return current
+
+def close():
+    global current
+    if current is not None:
+        current.close()
+        current = None
+
+def exists(path):
+    return (current is not None and path in current) or os.path.exists(path)
+
+def read(path):
+    """Bytes de um arquivo do projeto: do bundle, ou do disco se não estiver nele"""
+    if current is not None and path in current:
+        return current.read(path)
+    with open(path, 'rb') as f:
+        return f.read()
+
+def stream(path):
+    """Arquivo em memória (para pygame.image.load, mixer.Sound, ...)"""
+    return io.BytesIO(read(path))
+
+def load_json(path, default=None):
+    if not path or not exists(path):
+        return default
+    return json.loads(read(path))
\ No newline at end of file
@@ -0,0 +1,106 @@
+# src/utils/frame_share.py
+import struct
+from multiprocessing import resource_tracker, shared_memory
+
+# Frames do jogo em memória compartilhada para o preview do editor.
+#
+# Layout: cabeçalho | controle | nº do frame | N slots de pixels RGBX.
+# O jogo desenha direto num slot (a surface do pygame é criada sobre o
+# buffer, sem cópia) e publica incrementando o nº do frame; o slot visível
+# é frame % N. O editor embrulha o mesmo buffer num QImage. Com 3 slots o
+# jogo precisaria desenhar dois frames inteiros durante um paint do editor
+# para sobrescrever o slot que está sendo lido.
+
+MAGIC = b'SFRM'
+VERSION = 1
+# magic, versão, nº de slots, largura, altura, bytes por linha
+HEADER = struct.Struct('<4sHHIII')
+# FPS pedido pelo editor (0 = pausado), pedido de parada
+CONTROL = struct.Struct('<II')
+CONTROL_OFFSET = 24
+FRAME = struct.Struct('<Q')
+FRAME_OFFSET = 32
+DATA_OFFSET = 64
+BYTES_PER_PIXEL = 4  # RGBX
+
+class SharedFrames:
+    def __init__(self, name=None, size=None, slots=3, create=False, fps=60):
+        if create:
+            width, height = size
+            pitch = width * BYTES_PER_PIXEL
+            total = DATA_OFFSET + slots * pitch * height
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=total)
+            HEADER.pack_into(self.shm.buf, 0, MAGIC, VERSION, slots, width, height, pitch)
+            CONTROL.pack_into(self.shm.buf, CONTROL_OFFSET, fps, 0)
+            FRAME.pack_into(self.shm.buf, FRAME_OFFSET, 0)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+            # Quem cria é o dono: sem isso o resource_tracker deste processo
+            # apagaria a memória ao sair, com o editor ainda usando
+            resource_tracker.unregister(self.shm._name, "shared_memory")
+            magic, version, slots, width, height, pitch = HEADER.unpack_from(self.shm.buf, 0)
+            if magic != MAGIC or version != VERSION:
+                self.shm.close()
+                raise ValueError(f"Not a frame buffer: {name}")
+        self.owner = create
+        self.slots = slots
+        self.size = (width, height)
+        self.pitch = pitch
+        self.slot_size = pitch * height
+    
+    @property
+    def name(self):
+        return self.shm.name
+    
+    def slot(self, index):
+        """memoryview dos pixels de um slot (manter a referência enquanto usar)"""
+        start = DATA_OFFSET + index * self.slot_size
+        return self.shm.buf[start:start + self.slot_size]
+    
+    # Lado do jogo
+    
+    @property
+    def frame(self):
+        return FRAME.unpack_from(self.shm.buf, FRAME_OFFSET)[0]
+    
+    def back_slot(self):
+        """Slot onde o próximo frame deve ser desenhado"""
+        return (self.frame + 1) % self.slots
+    
+    def publish(self):
+        """Torna o slot de back_slot() o visível"""
+        FRAME.pack_into(self.shm.buf, FRAME_OFFSET, self.frame + 1)
+    
+    @property
+    def requested_fps(self):
+        return CONTROL.unpack_from(self.shm.buf, CONTROL_OFFSET)[0]
+    
+    @property
+    def stop_requested(self):
+        return bool(CONTROL.unpack_from(self.shm.buf, CONTROL_OFFSET)[1])
+    
+    # Lado do editor
+    
+    def latest(self):
+        """(nº do frame, índice do slot visível)"""
+        frame = self.frame
+        return frame, frame % self.slots
+    
+    def request_fps(self, fps):
+        struct.pack_into('<I', self.shm.buf, CONTROL_OFFSET, int(fps))
+    
+    def request_stop(self):
+        struct.pack_into('<I', self.shm.buf, CONTROL_OFFSET + 4, 1)
+    
+    def close(self):
+        """Fecha o mapeamento (views de slot() e surfaces já devem ter sido soltas)"""
+        try:
+            self.shm.close()
+        except BufferError as e:
+            print(f"Error closing frame buffer: {e}")
+            return
+        if self.owner:
+            try:
+                self.shm.unlink()
+            except FileNotFoundError:
+                pass
\ No newline at end of file
@@ -0,0 +1,26 @@
+# src/utils/helpers.py
+import json
+import time
+
+class MetricsDump:
+    """Grava métricas periodicamente em JSON Lines (uma linha por intervalo)"""
+    
+    def __init__(self, path, interval=1.0):
+        self.path = path
+        self.interval = interval
+        self.last_write = 0
+        self.file = open(path, 'w')
+    
+    def update(self, collect):
+        """collect é chamado só quando é hora de gravar, para não pesar no frame"""
+        now = time.perf_counter()
+        if now - self.last_write < self.interval:
+            return
+        self.last_write = now
+        record = {'time': time.time()}
+        record.update(collect())
+        self.file.write(json.dumps(record) + '\n')
+        self.file.flush()
+    
+    def close(self):
+        self.file.close()
\ No newline at end of file
@@ -0,0 +1,54 @@
+# src/utils/registry.py
+import json
+import os
+
+# Tabelas de dados nomeados (presets de partículas, padrões de inimigos):
+# entradas embutidas no código, sobrescritas campo a campo pelo arquivo de
+# dados e compiladas uma vez na carga. O dict `entries` é sempre o mesmo
+# objeto, então quem guardou uma referência vê as trocas feitas pelo editor.
+
+class DataRegistry:
+    """Entradas nome -> objeto compilado, com os embutidos como base.
+    
+    `defaults` são as entradas embutidas (nome -> campos) e `base` os
+    campos comuns a todas; `compile_entry(name, fields)` monta o objeto e
+    levanta ValueError/KeyError/TypeError para dados inválidos.
+    """
+    
+    def __init__(self, defaults, compile_entry, base=None):
+        self.defaults = defaults
+        self.base = base or {}
+        self.compile_entry = compile_entry
+        self.entries = {}
+        self.install({})
+    
+    def merge(self, data):
+        """Campos completos de cada entrada (o editor mostra todos)"""
+        merged = {name: dict(fields) for name, fields in self.defaults.items()}
+        for name, fields in data.items():
+            merged[name] = {**merged.get(name, {}), **fields}
+        return {name: {**self.base, **fields} for name, fields in merged.items()}
+    
+    def compile(self, data):
+        return {name: self.compile_entry(name, fields) for name, fields in self.merge(data).items()}
+    
+    def read(self, path):
+        """Dados do arquivo (vazio se não existir); OSError/ValueError sobem"""
+        if not path or not os.path.exists(path):
+            return {}
+        with open(path, 'r') as f:
+            return json.load(f)
+    
+    def load(self, path):
+        """Carrega o arquivo; erros mantêm as entradas atuais"""
+        return self.install(self.read(path))
+    
+    def install(self, data):
+        """Troca as entradas em uso pelas de `data` (editor: a cada alteração)"""
+        compiled = self.compile(data)
+        self.entries.clear()
+        self.entries.update(compiled)
+        return self.entries
+    
+    def get(self, name, default=None):
+        return self.entries.get(name, default)
\ No newline at end of file
@@ -0,0 +1,45 @@
+# src/utils/startup.py
+import importlib
+import sys
+import time
+from contextlib import contextmanager
+
+class StartupProfiler:
+    """Mede importações e etapas de inicialização até o primeiro frame.
+    
+    t0 deve ser o instante mais cedo possível (topo do main.py), para que o
+    relatório mostre também o tempo até a janela aparecer e até o primeiro
+    frame de jogo.
+    """
+    
+    def __init__(self, t0=None):
+        self.t0 = t0 if t0 is not None else time.perf_counter()
+        self.entries = []  # (tipo, nome, início relativo, duração)
+        self.marks = {}
+    
+    @contextmanager
+    def phase(self, name, kind="init"):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            self.entries.append((kind, name, start - self.t0, end - start))
+    
+    def timed_import(self, module_name):
+        """Importa um módulo medindo o tempo (inclui dependências ainda não carregadas)"""
+        already_loaded = module_name in sys.modules
+        with self.phase(module_name + (" (cached)" if already_loaded else ""), kind="import"):
+            return importlib.import_module(module_name)
+    
+    def mark(self, name):
+        """Registra um marco (ex.: janela visível, primeiro frame)"""
+        self.marks[name] = time.perf_counter() - self.t0
+    
+    def report(self):
+        lines = ["Startup report", f"{'kind':<7} {'name':<40} {'start ms':>9} {'ms':>9}"]
+        for kind, name, start, duration in sorted(self.entries, key=lambda e: e[2]):
+            lines.append(f"{kind:<7} {name:<40} {start * 1000:9.1f} {duration * 1000:9.1f}")
+        for name, at in sorted(self.marks.items(), key=lambda m: m[1]):
+            lines.append(f"{'mark':<7} {name:<40} {at * 1000:9.1f}")
+        return "\n".join(lines)
\ No newline at end of file